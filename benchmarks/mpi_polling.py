@@ -0,0 +1,98 @@
+# Copyright (C) 2021-2023 Modin authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark of the polling strategies used in loops exchanging messages.
+
+The benchmark compares ``adaptive`` and ``fixed`` ``MpiPollingStrategy`` by
+
+* CPU time consumed by a process idly waiting for a message;
+* round-trip latency of back-to-back messages;
+* round-trip latency of messages sent after an idle gap.
+
+Run it with two MPI processes:
+
+.. code-block:: bash
+
+  mpiexec -n 2 python benchmarks/mpi_polling.py
+"""
+
+import time
+
+import unidist.config as cfg
+from unidist.core.backends.mpi.core import communication
+from mpi4py import MPI
+
+IDLE_TIME = 2.0  # seconds
+ROUND_TRIPS = 1000
+GAP_ROUND_TRIPS = 100
+GAP = 0.01  # seconds
+TAG = 0
+
+
+def recv(comm, source):
+    status = MPI.Status()
+    communication.AdaptivePoller.get_instance().wait(
+        lambda: comm.iprobe(source=source, tag=TAG, status=status)
+    )
+    return comm.recv(source=source, tag=TAG)
+
+
+def ping_pong(comm, round_trips, gap=0.0):
+    rank = comm.Get_rank()
+    latencies = []
+    for _ in range(round_trips):
+        if rank == 0:
+            time.sleep(gap)
+            start = time.perf_counter()
+            comm.send(None, dest=1, tag=TAG)
+            recv(comm, 1)
+            latencies.append(time.perf_counter() - start)
+        else:
+            recv(comm, 0)
+            comm.send(None, dest=0, tag=TAG)
+    return latencies
+
+
+def idle_cpu_usage(comm):
+    rank = comm.Get_rank()
+    comm.Barrier()
+    if rank == 0:
+        time.sleep(IDLE_TIME)
+        comm.send(None, dest=1, tag=TAG)
+        return None
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    recv(comm, 0)
+    return (time.process_time() - cpu_start) / (time.perf_counter() - wall_start)
+
+
+def run(comm, strategy):
+    cfg.MpiPollingStrategy.put(strategy)
+    # Make the poller pick up the config value
+    communication.AdaptivePoller._AdaptivePoller__instance = None
+
+    cpu_usage = idle_cpu_usage(comm)
+    cpu_usage = comm.bcast(cpu_usage, root=1)
+    comm.Barrier()
+    latencies = ping_pong(comm, ROUND_TRIPS)
+    comm.Barrier()
+    gap_latencies = ping_pong(comm, GAP_ROUND_TRIPS, gap=GAP)
+
+    if comm.Get_rank() == 0:
+        print(
+            f"{strategy:>8}: idle CPU usage {cpu_usage * 100:6.1f}%, "
+            + f"round trip {sum(latencies) / len(latencies) * 1e6:8.1f} us, "
+            + f"round trip after {GAP * 1e3:g} ms gap "
+            + f"{sum(gap_latencies) / len(gap_latencies) * 1e6:8.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    MPI.Init_thread()
+    comm = MPI.COMM_WORLD
+    if comm.Get_size() != 2:
+        raise RuntimeError("The benchmark should be run with two MPI processes")
+    for strategy in ("fixed", "adaptive"):
+        run(comm, strategy)
+    MPI.Finalize()
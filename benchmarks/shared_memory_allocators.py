@@ -0,0 +1,160 @@
+# Copyright (C) 2021-2023 Modin authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Stress benchmark of the allocators used to keep track of free shared memory.
+
+The benchmark replays put/cleanup traces against the first-fit ``FreeMemoryRange``
+and ``SegregatedFitAllocator`` and compares
+
+* the average time of an allocation and a release;
+* the number of failed allocations, i.e., puts that do not fit shared memory;
+* fragmentation of free memory, i.e., the part of free memory outside the largest free block.
+
+The traces model a pipeline of dataframe partitions released in the order they are put,
+and a mixed workload of small and large objects released in a random order
+with some of the objects kept alive for the whole run.
+
+Run it with:
+
+.. code-block:: bash
+
+  python benchmarks/shared_memory_allocators.py
+"""
+
+import random
+import time
+
+from unidist.core.backends.mpi.core.monitor.shared_memory_manager import (
+    FreeMemoryRange,
+    SegregatedFitAllocator,
+)
+
+MEMORY_SIZE = 1 << 30  # bytes
+PUT_COUNT = 20000
+SEED = 42
+
+
+def pipeline_trace(rng):
+    """
+    Generate a trace of partitions released in the order they are put.
+
+    Parameters
+    ----------
+    rng : random.Random
+        Random number generator.
+
+    Returns
+    -------
+    list
+        List of ``("put", object_id, size)`` and ``("cleanup", object_id)`` events.
+    """
+    trace = []
+    live = []
+    for object_id in range(PUT_COUNT):
+        size = int(rng.lognormvariate(14, 1.0))  # ~1 MB on average
+        trace.append(("put", object_id, size))
+        live.append(object_id)
+        # A pipeline stage keeps about a hundred of partitions alive
+        while len(live) > rng.randint(64, 128):
+            trace.append(("cleanup", live.pop(0)))
+    return trace
+
+
+def mixed_trace(rng):
+    """
+    Generate a trace of small and large objects released in a random order.
+
+    Parameters
+    ----------
+    rng : random.Random
+        Random number generator.
+
+    Returns
+    -------
+    list
+        List of ``("put", object_id, size)`` and ``("cleanup", object_id)`` events.
+    """
+    trace = []
+    live = []
+    for object_id in range(PUT_COUNT):
+        if rng.random() < 0.9:
+            size = rng.randint(100, 10 * 1024)  # metadata, small lists and dicts
+        else:
+            size = rng.randint(1 << 20, 16 << 20)  # arrays and dataframes
+        trace.append(("put", object_id, size))
+        # Every 100th object is kept alive for the whole run
+        if object_id % 100 != 0:
+            live.append(object_id)
+        while len(live) > 1024 or (live and rng.random() < 0.45):
+            trace.append(("cleanup", live.pop(rng.randrange(len(live)))))
+    return trace
+
+
+def replay(allocator_cls, trace):
+    """
+    Replay the trace against an allocator.
+
+    Parameters
+    ----------
+    allocator_cls : type
+        Allocator class.
+    trace : list
+        List of events.
+
+    Returns
+    -------
+    dict
+        Results of the replay.
+    """
+    allocator = allocator_cls(MEMORY_SIZE)
+    reservations = {}
+    occupy_time = release_time = 0.0
+    occupy_count = release_count = failed_count = 0
+    fragmentation = []
+    for event in trace:
+        if event[0] == "put":
+            _, object_id, size = event
+            start = time.perf_counter()
+            first_index, last_index = allocator.occupy(size)
+            occupy_time += time.perf_counter() - start
+            occupy_count += 1
+            if first_index is None:
+                failed_count += 1
+            else:
+                reservations[object_id] = (first_index, last_index)
+            if occupy_count % 100 == 0:
+                fragmentation.append(allocator.get_stats()["fragmentation"])
+        else:
+            reservation = reservations.pop(event[1], None)
+            if reservation is None:
+                continue
+            start = time.perf_counter()
+            allocator.release(*reservation)
+            release_time += time.perf_counter() - start
+            release_count += 1
+    stats = allocator.get_stats()
+    return {
+        "occupy": occupy_time / occupy_count,
+        "release": release_time / max(release_count, 1),
+        "failed": failed_count,
+        "fragmentation": sum(fragmentation) / len(fragmentation),
+        "free_blocks": stats["free_blocks"],
+    }
+
+
+if __name__ == "__main__":
+    rng = random.Random(SEED)
+    traces = {"pipeline": pipeline_trace(rng), "mixed": mixed_trace(rng)}
+    for trace_name, trace in traces.items():
+        for allocator_cls in (FreeMemoryRange, SegregatedFitAllocator):
+            result = replay(allocator_cls, trace)
+            print(
+                f"{trace_name:>8} {allocator_cls.__name__:>22}: "
+                + f"occupy {result['occupy'] * 1e6:7.2f} us, "
+                + f"release {result['release'] * 1e6:7.2f} us, "
+                + f"failed puts {result['failed']:5d}, "
+                + f"avg fragmentation {result['fragmentation'] * 100:5.1f}%, "
+                + f"free blocks at the end {result['free_blocks']:4d}"
+            )
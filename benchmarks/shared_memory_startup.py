@@ -0,0 +1,129 @@
+# Copyright (C) 2021-2023 Modin authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Startup benchmark of shared memory of the shared object store.
+
+For a given limit of shared memory the benchmark compares the time needed to get shared memory
+ready for the first put when
+
+* ``window`` - a window as large as the limit is allocated for data and the whole service buffer
+  is initialized, as the shared object store did before it was split into segments;
+* ``segments`` - only the service buffer is allocated and its header is initialized,
+  while the first segment of data is created on the first put.
+
+The limits can be larger than the memory of the host since untouched pages take no memory.
+The ``window`` variant fails if the MPI implementation cannot allocate such a window.
+
+Run it with two MPI processes (a monitor and a worker) for one of the variants:
+
+.. code-block:: bash
+
+  mpiexec -n 2 python benchmarks/shared_memory_startup.py segments
+  mpiexec -n 2 python benchmarks/shared_memory_startup.py window
+"""
+
+import mmap
+import os
+import sys
+import time
+
+from mpi4py import MPI
+
+from unidist.config import MpiSharedMemorySegmentSize, MpiSharedObjectStoreThreshold
+from unidist.core.backends.mpi.core._memory import fill
+from unidist.core.backends.mpi.core.shared_object_store import SharedObjectStore
+
+LIMITS = [64 * 1024**3, 512 * 1024**3]  # bytes
+MONITOR = 0
+
+
+def allocate_service_buffer(host_comm, limit):
+    # One service slot per the smallest data put into the shared object store
+    service_count = (
+        limit // MpiSharedObjectStoreThreshold.get() * SharedObjectStore.INFO_SIZE
+    )
+    win = MPI.Win.Allocate_shared(
+        service_count * MPI.LONG.size if host_comm.Get_rank() == MONITOR else 0,
+        MPI.LONG.size,
+        comm=host_comm,
+    )
+    memory, _ = win.Shared_query(MONITOR)
+    return win, memoryview(memory).cast("l")
+
+
+def window_startup(host_comm, limit):
+    host_comm.Barrier()
+    start = time.perf_counter()
+    data_win = MPI.Win.Allocate_shared(
+        limit if host_comm.Get_rank() == MONITOR else 0, 1, comm=host_comm
+    )
+    service_win, service_buffer = allocate_service_buffer(host_comm, limit)
+    if host_comm.Get_rank() == MONITOR:
+        fill(service_buffer, -1)
+    host_comm.Barrier()
+    elapsed = time.perf_counter() - start
+    service_buffer.release()
+    service_win.Free()
+    data_win.Free()
+    return elapsed
+
+
+def segments_startup(host_comm, limit):
+    host_comm.Barrier()
+    start = time.perf_counter()
+    service_win, service_buffer = allocate_service_buffer(host_comm, limit)
+    if host_comm.Get_rank() == MONITOR:
+        index = SharedObjectStore.INITIALIZED_COUNT_INDEX
+        service_buffer[index] = SharedObjectStore.INFO_SIZE
+    host_comm.Barrier()
+    elapsed = time.perf_counter() - start
+    service_buffer.release()
+    service_win.Free()
+    return elapsed
+
+
+def first_segment(host_comm):
+    host_comm.Barrier()
+    path = os.path.join(
+        "/dev/shm" if os.path.isdir("/dev/shm") else "/tmp",
+        f"unidist_startup_benchmark_{os.getpid()}",
+    )
+    start = time.perf_counter()
+    if host_comm.Get_rank() == MONITOR:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.ftruncate(fd, MpiSharedMemorySegmentSize.get())
+        segment = mmap.mmap(fd, MpiSharedMemorySegmentSize.get())
+        os.close(fd)
+        elapsed = time.perf_counter() - start
+        segment.close()
+        os.remove(path)
+    else:
+        elapsed = 0.0
+    return host_comm.bcast(elapsed, root=MONITOR)
+
+
+if __name__ == "__main__":
+    host_comm = MPI.COMM_WORLD.Split_type(MPI.COMM_TYPE_SHARED)
+    is_monitor = host_comm.Get_rank() == MONITOR
+    name = sys.argv[1] if len(sys.argv) > 1 else "segments"
+    startup = {"window": window_startup, "segments": segments_startup}[name]
+    for limit in LIMITS:
+        error = None
+        try:
+            result = f"{startup(host_comm, limit) * 1e3:9.1f} ms"
+        except MPI.Exception as ex:
+            error = ex
+            result = f"failed ({ex.Get_error_string()})"
+        if is_monitor:
+            print(f"{limit // 1024**3:4d} GiB limit, {name:>8}: {result}")
+        # A failed collective allocation leaves the processes out of sync
+        if error is not None:
+            break
+    elapsed = first_segment(host_comm) if name == "segments" else None
+    if elapsed is not None and is_monitor:
+        print(
+            f"First segment of {MpiSharedMemorySegmentSize.get() // 1024**2} MiB "
+            + f"created on the first put: {elapsed * 1e3:.1f} ms"
+        )
@@ -0,0 +1,125 @@
+# Copyright (C) 2021-2023 Modin authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Contention benchmark of reference counting in the service buffer of the shared object store.
+
+Every process on the host repeatedly references and releases shared data the way
+``SharedObjectStore`` does when a task reads its arguments. The benchmark compares
+
+* ``lock`` - an exclusive lock of the whole service window around every update;
+* ``atomic`` - compare-and-swap on the service slot of the data in a shared access epoch,
+
+for readers of the same data and for readers of distinct data. The result is the number
+of reference/release pairs per second summed over all processes. The final number of references
+is checked to be 0 so that lost updates are noticed.
+
+Run it with several MPI processes on one host:
+
+.. code-block:: bash
+
+  mpiexec -n 8 python benchmarks/shared_refcount_contention.py
+"""
+
+import time
+from array import array
+
+from mpi4py import MPI
+
+from unidist.core.backends.mpi.core.shared_object_store import SharedObjectStore
+
+DURATION = 2.0  # seconds
+MONITOR = 0
+
+
+def lock_update(win, buffer, disp, delta):
+    win.Lock(MONITOR)
+    buffer[disp] += delta
+    win.Unlock(MONITOR)
+
+
+def atomic_update(win, buffer, disp, delta):
+    result = array("l", [0])
+    if delta < 0:
+        # A reference is released with a single fetch-and-add
+        win.Fetch_and_op(array("l", [delta]), result, MONITOR, disp, MPI.SUM)
+        win.Flush(MONITOR)
+        return
+    # A reference is taken with compare-and-swap not to reference retired data,
+    # the expected value is read directly from shared memory
+    prev = buffer[disp]
+    while True:
+        win.Compare_and_swap(
+            array("l", [prev + delta]), array("l", [prev]), result, MONITOR, disp
+        )
+        win.Flush(MONITOR)
+        if result[0] == prev:
+            return
+        prev = result[0]
+
+
+def run(host_comm, win, buffer, update, same_data):
+    rank = host_comm.Get_rank()
+    slot = 0 if same_data else rank
+    disp = slot * SharedObjectStore.INFO_SIZE + SharedObjectStore.REFERENCES_NUMBER
+    host_comm.Barrier()
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        update(win, buffer, disp, 1)
+        update(win, buffer, disp, -1)
+        count += 1
+    host_comm.Barrier()
+    total = host_comm.allreduce(count / DURATION)
+    win.Sync()
+    host_comm.Barrier()
+    is_consistent = all(
+        buffer[i * SharedObjectStore.INFO_SIZE + SharedObjectStore.REFERENCES_NUMBER]
+        == 0
+        for i in range(host_comm.Get_size())
+    )
+    return total, is_consistent
+
+
+if __name__ == "__main__":
+    host_comm = MPI.COMM_WORLD.Split_type(MPI.COMM_TYPE_SHARED)
+    size = host_comm.Get_size()
+    win = MPI.Win.Allocate_shared(
+        size * SharedObjectStore.INFO_SIZE * MPI.LONG.size
+        if host_comm.Get_rank() == MONITOR
+        else 0,
+        MPI.LONG.size,
+        comm=host_comm,
+    )
+    memory, _ = win.Shared_query(MONITOR)
+    buffer = memoryview(memory).cast("l")
+    if host_comm.Get_rank() == MONITOR:
+        for i in range(len(buffer)):
+            buffer[i] = 0
+    host_comm.Barrier()
+
+    results = []
+    for same_data in (True, False):
+        results.append(
+            (same_data, "lock", *run(host_comm, win, buffer, lock_update, same_data))
+        )
+        win.Lock_all(MPI.MODE_NOCHECK)
+        results.append(
+            (
+                same_data,
+                "atomic",
+                *run(host_comm, win, buffer, atomic_update, same_data),
+            )
+        )
+        win.Unlock_all()
+
+    if host_comm.Get_rank() == MONITOR:
+        for same_data, name, total, is_consistent in results:
+            readers = "same data" if same_data else "distinct data"
+            print(
+                f"{size} readers of {readers:>13}, {name:>6}: "
+                + f"{total:12.0f} references/s, "
+                + f"consistent: {is_consistent}"
+            )
+    win.Free()
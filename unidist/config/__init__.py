@@ -18,11 +18,28 @@ from .backends.mpi import (
     MpiHosts,
     MpiPickleThreshold,
     MpiBackoff,
+    MpiBackoffMax,
+    MpiPollingStrategy,
     MpiLog,
     MpiSharedObjectStore,
     MpiSharedObjectStoreMemory,
     MpiSharedServiceMemory,
     MpiSharedObjectStoreThreshold,
+    MpiSharedObjectStoreDedup,
+    MpiSharedMemorySegmentSize,
+    MpiCompactionThreshold,
+    MpiSharedMemoryLeaseSize,
+    MpiSharedDataChunkSize,
+    MpiLocalObjectStoreMemory,
+    MpiSpillDirectory,
+    MpiSpillLimit,
+    MpiSchedulingPolicy,
+    MpiWorkStealing,
+    MpiThreadedExecution,
+    MpiTaskSlots,
+    MpiMessageCoalescing,
+    MpiMessageCoalescingSize,
+    MpiMessageCoalescingInterval,
     MpiRuntimeEnv,
 )
 from .parameter import ValueSource
@@ -43,10 +60,27 @@ __all__ = [
     "ValueSource",
     "MpiPickleThreshold",
     "MpiBackoff",
+    "MpiBackoffMax",
+    "MpiPollingStrategy",
     "MpiLog",
     "MpiSharedObjectStore",
     "MpiSharedObjectStoreMemory",
     "MpiSharedServiceMemory",
     "MpiSharedObjectStoreThreshold",
+    "MpiSharedObjectStoreDedup",
+    "MpiSharedMemorySegmentSize",
+    "MpiCompactionThreshold",
+    "MpiSharedMemoryLeaseSize",
+    "MpiSharedDataChunkSize",
+    "MpiLocalObjectStoreMemory",
+    "MpiSpillDirectory",
+    "MpiSpillLimit",
+    "MpiSchedulingPolicy",
+    "MpiWorkStealing",
+    "MpiThreadedExecution",
+    "MpiTaskSlots",
+    "MpiMessageCoalescing",
+    "MpiMessageCoalescingSize",
+    "MpiMessageCoalescingInterval",
     "MpiRuntimeEnv",
 ]
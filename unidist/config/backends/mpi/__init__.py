@@ -9,11 +9,28 @@ from .envvars import (
     MpiHosts,
     MpiPickleThreshold,
     MpiBackoff,
+    MpiBackoffMax,
+    MpiPollingStrategy,
     MpiLog,
     MpiSharedObjectStore,
     MpiSharedObjectStoreMemory,
     MpiSharedServiceMemory,
     MpiSharedObjectStoreThreshold,
+    MpiSharedObjectStoreDedup,
+    MpiSharedMemorySegmentSize,
+    MpiCompactionThreshold,
+    MpiSharedMemoryLeaseSize,
+    MpiSharedDataChunkSize,
+    MpiLocalObjectStoreMemory,
+    MpiSpillDirectory,
+    MpiSpillLimit,
+    MpiSchedulingPolicy,
+    MpiWorkStealing,
+    MpiThreadedExecution,
+    MpiTaskSlots,
+    MpiMessageCoalescing,
+    MpiMessageCoalescingSize,
+    MpiMessageCoalescingInterval,
     MpiRuntimeEnv,
 )
 
@@ -22,10 +39,27 @@ __all__ = [
     "MpiHosts",
     "MpiPickleThreshold",
     "MpiBackoff",
+    "MpiBackoffMax",
+    "MpiPollingStrategy",
     "MpiLog",
     "MpiSharedObjectStore",
     "MpiSharedObjectStoreMemory",
     "MpiSharedServiceMemory",
     "MpiSharedObjectStoreThreshold",
+    "MpiSharedObjectStoreDedup",
+    "MpiSharedMemorySegmentSize",
+    "MpiCompactionThreshold",
+    "MpiSharedMemoryLeaseSize",
+    "MpiSharedDataChunkSize",
+    "MpiLocalObjectStoreMemory",
+    "MpiSpillDirectory",
+    "MpiSpillLimit",
+    "MpiSchedulingPolicy",
+    "MpiWorkStealing",
+    "MpiThreadedExecution",
+    "MpiTaskSlots",
+    "MpiMessageCoalescing",
+    "MpiMessageCoalescingSize",
+    "MpiMessageCoalescingInterval",
     "MpiRuntimeEnv",
 ]
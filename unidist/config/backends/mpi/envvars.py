@@ -77,6 +77,29 @@ class MpiBackoff(EnvironmentVariable, type=float):
     varname = "UNIDIST_MPI_BACKOFF"
 
 
+class MpiBackoffMax(EnvironmentVariable, type=float):
+    """Maximum backoff time the adaptive polling strategy backs off exponentially up to."""
+
+    default = 0.0005
+    varname = "UNIDIST_MPI_BACKOFF_MAX"
+
+
+class MpiPollingStrategy(EnvironmentVariable, type=str):
+    """
+    Strategy to wait for a message in loops exchanging messages.
+
+    Notes
+    -----
+    * ``adaptive`` spins briefly, then yields the processor, then sleeps starting from ``MpiBackoff``
+      and doubling the time up to ``MpiBackoffMax``. The strategy is reset once a message arrives.
+    * ``fixed`` sleeps for ``MpiBackoff`` between the checks.
+    """
+
+    default = "adaptive"
+    varname = "UNIDIST_MPI_POLLING_STRATEGY"
+    choices = ("adaptive", "fixed")
+
+
 class MpiLog(EnvironmentVariable, type=bool):
     """Whether to enable logging for MPI backend or not."""
 
@@ -92,7 +115,7 @@ class MpiSharedObjectStore(EnvironmentVariable, type=bool):
 
 
 class MpiSharedObjectStoreMemory(EnvironmentVariable, type=int):
-    """How many bytes of memory to start the shared object store with."""
+    """How many bytes of memory the shared object store can grow to."""
 
     varname = "UNIDIST_MPI_SHARED_OBJECT_STORE_MEMORY"
 
@@ -110,6 +133,182 @@ class MpiSharedObjectStoreThreshold(EnvironmentVariable, type=int):
     varname = "UNIDIST_MPI_SHARED_OBJECT_STORE_THRESHOLD"
 
 
+class MpiSharedObjectStoreDedup(EnvironmentVariable, type=bool):
+    """
+    Whether to deduplicate identical data put into the shared object store or not.
+
+    Notes
+    -----
+    Data with the same content on a host shares a single region of shared memory.
+    Deduplication requires a reservation request to the monitor for every put,
+    so shared memory is not leased to processes if it is enabled.
+    """
+
+    default = False
+    varname = "UNIDIST_MPI_SHARED_OBJECT_STORE_DEDUP"
+
+
+class MpiSharedMemorySegmentSize(EnvironmentVariable, type=int):
+    """
+    How many bytes of shared memory the first segment of the shared object store has.
+
+    Notes
+    -----
+    The shared object store starts with no segments and maps a new segment
+    as large as all of the previous ones when data does not fit into them.
+    If the value is 0, the shared object store is mapped as a single segment.
+    """
+
+    default = 1024**3  # 1 GiB
+    varname = "UNIDIST_MPI_SHARED_MEMORY_SEGMENT_SIZE"
+
+
+class MpiCompactionThreshold(EnvironmentVariable, type=float):
+    """
+    Fragmentation of free shared memory to compact data in shared memory at.
+
+    Notes
+    -----
+    Fragmentation is the part of free memory outside the largest free block.
+    Data is compacted when a reservation does not fit into any free block
+    while there is enough free memory in total. Compaction is disabled if the value is 1.
+    """
+
+    default = 0.5
+    varname = "UNIDIST_MPI_COMPACTION_THRESHOLD"
+
+
+class MpiSharedMemoryLeaseSize(EnvironmentVariable, type=int):
+    """
+    How many bytes of shared memory the monitor leases to a process at once.
+
+    Notes
+    -----
+    A process places data into the leased slab without asking the monitor.
+    Leasing is disabled if the value is 0.
+    """
+
+    default = 1024**2 * 16  # 16 MiB
+    varname = "UNIDIST_MPI_SHARED_MEMORY_LEASE_SIZE"
+
+
+class MpiSharedDataChunkSize(EnvironmentVariable, type=int):
+    """
+    How many bytes of shared data to transfer between hosts in a single message.
+
+    Notes
+    -----
+    Several chunks of data are requested at once and received directly into shared memory.
+    If the value is 0, the data is transferred in a single message.
+    """
+
+    default = 1024**2 * 64  # 64 MiB
+    varname = "UNIDIST_MPI_SHARED_DATA_CHUNK_SIZE"
+
+
+class MpiLocalObjectStoreMemory(EnvironmentVariable, type=int):
+    """
+    How many bytes of memory data in the local object store of a process can take.
+
+    Notes
+    -----
+    Least recently used data is spilled to disk once the budget is exceeded.
+    The budget is not limited if the value is not set.
+    """
+
+    varname = "UNIDIST_MPI_LOCAL_OBJECT_STORE_MEMORY"
+
+
+class MpiSpillDirectory(EnvironmentVariable, type=ExactStr):
+    """
+    Directory to spill data from the shared and local object stores to.
+
+    Notes
+    -----
+    The directory for temporary files of the system is used if the value is not set.
+    """
+
+    varname = "UNIDIST_MPI_SPILL_DIRECTORY"
+
+
+class MpiSpillLimit(EnvironmentVariable, type=int):
+    """
+    Maximum number of bytes of data to spill to disk on each host.
+
+    Notes
+    -----
+    Spilling is disabled if the value is 0 and is not limited if the value is not set.
+    """
+
+    varname = "UNIDIST_MPI_SPILL_LIMIT"
+
+
+class MpiSchedulingPolicy(EnvironmentVariable, type=str):
+    """
+    Policy to choose a worker process for task execution.
+
+    Notes
+    -----
+    * ``locality`` places a task on the worker that holds most of the task input data.
+    * ``load`` places a task on the least loaded worker based on the queue depth
+      and task durations reported by workers.
+    * ``round_robin`` places tasks on workers in a loop.
+    """
+
+    default = "locality"
+    varname = "UNIDIST_MPI_SCHEDULING_POLICY"
+    choices = ("locality", "load", "round_robin")
+
+
+class MpiWorkStealing(EnvironmentVariable, type=bool):
+    """Whether to enable work stealing between worker processes or not."""
+
+    default = False
+    varname = "UNIDIST_MPI_WORK_STEALING"
+
+
+class MpiThreadedExecution(EnvironmentVariable, type=bool):
+    """Whether to run synchronous tasks on an executor thread or not."""
+
+    default = False
+    varname = "UNIDIST_MPI_THREADED_EXECUTION"
+
+
+class MpiTaskSlots(EnvironmentVariable, type=int):
+    """
+    How many tasks a worker process can run at the same time.
+
+    Notes
+    -----
+    If the value is greater than 1, synchronous tasks are run on a pool of executor threads
+    regardless of ``MpiThreadedExecution``. Actor methods are still run one at a time.
+    """
+
+    default = 1
+    varname = "UNIDIST_MPI_TASK_SLOTS"
+
+
+class MpiMessageCoalescing(EnvironmentVariable, type=bool):
+    """Whether to coalesce small messages sent to the same process or not."""
+
+    default = True
+    varname = "UNIDIST_MPI_MESSAGE_COALESCING"
+
+
+class MpiMessageCoalescingSize(EnvironmentVariable, type=int):
+    """Maximum size of messages buffered for a process before they are sent."""
+
+    default = 1024 * 64  # 64 KiB
+    varname = "UNIDIST_MPI_MESSAGE_COALESCING_SIZE"
+
+
+class MpiMessageCoalescingInterval(EnvironmentVariable, type=float):
+    """Maximum time in seconds a message is buffered for before it is sent."""
+
+    default = 0.001
+    varname = "UNIDIST_MPI_MESSAGE_COALESCING_INTERVAL"
+
+
 class MpiRuntimeEnv:
     """
     Runtime environment for MPI worker processes.
@@ -16,6 +16,8 @@ class DataID:
         Any comparable and hashable ID value.
     """
 
+    __slots__ = ("_id", "__weakref__")
+
     def __init__(self, id_value=None):
         self._id = id_value if id_value is not None else uuid.uuid4().hex
 
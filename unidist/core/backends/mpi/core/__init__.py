@@ -6,6 +6,7 @@ from unidist.core.backends.mpi.core.controller import (
     put,
     get,
     submit,
+    submit_many,
     wait,
     init,
     is_initialized,
@@ -18,6 +19,7 @@ __all__ = [
     "put",
     "get",
     "submit",
+    "submit_many",
     "wait",
     "init",
     "is_initialized",
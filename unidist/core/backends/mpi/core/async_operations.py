@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import unidist.core.backends.mpi.core.common as common
+import unidist.core.backends.mpi.core.communication as communication
 
 logger = common.get_logger("async_operations", "async_operations.log")
 
@@ -19,6 +20,8 @@ class AsyncOperations:
     def __init__(self):
         # I-prefixed mpi call handlers
         self._send_async_handlers = []
+        # Callbacks to run once all the handlers of a group are complete [(handlers, callback)]
+        self._completion_callbacks = []
 
     @classmethod
     def get_instance(cls):
@@ -33,7 +36,7 @@ class AsyncOperations:
             cls.__instance = AsyncOperations()
         return cls.__instance
 
-    def extend(self, handlers_list):
+    def extend(self, handlers_list, on_complete=None):
         """
         Extend internal list with `handler_list`.
 
@@ -41,8 +44,14 @@ class AsyncOperations:
         ----------
         handler_list : list
             A list of pairs with handler and data reference.
+        on_complete : callable, optional
+            A callback to run once all the handlers from `handler_list` are complete.
         """
         self._send_async_handlers.extend(handlers_list)
+        if on_complete is not None:
+            self._completion_callbacks.append(
+                ([handler for handler, _ in handlers_list], on_complete)
+            )
 
     def check(self):
         """Check all MPI async send requests readiness and remove a reference to sending data."""
@@ -60,9 +69,30 @@ class AsyncOperations:
             tup for tup in self._send_async_handlers if not is_ready(tup[0])
         ]
 
+        if self._completion_callbacks:
+            # The handlers are kept alive by the callback groups so their ids are not reused
+            pending = {id(tup[0]) for tup in self._send_async_handlers}
+            completed = []
+            remaining = []
+            for group in self._completion_callbacks:
+                if any(id(handler) in pending for handler in group[0]):
+                    remaining.append(group)
+                else:
+                    completed.append(group)
+            self._completion_callbacks[:] = remaining
+            for _, callback in completed:
+                callback()
+
     def finish(self):
         """Finish all MPI async send requests."""
+        # Send and wait for the coalesced messages as well
+        coalescer = communication.MessageCoalescer.get_instance()
+        coalescer.flush(communication.MPIState.get_instance().global_comm)
+        coalescer.wait()
         for handler, _ in self._send_async_handlers:
             logger.debug("WAIT ASYNC HANDLER {}".format(handler))
             handler.Wait()
         self._send_async_handlers.clear()
+        for _, callback in self._completion_callbacks:
+            callback()
+        self._completion_callbacks.clear()
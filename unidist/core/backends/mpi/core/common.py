@@ -51,20 +51,40 @@ class Operation:
         Execute method of a local actor instance.
     CLEANUP : int, default 9
         Cleanup local object storage for out-of-scope IDs.
-    TASK_DONE : int, default 10
+    STEAL_TASKS : int, default 10
+        Return runnable tasks to an idle worker.
+    PUT_STOLEN_TASKS : int, default 11
+        Execute tasks stolen from another worker.
+    EXECUTE_BATCH : int, default 12
+        Execute a batch of tasks of the same function.
+    TASK_DONE : int, default 13
         Increment global task counter.
-    GET_TASK_COUNT : int, default 11
+    GET_TASK_COUNT : int, default 14
         Return global task counter to a requester.
-    RESERVE_SHARED_MEMORY : int, default 12
+    RESERVE_SHARED_MEMORY : int, default 15
         Reserve area in shared memory for the data.
-    REQUEST_SHARED_DATA : int, default 13
-        Return the area in shared memory with the requested data.
-    CANCEL : int, default 14
+    REQUEST_SHARED_DATA : int, default 16
+        Return a chunk of the area in shared memory with the requested data.
+    GET_WORKER_LOAD : int, default 17
+        Return load statistics of workers to a requester.
+    GET_COMPLETED_DATA_IDS : int, default 18
+        Return data IDs of a requester completed since the previous request.
+    TASK_DONE_BATCH : int, default 19
+        Forward the ``TASK_DONE`` messages aggregated by a host monitor to the root monitor.
+    FLUSH_TASK_DONE : int, default 20
+        Make a host monitor forward its aggregated ``TASK_DONE`` messages right away.
+    LEASE_SHARED_MEMORY : int, default 21
+        Lease a slab of shared memory to a process to place data into.
+    PLACE_SHARED_DATA : int, default 22
+        Register the data placed into a leased slab of shared memory.
+    REGISTER_SHARED_DATA_REPLICA : int, default 23
+        Register a host holding a copy of the data in its shared memory.
+    CANCEL : int, default 24
         Send a message to a worker to exit the event loop.
-    READY_TO_SHUTDOWN : int, default 15
+    READY_TO_SHUTDOWN : int, default 25
         Send a message to monitor from a worker,
         which is ready to shutdown.
-    SHUTDOWN : int, default 16
+    SHUTDOWN : int, default 26
         Send a message from monitor to a worker to shutdown.
     """
 
@@ -78,15 +98,25 @@ class Operation:
     ACTOR_CREATE = 7
     ACTOR_EXECUTE = 8
     CLEANUP = 9
+    STEAL_TASKS = 10
+    PUT_STOLEN_TASKS = 11
+    EXECUTE_BATCH = 12
     ### --- Monitor operations --- ###
-    TASK_DONE = 10
-    GET_TASK_COUNT = 11
-    RESERVE_SHARED_MEMORY = 12
-    REQUEST_SHARED_DATA = 13
+    TASK_DONE = 13
+    GET_TASK_COUNT = 14
+    RESERVE_SHARED_MEMORY = 15
+    REQUEST_SHARED_DATA = 16
+    GET_WORKER_LOAD = 17
+    GET_COMPLETED_DATA_IDS = 18
+    TASK_DONE_BATCH = 19
+    FLUSH_TASK_DONE = 20
+    LEASE_SHARED_MEMORY = 21
+    PLACE_SHARED_DATA = 22
+    REGISTER_SHARED_DATA_REPLICA = 23
     ### --- Common operations --- ###
-    CANCEL = 14
-    READY_TO_SHUTDOWN = 15
-    SHUTDOWN = 16
+    CANCEL = 24
+    READY_TO_SHUTDOWN = 25
+    SHUTDOWN = 26
 
 
 class MPITag:
@@ -282,22 +312,48 @@ class MpiDataID(DataID):
         The actual object is for the data id owner, otherwise, ``None``.
     """
 
+    __slots__ = ("owner_rank", "data_number", "_gc")
+
     _instances = weakref.WeakValueDictionary()
 
     def __new__(cls, owner_rank, data_number, gc=None):
         key = (owner_rank, data_number)
-        if key in cls._instances:
-            return cls._instances[key]
-        else:
-            new_instance = super().__new__(cls)
-            cls._instances[key] = new_instance
-            return new_instance
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance.owner_rank = owner_rank
+            instance.data_number = data_number
+            instance._gc = None
+            cls._instances[key] = instance
+        return instance
 
     def __init__(self, owner_rank, data_number, gc=None):
-        super().__init__(f"rank_{owner_rank}_id_{data_number}")
-        self.owner_rank = owner_rank
-        self.data_number = data_number
-        self._gc = gc
+        # The fields are set in `__new__` once per unique ID,
+        # so that an existing instance does not lose its garbage collector reference.
+        if gc is not None:
+            self._gc = gc
+
+    @property
+    def _id(self):
+        """
+        Get the string representation of the ID.
+
+        Returns
+        -------
+        str
+            The ID value built from the owner rank and data number.
+        """
+        return f"rank_{self.owner_rank}_id_{self.data_number}"
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, MpiDataID)
+            and self.owner_rank == other.owner_rank
+            and self.data_number == other.data_number
+        )
+
+    def __hash__(self):
+        return hash((self.owner_rank, self.data_number))
 
     def __getnewargs__(self):
         """
@@ -312,26 +368,20 @@ class MpiDataID(DataID):
 
     def __getstate__(self):
         """
-        Remove a reference to garbage collector for correct `pickle` serialization.
+        Drop the state of the object for correct `pickle` serialization.
 
         Returns
         -------
-        dict
-            State of the object without garbage collector.
+        None
+            The object is completely reconstructed in `__new__`,
+            and the reference to garbage collector must not be serialized.
         """
-        state = self.__dict__.copy()
-        # we remove this attribute for correct serialization,
-        # as well as to reduce the length of the serialized data
-        if hasattr(self, "_gc"):
-            del state["_gc"]
-        return state
+        return None
 
     def __del__(self):
         """Track object deletion by garbage collector."""
-        # check for existence of `._gc` attribute as
-        # it is missing upon unpickling
-        if hasattr(self, "_gc") and self._gc is not None:
-            self._gc.collect((self.owner_rank, self.data_number))
+        if self._gc is not None:
+            self._gc.collect(self)
 
 
 def get_logger(logger_name, file_name, activate=None):
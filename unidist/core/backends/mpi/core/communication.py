@@ -4,8 +4,9 @@
 
 """MPI communication interfaces."""
 
-from collections import defaultdict
+from collections import defaultdict, deque
 import socket
+import threading
 import time
 import warnings
 
@@ -16,7 +17,14 @@ except ImportError:
         "Missing dependency 'mpi4py'. Use pip or conda to install it."
     ) from None
 
-from unidist.config import MpiBackoff
+from unidist.config import (
+    MpiBackoff,
+    MpiBackoffMax,
+    MpiPollingStrategy,
+    MpiMessageCoalescing,
+    MpiMessageCoalescingSize,
+    MpiMessageCoalescingInterval,
+)
 from unidist.core.backends.mpi.core.serialization import (
     SimpleDataSerializer,
     serialize_complex_data,
@@ -36,7 +44,7 @@ logger = common.get_logger("communication", "communication.log")
 is_logger_header_printed = False
 
 
-def log_operation(op_type, status):
+def log_operation(op_type, source_rank):
     """
     Log a communication between worker processes.
 
@@ -44,8 +52,8 @@ def log_operation(op_type, status):
     ----------
     op_type : unidist.core.backends.mpi.core.common.Operation
         Operation type.
-    status : mpi4py.MPI.Status
-        Represents the status of a reception operation.
+    source_rank : int
+        The rank the operation is received from.
     """
     global is_logger_header_printed
     logger_op_name_len = 15
@@ -61,7 +69,6 @@ def log_operation(op_type, status):
         is_logger_header_printed = True
 
     # Write operation to log
-    source_rank = status.Get_source()
     dest_rank = MPIState.get_instance().global_rank
     op_name = common.get_op_name(op_type)
     space_after_op_name = " " * (logger_op_name_len - len(op_name))
@@ -269,6 +276,390 @@ class MPIRank:
     FIRST_WORKER = 2
 
 
+class MessageCoalescer:
+    """
+    Class that coalesces small non-blocking messages sent to the same rank.
+
+    Outgoing messages are buffered per destination rank and sent as one framed message.
+    Incoming framed messages are unpacked and handed out to the receive functions
+    as if the messages were received one by one.
+
+    Notes
+    -----
+    * A frame is a list of pairs of a tag and a message payload. The payload is an operation type
+      for ``common.MPITag.OPERATION``, a pickled object for ``common.MPITag.OBJECT``
+      and bytes for ``common.MPITag.BUFFER``. The frame itself is sent with ``common.MPITag.OPERATION``
+      so that the receiver gets it in place of an operation type.
+    * The messages buffered for a rank are sent once their size exceeds ``MpiMessageCoalescingSize``
+      or the oldest of them gets older than ``MpiMessageCoalescingInterval``.
+      Any other communication flushes the buffered messages first to keep the messages ordered
+      and to not make a blocking call wait for a message that has not been sent yet.
+    """
+
+    __instance = None
+
+    def __init__(self):
+        self.is_enabled = MpiMessageCoalescing.get()
+        self._max_size = MpiMessageCoalescingSize.get()
+        self._interval = MpiMessageCoalescingInterval.get()
+        # The lock is reentrant because a flush can be triggered while putting a message
+        self._lock = threading.RLock()
+        self._condition = threading.Condition(self._lock)
+        # Buffered messages {dest_rank: [(tag, payload), ...]}
+        self._frames = defaultdict(list)
+        # Size of buffered messages {dest_rank: int}
+        self._frame_sizes = defaultdict(int)
+        # The time the oldest buffered message was put
+        self._first_put_time = None
+        # Handlers of frames being sent
+        self._handlers = []
+        # Thread sending the messages buffered for too long
+        self._flush_thread = None
+        self._is_closed = False
+        # Operations unpacked from received frames [(op_type, source_rank), ...]
+        self._operations = deque()
+        # Payloads unpacked from received frames {source_rank: [(tag, payload), ...]}
+        self._payloads = defaultdict(deque)
+
+    @classmethod
+    def get_instance(cls):
+        """
+        Get instance of ``MessageCoalescer``.
+
+        Returns
+        -------
+        MessageCoalescer
+        """
+        if cls.__instance is None:
+            cls.__instance = MessageCoalescer()
+        return cls.__instance
+
+    def accepts(self, size):
+        """
+        Check if messages of the given size can be buffered.
+
+        Parameters
+        ----------
+        size : int
+            Size of the messages in bytes.
+
+        Returns
+        -------
+        bool
+        """
+        return self.is_enabled and not self._is_closed and size < self._max_size
+
+    def put(self, comm, dest_rank, messages):
+        """
+        Buffer messages to be sent to the destination rank.
+
+        Parameters
+        ----------
+        comm : object
+            MPI communicator object.
+        dest_rank : int
+            Target MPI process to transfer data.
+        messages : list
+            List of pairs of a tag and a message payload.
+
+        Returns
+        -------
+        bool
+            ``True`` if the messages are buffered, ``False`` if they should be sent directly.
+        """
+        size = sum(
+            len(payload) for tag, payload in messages if tag != common.MPITag.OPERATION
+        )
+        if not self.accepts(size):
+            return False
+        with self._lock:
+            self._frames[dest_rank].extend(messages)
+            self._frame_sizes[dest_rank] += size
+            if self._frame_sizes[dest_rank] >= self._max_size:
+                self._send_frame(comm, dest_rank)
+            if self._first_put_time is None and self._frames:
+                self._first_put_time = time.perf_counter()
+                if self._flush_thread is None:
+                    self._flush_thread = threading.Thread(
+                        target=self._flush_loop, args=(comm,), daemon=True
+                    )
+                    self._flush_thread.start()
+                else:
+                    self._condition.notify()
+        return True
+
+    def _send_frame(self, comm, dest_rank):
+        """
+        Send the messages buffered for the destination rank as one frame.
+
+        Parameters
+        ----------
+        comm : object
+            MPI communicator object.
+        dest_rank : int
+            Target MPI process to transfer data.
+        """
+        frame = self._frames.pop(dest_rank)
+        del self._frame_sizes[dest_rank]
+        if not self._frames:
+            self._first_put_time = None
+        self._handlers.append(
+            comm.isend(frame, dest=dest_rank, tag=common.MPITag.OPERATION)
+        )
+
+    def flush(self, comm, dest_rank=None):
+        """
+        Send the buffered messages.
+
+        Parameters
+        ----------
+        comm : object
+            MPI communicator object.
+        dest_rank : int, optional
+            Target MPI process to send the messages to.
+            If ``None``, the messages are sent to all the processes.
+        """
+        if not self._frames:
+            return
+        with self._lock:
+            if dest_rank is None:
+                for rank in list(self._frames):
+                    self._send_frame(comm, rank)
+            elif dest_rank in self._frames:
+                self._send_frame(comm, dest_rank)
+            self._handlers[:] = [
+                handler for handler in self._handlers if not handler.Test()
+            ]
+
+    def _flush_loop(self, comm):
+        """
+        Send the messages buffered for longer than the interval until the coalescer is closed.
+
+        Parameters
+        ----------
+        comm : object
+            MPI communicator object.
+        """
+        with self._condition:
+            while not self._is_closed:
+                if self._first_put_time is None:
+                    self._condition.wait()
+                    continue
+                timeout = self._first_put_time + self._interval - time.perf_counter()
+                if timeout > 0:
+                    self._condition.wait(timeout)
+                else:
+                    self.flush(comm)
+
+    def close(self, comm):
+        """
+        Send the buffered messages and stop buffering new ones.
+
+        Parameters
+        ----------
+        comm : object
+            MPI communicator object.
+
+        Notes
+        -----
+        The coalescer should be closed before MPI.Finalize().
+        """
+        with self._condition:
+            self.flush(comm)
+            self._is_closed = True
+            self._condition.notify()
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+            self._flush_thread = None
+        self.wait()
+
+    def wait(self):
+        """Wait until all the frames being sent are complete."""
+        with self._lock:
+            for handler in self._handlers:
+                handler.Wait()
+            self._handlers.clear()
+
+    def unpack(self, frame, source_rank):
+        """
+        Unpack messages of a frame received from the source rank.
+
+        Parameters
+        ----------
+        frame : list
+            List of pairs of a tag and a message payload.
+        source_rank : int
+            The rank the frame is received from.
+        """
+        payloads = self._payloads[source_rank]
+        for tag, payload in frame:
+            if tag == common.MPITag.OPERATION:
+                self._operations.append((payload, source_rank))
+            else:
+                payloads.append((tag, payload))
+
+    def has_operations(self):
+        """
+        Check if there are unpacked operations to be processed.
+
+        Returns
+        -------
+        bool
+        """
+        return len(self._operations) > 0
+
+    def pop_operation(self):
+        """
+        Get the next unpacked operation.
+
+        Returns
+        -------
+        unidist.core.backends.mpi.core.common.Operation
+            Operation type.
+        int
+            Source rank.
+        """
+        return self._operations.popleft()
+
+    def has_payload(self, source_rank):
+        """
+        Check if there are unpacked payloads received from the source rank.
+
+        Parameters
+        ----------
+        source_rank : int
+            Source MPI process.
+
+        Returns
+        -------
+        bool
+        """
+        return len(self._payloads[source_rank]) > 0
+
+    def pop_payload(self, source_rank, tag):
+        """
+        Get the next unpacked payload received from the source rank.
+
+        Parameters
+        ----------
+        source_rank : int
+            Source MPI process.
+        tag : common.MPITag
+            Expected tag of the payload.
+
+        Returns
+        -------
+        object
+            Unpickled object for ``common.MPITag.OBJECT`` or bytes for ``common.MPITag.BUFFER``.
+        """
+        payload_tag, payload = self._payloads[source_rank].popleft()
+        if payload_tag != tag:
+            raise RuntimeError(
+                f"Unexpected message tag {payload_tag} from rank {source_rank}, expected {tag}"
+            )
+        if tag == common.MPITag.OBJECT:
+            return MPI.pickle.loads(payload)
+        return payload
+
+
+class AdaptivePoller:
+    """
+    Class that waits for a message in loops exchanging messages.
+
+    Parameters
+    ----------
+    spin_count : int, default: 100
+        The number of checks made without a pause.
+    yield_count : int, default: 100
+        The number of checks made after yielding the processor to other threads.
+
+    Notes
+    -----
+    * With ``adaptive`` ``MpiPollingStrategy`` the poller spins for `spin_count` checks,
+      then yields the processor for `yield_count` checks, then sleeps starting from ``MpiBackoff``
+      and doubling the time up to ``MpiBackoffMax``. Every wait starts over from spinning,
+      so the poller gets back to low latency as soon as a message arrives.
+    * With ``fixed`` ``MpiPollingStrategy`` the poller sleeps for ``MpiBackoff`` between the checks.
+    * The poller counts the number of waits (wakeups), the number of checks and
+      the time spent waiting, which are available with ``get_stats``.
+    """
+
+    __instance = None
+
+    def __init__(self, spin_count=100, yield_count=100):
+        self.is_adaptive = MpiPollingStrategy.get() == "adaptive"
+        self._spin_count = spin_count
+        self._yield_count = yield_count
+        self._min_backoff = MpiBackoff.get()
+        self._max_backoff = max(MpiBackoffMax.get(), self._min_backoff)
+        # The poller can be used by the event loop thread and the executor thread at the same time
+        self._lock = threading.Lock()
+        self._wakeups = 0
+        self._polls = 0
+        self._idle_time = 0.0
+
+    @classmethod
+    def get_instance(cls):
+        """
+        Get instance of ``AdaptivePoller``.
+
+        Returns
+        -------
+        AdaptivePoller
+        """
+        if cls.__instance is None:
+            cls.__instance = AdaptivePoller()
+        return cls.__instance
+
+    def wait(self, is_ready):
+        """
+        Wait until `is_ready` returns ``True``.
+
+        Parameters
+        ----------
+        is_ready : callable
+            Function checking if a message has arrived.
+        """
+        polls = 1
+        if not is_ready():
+            idle_start = time.perf_counter()
+            backoff = self._min_backoff
+            while True:
+                if not self.is_adaptive:
+                    time.sleep(backoff)
+                elif polls > self._spin_count + self._yield_count:
+                    time.sleep(backoff)
+                    backoff = min(backoff * 2, self._max_backoff)
+                elif polls > self._spin_count:
+                    time.sleep(0)
+                polls += 1
+                if is_ready():
+                    break
+            idle_time = time.perf_counter() - idle_start
+        else:
+            idle_time = 0.0
+        with self._lock:
+            self._wakeups += 1
+            self._polls += polls
+            self._idle_time += idle_time
+
+    def get_stats(self):
+        """
+        Get the polling counters.
+
+        Returns
+        -------
+        dict
+            The number of waits, the number of checks and the time in seconds spent waiting.
+        """
+        with self._lock:
+            return {
+                "wakeups": self._wakeups,
+                "polls": self._polls,
+                "idle_time": self._idle_time,
+            }
+
+
 # ---------------------------- #
 # Main communication utilities #
 # ---------------------------- #
@@ -294,6 +685,7 @@ def mpi_send_operation(comm, op_type, dest_rank):
       Otherwise, use non-blocking ``mpi_isend_operation``.
     * The special tag is used for this communication, namely, ``common.MPITag.OPERATION``.
     """
+    MessageCoalescer.get_instance().flush(comm, dest_rank)
     comm.send(op_type, dest=dest_rank, tag=common.MPITag.OPERATION)
 
 
@@ -319,6 +711,7 @@ def mpi_send_object(comm, data, dest_rank, tag=common.MPITag.OBJECT):
       Otherwise, use non-blocking ``mpi_isend_object``.
     * The special tag is used for this communication, namely, ``common.MPITag.OBJECT``.
     """
+    MessageCoalescer.get_instance().flush(comm, dest_rank)
     comm.send(data, dest=dest_rank, tag=tag)
 
 
@@ -344,6 +737,7 @@ def mpi_isend_operation(comm, op_type, dest_rank):
     -----
     The special tag is used for this communication, namely, ``common.MPITag.OPERATION``.
     """
+    MessageCoalescer.get_instance().flush(comm, dest_rank)
     return comm.isend(op_type, dest=dest_rank, tag=common.MPITag.OPERATION)
 
 
@@ -369,9 +763,46 @@ def mpi_isend_object(comm, data, dest_rank):
     -----
     The special tag is used for this communication, namely, ``common.MPITag.OBJECT``.
     """
+    MessageCoalescer.get_instance().flush(comm, dest_rank)
     return comm.isend(data, dest=dest_rank, tag=common.MPITag.OBJECT)
 
 
+def _wait_matched_message(comm, source, tag, status):
+    """
+    Wait for a message and match it so that no other thread can receive it.
+
+    Plain ``iprobe`` followed by ``recv`` is racy when several threads
+    communicate (e.g., the worker loop and a task running on an executor thread),
+    so the message is matched by ``improbe`` and then received with ``Message.recv``.
+
+    Parameters
+    ----------
+    comm : mpi4py.MPI.Comm
+        MPI communicator.
+    source : int
+        Source rank or ``MPI.ANY_SOURCE``.
+    tag : common.MPITag
+        Message tag.
+    status : mpi4py.MPI.Status
+        Status object to be filled in for the matched message.
+
+    Returns
+    -------
+    mpi4py.MPI.Message
+        Matched message.
+    """
+    matched = []
+
+    def improbe():
+        message = comm.improbe(source=source, tag=tag, status=status)
+        if message is not None:
+            matched.append(message)
+        return message is not None
+
+    AdaptivePoller.get_instance().wait(improbe)
+    return matched[0]
+
+
 def mpi_recv_operation(comm):
     """
     Worker receive operation type interface.
@@ -392,26 +823,84 @@ def mpi_recv_operation(comm):
 
     Notes
     -----
-    The special tag is used for this communication, namely, ``common.MPITag.OPERATION``.
+    * Operations of a received frame of coalesced messages are returned one by one.
+    * The special tag is used for this communication, namely, ``common.MPITag.OPERATION``.
     """
-    backoff = MpiBackoff.get()
-    status = MPI.Status()
-    source = MPI.ANY_SOURCE
-    tag = common.MPITag.OPERATION
-    while not comm.iprobe(source=source, tag=tag, status=status):
-        time.sleep(backoff)
-    source = status.source
-    tag = status.tag
-    op_type = comm.recv(buf=None, source=source, tag=tag, status=status)
-    log_operation(op_type, status)
-    return op_type, status.Get_source()
+    coalescer = MessageCoalescer.get_instance()
+    if not coalescer.has_operations():
+        status = MPI.Status()
+        source = MPI.ANY_SOURCE
+        tag = common.MPITag.OPERATION
+        message = comm.improbe(source=source, tag=tag, status=status)
+        if message is None:
+            # Send the buffered messages while there is nothing to process
+            coalescer.flush(comm)
+            message = _wait_matched_message(comm, source, tag, status)
+        source = status.source
+        op_type = message.recv(status=status)
+        if not isinstance(op_type, list):
+            log_operation(op_type, source)
+            return op_type, source
+        # A frame of coalesced messages is received
+        coalescer.unpack(op_type, source)
+    op_type, source = coalescer.pop_operation()
+    log_operation(op_type, source)
+    return op_type, source
+
+
+def mpi_iprobe_operation(comm):
+    """
+    Check if there is an operation to be received from any source.
+
+    Parameters
+    ----------
+    comm : object
+        MPI communicator object.
+
+    Returns
+    -------
+    bool
+        ``True`` if an operation is available to be received.
+
+    Notes
+    -----
+    * The first probe after a long computation can miss an already sent operation
+      because the MPI progress engine has not run for a while, so the probe is repeated once.
+    * The special tag is used for this communication, namely, ``common.MPITag.OPERATION``.
+    """
+    if MessageCoalescer.get_instance().has_operations():
+        return True
+    return comm.iprobe(
+        source=MPI.ANY_SOURCE, tag=common.MPITag.OPERATION
+    ) or comm.iprobe(source=MPI.ANY_SOURCE, tag=common.MPITag.OPERATION)
+
+
+def mpi_iprobe(comm, source=MPI.ANY_SOURCE, tag=common.MPITag.OBJECT):
+    """
+    Check if there is a message to be received.
+
+    Parameters
+    ----------
+    comm : mpi4py.MPI.Comm
+        MPI communicator.
+    source : int, default: MPI.ANY_SOURCE
+        Source rank.
+    tag : common.MPITag, default: common.MPITag.OBJECT
+        Message tag.
+
+    Returns
+    -------
+    bool
+        ``True`` if a message is available to be received.
+    """
+    return comm.iprobe(source=source, tag=tag)
 
 
 def mpi_iprobe_recv_object(comm, tag=common.MPITag.OBJECT):
     """
     Receive an object of a standard Python data type from any source.
 
-    The source rank gets available from `iprobe`.
+    The source rank gets available from `improbe`.
 
     Parameters
     ----------
@@ -427,14 +916,11 @@ def mpi_iprobe_recv_object(comm, tag=common.MPITag.OBJECT):
     int
         Source rank.
     """
-    backoff = MpiBackoff.get()
+    MessageCoalescer.get_instance().flush(comm)
     status = MPI.Status()
-    source = MPI.ANY_SOURCE
-    while not comm.iprobe(source=source, tag=tag, status=status):
-        time.sleep(backoff)
-    source = status.source
-    data = comm.recv(source=source, tag=tag, status=status)
-    return data, source
+    message = _wait_matched_message(comm, MPI.ANY_SOURCE, tag, status)
+    data = message.recv(status=status)
+    return data, status.source
 
 
 def mpi_recv_object(comm, source_rank):
@@ -458,6 +944,10 @@ def mpi_recv_object(comm, source_rank):
     * De-serialization is a simple pickle.load in this case.
     * The special tag is used for this communication, namely, ``common.MPITag.OBJECT``.
     """
+    coalescer = MessageCoalescer.get_instance()
+    if coalescer.has_payload(source_rank):
+        return coalescer.pop_payload(source_rank, common.MPITag.OBJECT)
+    coalescer.flush(comm)
     return comm.recv(source=source_rank, tag=common.MPITag.OBJECT)
 
 
@@ -486,6 +976,7 @@ def mpi_send_buffer(comm, buffer, dest_rank, data_type=MPI.CHAR, buffer_size=Non
     * The special tags are used for this communication, namely,
       ``common.MPITag.OBJECT`` and ``common.MPITag.BUFFER``.
     """
+    MessageCoalescer.get_instance().flush(comm, dest_rank)
     if buffer_size:
         comm.send(buffer_size, dest=dest_rank, tag=common.MPITag.OBJECT)
     else:
@@ -530,6 +1021,7 @@ def mpi_isend_buffer(comm, buffer_size, buffer, dest_rank):
     The special tags are used for this communication, namely,
     ``common.MPITag.OBJECT`` and ``common.MPITag.BUFFER``.
     """
+    MessageCoalescer.get_instance().flush(comm, dest_rank)
     requests = []
     h1 = comm.isend(buffer_size, dest=dest_rank, tag=common.MPITag.OBJECT)
     requests.append((h1, None))
@@ -574,6 +1066,14 @@ def mpi_recv_buffer(comm, source_rank, result_buffer=None):
     The special tags are used for this communication, namely,
     ``common.MPITag.OBJECT`` and ``common.MPITag.BUFFER``.
     """
+    coalescer = MessageCoalescer.get_instance()
+    if coalescer.has_payload(source_rank):
+        if result_buffer is None:
+            coalescer.pop_payload(source_rank, common.MPITag.OBJECT)
+            return bytearray(coalescer.pop_payload(source_rank, common.MPITag.BUFFER))
+        result_buffer[:] = coalescer.pop_payload(source_rank, common.MPITag.BUFFER)
+        return result_buffer
+    coalescer.flush(comm)
     if result_buffer is None:
         buf_size = comm.recv(source=source_rank, tag=common.MPITag.OBJECT)
         result_buffer = bytearray(buf_size)
@@ -596,10 +1096,57 @@ def mpi_recv_buffer(comm, source_rank, result_buffer=None):
     return result_buffer
 
 
+def mpi_irecv_buffer(comm, source_rank, result_buffer):
+    """
+    Receive data buffer into a given buffer in a non-blocking way.
+
+    Parameters
+    ----------
+    comm : object
+        MPI communicator object.
+    source_rank : int
+        Communication event source rank.
+    result_buffer : object
+        The buffer to be filled.
+
+    Returns
+    -------
+    list
+        Handlers to MPI_Irecv communication results.
+
+    Notes
+    -----
+    * The data is received directly into `result_buffer`, so the buffer must not be used
+      until the communication is completed.
+    * The special tag is used for this communication, namely, ``common.MPITag.BUFFER``.
+    """
+    MessageCoalescer.get_instance().flush(comm)
+    buf_size = len(result_buffer)
+    # Maximum block size MPI is able to send/recv
+    block_size = pkl5._bigmpi.blocksize
+    partitions = list(range(0, buf_size, block_size))
+    partitions.append(buf_size)
+    num_partitions = len(partitions)
+    requests = []
+    with pkl5._bigmpi as bigmpi:
+        for i in range(num_partitions):
+            if i + 1 < num_partitions:
+                requests.append(
+                    comm.Irecv(
+                        bigmpi(result_buffer[partitions[i] : partitions[i + 1]]),
+                        source=source_rank,
+                        tag=common.MPITag.BUFFER,
+                    )
+                )
+    return requests
+
+
 def mpi_busy_wait_recv(comm, source_rank):
     """
     Wait for receive operation result in a custom busy wait loop.
 
+    The loop waits with ``AdaptivePoller``.
+
     Parameters
     ----------
     comm : object
@@ -616,14 +1163,18 @@ def mpi_busy_wait_recv(comm, source_rank):
     -----
     The special tag is used for this communication, namely, ``common.MPITag.OBJECT``.
     """
-    backoff = MpiBackoff.get()
+    MessageCoalescer.get_instance().flush(comm)
     req_handle = comm.irecv(source=source_rank, tag=common.MPITag.OBJECT)
-    while True:
+    result = []
+
+    def is_received():
         status, data = req_handle.test()
         if status:
-            return data
-        else:
-            time.sleep(backoff)
+            result.append(data)
+        return status
+
+    AdaptivePoller.get_instance().wait(is_received)
+    return result[0]
 
 
 # --------------------------------- #
@@ -653,6 +1204,7 @@ def _send_complex_data_impl(comm, s_data, raw_buffers, dest_rank, info_package):
     The special tags are used for this communication, namely,
     ``common.MPITag.OBJECT`` and ``common.MPITag.BUFFER``.
     """
+    MessageCoalescer.get_instance().flush(comm, dest_rank)
     # wrap to dict for sending and correct deserialization of the object by the recipient
     comm.send(dict(info_package), dest=dest_rank, tag=common.MPITag.OBJECT_BLOCKING)
     with pkl5._bigmpi as bigmpi:
@@ -740,6 +1292,7 @@ def _isend_complex_data_impl(comm, s_data, raw_buffers, dest_rank, info_package)
     * The special tags are used for this communication, namely,
       ``common.MPITag.OBJECT`` and ``common.MPITag.BUFFER``.
     """
+    MessageCoalescer.get_instance().flush(comm, dest_rank)
     handlers = []
     # wrap to dict for sending and correct deserialization of the object by the recipient
     h1 = comm.isend(dict(info_package), dest=dest_rank, tag=common.MPITag.OBJECT)
@@ -838,8 +1391,18 @@ def recv_complex_data(comm, source_rank, info_package):
     The special tags are used for this communication, namely,
     ``common.MPITag.OBJECT`` and ``common.MPITag.BUFFER``.
     """
-    msgpack_buffer = bytearray(info_package["s_data_len"])
     buffer_count = info_package["buffer_count"]
+    coalescer = MessageCoalescer.get_instance()
+    if coalescer.has_payload(source_rank):
+        msgpack_buffer = coalescer.pop_payload(source_rank, common.MPITag.BUFFER)
+        # Out-of-band buffers are copied to be writable like the received ones
+        raw_buffers = [
+            bytearray(coalescer.pop_payload(source_rank, common.MPITag.BUFFER))
+            for _ in info_package["raw_buffers_len"]
+        ]
+        return deserialize_complex_data(msgpack_buffer, raw_buffers, buffer_count)
+    coalescer.flush(comm)
+    msgpack_buffer = bytearray(info_package["s_data_len"])
     raw_buffers = list(map(bytearray, info_package["raw_buffers_len"]))
     with pkl5._bigmpi as bigmpi:
         comm.Recv(bigmpi(msgpack_buffer), source=source_rank, tag=common.MPITag.BUFFER)
@@ -910,6 +1473,14 @@ def isend_simple_operation(comm, operation_type, operation_data, dest_rank):
     * The special tags are used for this communication, namely,
       ``common.MPITag.OPERATION`` and ``common.MPITag.OBJECT``.
     """
+    coalescer = MessageCoalescer.get_instance()
+    if coalescer.is_enabled:
+        messages = [
+            (common.MPITag.OPERATION, operation_type),
+            (common.MPITag.OBJECT, MPI.pickle.dumps(operation_data)),
+        ]
+        if coalescer.put(comm, dest_rank, messages):
+            return []
     # Send operation type
     handlers = []
     h1 = mpi_isend_operation(comm, operation_type, dest_rank)
@@ -957,12 +1528,6 @@ def isend_complex_operation(
     The special tags are used for this communication, namely,
     ``common.MPITag.OPERATION``, ``common.MPITag.OBJECT`` and ``common.MPITag.BUFFER``.
     """
-    # Send operation type
-    handlers = []
-    h1 = mpi_isend_operation(comm, operation_type, dest_rank)
-    handlers.append((h1, None))
-
-    # Send operation data
     if is_serialized:
         # Send already serialized data
         s_data = operation_data["s_data"]
@@ -973,16 +1538,35 @@ def isend_complex_operation(
         info_package = common.MetadataPackage.get_local_info(
             data_id, len(s_data), [len(sbuf) for sbuf in raw_buffers], buffer_count
         )
-        h2_list = _isend_complex_data_impl(
-            comm, s_data, raw_buffers, dest_rank, info_package
+    else:
+        # Serialize the data
+        serialized_data = serialize_complex_data(operation_data)
+        s_data = serialized_data["s_data"]
+        raw_buffers = serialized_data["raw_buffers"]
+        buffer_count = serialized_data["buffer_count"]
+        info_package = common.MetadataPackage.get_task_info(
+            len(s_data), [len(sbuf) for sbuf in raw_buffers], buffer_count
         )
-        handlers.extend(h2_list)
+
+    coalescer = MessageCoalescer.get_instance()
+    data_size = len(s_data) + sum(len(sbuf) for sbuf in raw_buffers)
+    if coalescer.accepts(data_size):
+        messages = [
+            (common.MPITag.OPERATION, operation_type),
+            # wrap to dict for sending and correct deserialization of the object by the recipient
+            (common.MPITag.OBJECT, MPI.pickle.dumps(dict(info_package))),
+            (common.MPITag.BUFFER, bytes(s_data)),
+        ]
+        messages.extend((common.MPITag.BUFFER, bytes(sbuf)) for sbuf in raw_buffers)
+        coalescer.put(comm, dest_rank, messages)
+        handlers = []
     else:
-        # Serialize and send the data
-        h2_list, s_data, raw_buffers, buffer_count = isend_complex_data(
-            comm, operation_data, dest_rank
+        # Send operation type
+        handlers = [(mpi_isend_operation(comm, operation_type, dest_rank), None)]
+        # Send operation data
+        handlers.extend(
+            _isend_complex_data_impl(comm, s_data, raw_buffers, dest_rank, info_package)
         )
-        handlers.extend(h2_list)
     return handlers, {
         "s_data": s_data,
         "raw_buffers": raw_buffers,
@@ -1015,6 +1599,15 @@ def isend_serialized_operation(comm, operation_type, operation_data, dest_rank):
     The special tags are used for this communication, namely,
     ``common.MPITag.OPERATION``, ``common.MPITag.OBJECT`` and ``common.MPITag.BUFFER``.
     """
+    coalescer = MessageCoalescer.get_instance()
+    if coalescer.accepts(len(operation_data)):
+        messages = [
+            (common.MPITag.OPERATION, operation_type),
+            (common.MPITag.OBJECT, MPI.pickle.dumps(len(operation_data))),
+            (common.MPITag.BUFFER, bytes(operation_data)),
+        ]
+        coalescer.put(comm, dest_rank, messages)
+        return []
     handlers = []
     # Send operation type
     h1 = mpi_isend_operation(comm, operation_type, dest_rank)
@@ -1052,7 +1645,9 @@ def recv_serialized_data(comm, source_rank):
     return SimpleDataSerializer().deserialize_pickle(s_buffer)
 
 
-def send_reserve_operation(comm, data_id, data_size):
+def send_reserve_operation(
+    comm, data_id, data_size, content_key=None, is_alias_rejected=False
+):
     """
     Reserve shared memory for `data_id`.
 
@@ -1062,6 +1657,10 @@ def send_reserve_operation(comm, data_id, data_size):
         An ID to data.
     data_size : int
         Length of a required range in shared memory.
+    content_key : bytes, optional
+        Key of the content of data to find identical data in shared memory.
+    is_alias_rejected : bool, default: False
+        Whether the data differs from the data in shared memory reserved for `data_id` before.
 
     Returns
     -------
@@ -1074,6 +1673,50 @@ def send_reserve_operation(comm, data_id, data_size):
     operation_data = {
         "id": data_id,
         "size": data_size,
+        "content_key": content_key,
+        "is_alias_rejected": is_alias_rejected,
+    }
+    # We use a blocking send here because we have to wait for
+    # completion of the communication, which is necessary for the pipeline to continue.
+    send_simple_operation(
+        comm,
+        operation_type,
+        operation_data,
+        mpi_state.get_monitor_by_worker_rank(),
+    )
+    return mpi_recv_object(comm, mpi_state.get_monitor_by_worker_rank())
+
+
+def send_lease_operation(comm, data_size, lease_size, service_count, released_lease):
+    """
+    Lease a slab of shared memory to place data into.
+
+    Parameters
+    ----------
+    comm : object
+        MPI communicator object.
+    data_size : int
+        Length of data that must fit into the slab.
+    lease_size : int
+        Preferred length of the slab.
+    service_count : int
+        Preferred number of service buffer slots leased along with the slab.
+    released_lease : dict or None
+        The unused part of the previous lease to hand back to the monitor.
+
+    Returns
+    -------
+    dict
+        Lease info about the ranges leased in shared memory and in the service buffer.
+    """
+    mpi_state = MPIState.get_instance()
+    operation_type = common.Operation.LEASE_SHARED_MEMORY
+
+    operation_data = {
+        "size": data_size,
+        "lease_size": lease_size,
+        "service_count": service_count,
+        "released_lease": released_lease,
     }
     # We use a blocking send here because we have to wait for
     # completion of the communication, which is necessary for the pipeline to continue.
@@ -8,6 +8,7 @@ from unidist.core.backends.mpi.core.controller.api import (
     put,
     get,
     submit,
+    submit_many,
     wait,
     init,
     is_initialized,
@@ -20,6 +21,7 @@ __all__ = [
     "put",
     "get",
     "submit",
+    "submit_many",
     "wait",
     "init",
     "is_initialized",
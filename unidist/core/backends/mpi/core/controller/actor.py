@@ -11,7 +11,7 @@ from unidist.core.backends.mpi.core.local_object_store import LocalObjectStore
 from unidist.core.backends.mpi.core.controller.garbage_collector import (
     garbage_collector,
 )
-from unidist.core.backends.mpi.core.controller.common import push_data, RoundRobin
+from unidist.core.backends.mpi.core.controller.common import push_data, get_scheduler
 from unidist.core.backends.mpi.core.controller.api import put
 
 
@@ -38,6 +38,15 @@ class ActorMethod:
         output_id = local_store.generate_output_data_id(
             self._actor._owner_rank, garbage_collector, num_returns
         )
+        # A method without returns still gets an output data ID
+        # so that the garbage collector can find out when the method is complete
+        task_output_id = (
+            output_id
+            if output_id is not None
+            else local_store.generate_output_data_id(
+                self._actor._owner_rank, garbage_collector
+            )
+        )
 
         push_data(self._actor._owner_rank, self._method_name)
         push_data(self._actor._owner_rank, args)
@@ -49,7 +58,7 @@ class ActorMethod:
             # tuple cannot be serialized iteratively and it will fail if some internal data cannot be serialized using Pickle
             "args": list(args),
             "kwargs": kwargs,
-            "output": output_id,
+            "output": task_output_id,
             "handler": self._actor._handler_id,
         }
         async_operations = AsyncOperations.get_instance()
@@ -61,6 +70,9 @@ class ActorMethod:
             is_serialized=False,
         )
         async_operations.extend(h_list)
+
+        # Track the method execution
+        garbage_collector.track_task(task_output_id, self._method_name, args, kwargs)
         return output_id
 
 
@@ -93,9 +105,7 @@ class Actor:
         self._args = args
         self._kwargs = kwargs
         self._owner_rank = (
-            RoundRobin.get_instance().schedule_rank()
-            if owner_rank is None
-            else owner_rank
+            get_scheduler().schedule_rank() if owner_rank is None else owner_rank
         )
         local_store = LocalObjectStore.get_instance()
         self._handler_id = (
@@ -106,7 +116,7 @@ class Actor:
         local_store.put_data_owner(self._handler_id, self._owner_rank)
 
         # reserve a rank for actor execution only
-        RoundRobin.get_instance().reserve_rank(self._owner_rank)
+        get_scheduler().reserve_rank(self._owner_rank)
 
         # submit `ACTOR_CREATE` task to a worker only once
         if owner_rank is None and handler_id is None:
@@ -197,4 +207,4 @@ class Actor:
         """
         This is defined to release the rank reserved for the actor when it gets out of scope.
         """
-        RoundRobin.get_instance().release_rank(self._owner_rank)
+        get_scheduler().release_rank(self._owner_rank)
@@ -28,7 +28,7 @@ from unidist.core.backends.mpi.core.controller.garbage_collector import (
 from unidist.core.backends.mpi.core.controller.common import (
     request_worker_data,
     push_data,
-    RoundRobin,
+    get_scheduler,
 )
 import unidist.core.backends.mpi.core.common as common
 import unidist.core.backends.mpi.core.communication as communication
@@ -40,11 +40,28 @@ from unidist.config import (
     ValueSource,
     MpiPickleThreshold,
     MpiBackoff,
+    MpiBackoffMax,
+    MpiPollingStrategy,
     MpiLog,
     MpiSharedObjectStore,
     MpiSharedObjectStoreMemory,
     MpiSharedServiceMemory,
     MpiSharedObjectStoreThreshold,
+    MpiSharedObjectStoreDedup,
+    MpiSharedMemorySegmentSize,
+    MpiCompactionThreshold,
+    MpiSharedMemoryLeaseSize,
+    MpiSharedDataChunkSize,
+    MpiLocalObjectStoreMemory,
+    MpiSpillDirectory,
+    MpiSpillLimit,
+    MpiSchedulingPolicy,
+    MpiWorkStealing,
+    MpiThreadedExecution,
+    MpiTaskSlots,
+    MpiMessageCoalescing,
+    MpiMessageCoalescingSize,
+    MpiMessageCoalescingInterval,
     MpiRuntimeEnv,
 )
 
@@ -164,6 +181,10 @@ def init():
             py_str += [f"cfg.MpiPickleThreshold.put({MpiPickleThreshold.get()})"]
         if MpiBackoff.get_value_source() != ValueSource.DEFAULT:
             py_str += [f"cfg.MpiBackoff.put({MpiBackoff.get()})"]
+        if MpiBackoffMax.get_value_source() != ValueSource.DEFAULT:
+            py_str += [f"cfg.MpiBackoffMax.put({MpiBackoffMax.get()})"]
+        if MpiPollingStrategy.get_value_source() != ValueSource.DEFAULT:
+            py_str += [f"cfg.MpiPollingStrategy.put('{MpiPollingStrategy.get()}')"]
         if MpiLog.get_value_source() != ValueSource.DEFAULT:
             py_str += [f"cfg.MpiLog.put({MpiLog.get()})"]
         if MpiSharedObjectStore.get_value_source() != ValueSource.DEFAULT:
@@ -180,6 +201,52 @@ def init():
             py_str += [
                 f"cfg.MpiSharedObjectStoreThreshold.put({MpiSharedObjectStoreThreshold.get()})"
             ]
+        if MpiSharedObjectStoreDedup.get_value_source() != ValueSource.DEFAULT:
+            py_str += [
+                f"cfg.MpiSharedObjectStoreDedup.put({MpiSharedObjectStoreDedup.get()})"
+            ]
+        if MpiSharedMemorySegmentSize.get_value_source() != ValueSource.DEFAULT:
+            py_str += [
+                f"cfg.MpiSharedMemorySegmentSize.put({MpiSharedMemorySegmentSize.get()})"
+            ]
+        if MpiCompactionThreshold.get_value_source() != ValueSource.DEFAULT:
+            py_str += [
+                f"cfg.MpiCompactionThreshold.put({MpiCompactionThreshold.get()})"
+            ]
+        if MpiSharedMemoryLeaseSize.get_value_source() != ValueSource.DEFAULT:
+            py_str += [
+                f"cfg.MpiSharedMemoryLeaseSize.put({MpiSharedMemoryLeaseSize.get()})"
+            ]
+        if MpiSharedDataChunkSize.get_value_source() != ValueSource.DEFAULT:
+            py_str += [
+                f"cfg.MpiSharedDataChunkSize.put({MpiSharedDataChunkSize.get()})"
+            ]
+        if MpiLocalObjectStoreMemory.get_value_source() != ValueSource.DEFAULT:
+            py_str += [
+                f"cfg.MpiLocalObjectStoreMemory.put({MpiLocalObjectStoreMemory.get()})"
+            ]
+        if MpiSpillDirectory.get_value_source() != ValueSource.DEFAULT:
+            py_str += [f"cfg.MpiSpillDirectory.put('{MpiSpillDirectory.get()}')"]
+        if MpiSpillLimit.get_value_source() != ValueSource.DEFAULT:
+            py_str += [f"cfg.MpiSpillLimit.put({MpiSpillLimit.get()})"]
+        if MpiSchedulingPolicy.get_value_source() != ValueSource.DEFAULT:
+            py_str += [f"cfg.MpiSchedulingPolicy.put('{MpiSchedulingPolicy.get()}')"]
+        if MpiWorkStealing.get_value_source() != ValueSource.DEFAULT:
+            py_str += [f"cfg.MpiWorkStealing.put({MpiWorkStealing.get()})"]
+        if MpiThreadedExecution.get_value_source() != ValueSource.DEFAULT:
+            py_str += [f"cfg.MpiThreadedExecution.put({MpiThreadedExecution.get()})"]
+        if MpiTaskSlots.get_value_source() != ValueSource.DEFAULT:
+            py_str += [f"cfg.MpiTaskSlots.put({MpiTaskSlots.get()})"]
+        if MpiMessageCoalescing.get_value_source() != ValueSource.DEFAULT:
+            py_str += [f"cfg.MpiMessageCoalescing.put({MpiMessageCoalescing.get()})"]
+        if MpiMessageCoalescingSize.get_value_source() != ValueSource.DEFAULT:
+            py_str += [
+                f"cfg.MpiMessageCoalescingSize.put({MpiMessageCoalescingSize.get()})"
+            ]
+        if MpiMessageCoalescingInterval.get_value_source() != ValueSource.DEFAULT:
+            py_str += [
+                f"cfg.MpiMessageCoalescingInterval.put({MpiMessageCoalescingInterval.get()})"
+            ]
         if runtime_env:
             py_str += [f"cfg.MpiRuntimeEnv.put({runtime_env})"]
             env_vars = ["import os"]
@@ -332,6 +399,8 @@ def shutdown():
         )
         if op_type != common.Operation.SHUTDOWN:
             raise ValueError(f"Got wrong operation type {op_type}.")
+        communication.MessageCoalescer.get_instance().close(mpi_state.global_comm)
+        LocalObjectStore.get_instance().finalize()
         SharedObjectStore.get_instance().finalize()
         if not MPI.Is_finalized():
             MPI.Finalize()
@@ -427,7 +496,6 @@ def get(data_ids):
     values = [object_store.get(data_id) for data_id in data_ids]
 
     # Initiate reference count based cleaup
-    # if all the tasks were completed
     garbage_collector.regular_cleanup()
 
     return values if is_list else values[0]
@@ -499,7 +567,6 @@ def wait(data_ids, num_returns=1):
     not_ready = [data_id_map[data_id] for data_id in not_ready]
 
     # Initiate reference count based cleaup
-    # if all the tasks were completed
     garbage_collector.regular_cleanup()
 
     return ready, not_ready
@@ -530,15 +597,21 @@ def submit(task, *args, num_returns=1, **kwargs):
         * if `num_returns == 0`, ``None`` will be returned.
     """
     # Initiate reference count based cleanup
-    # if all the tasks were completed
     garbage_collector.regular_cleanup()
 
-    dest_rank = RoundRobin.get_instance().schedule_rank()
+    dest_rank = get_scheduler().schedule_rank(args, kwargs)
 
     local_store = LocalObjectStore.get_instance()
     output_ids = local_store.generate_output_data_id(
         dest_rank, garbage_collector, num_returns
     )
+    # A task without returns still gets an output data ID
+    # so that the garbage collector can find out when the task is complete
+    task_output_ids = (
+        output_ids
+        if output_ids is not None
+        else local_store.generate_output_data_id(dest_rank, garbage_collector)
+    )
 
     logger.debug("REMOTE OPERATION")
     logger.debug(
@@ -562,7 +635,7 @@ def submit(task, *args, num_returns=1, **kwargs):
         # tuple cannot be serialized iteratively and it will fail if some internal data cannot be serialized using Pickle
         "args": list(args),
         "kwargs": kwargs,
-        "output": output_ids,
+        "output": task_output_ids,
     }
     async_operations = AsyncOperations.get_instance()
     h_list, _ = communication.isend_complex_operation(
@@ -575,11 +648,95 @@ def submit(task, *args, num_returns=1, **kwargs):
     async_operations.extend(h_list)
 
     # Track the task execution
-    garbage_collector.increment_task_counter()
+    garbage_collector.track_task(task_output_ids, task, args, kwargs)
 
     return output_ids
 
 
+def submit_many(task, args_list, num_returns=1):
+    """
+    Execute function on worker processes for every set of positional arguments.
+
+    Parameters
+    ----------
+    task : callable
+        Function to be executed in the workers.
+    args_list : list
+        A list of lists with positional arguments to be passed in the `task`.
+    num_returns : int, default: 1
+        Number of results to be returned from every `task` call.
+
+    Returns
+    -------
+    list
+        A list of returns, one per call. Type of returns depends on `num_returns` value:
+
+        * if `num_returns == 1`, ``DataID`` will be returned.
+        * if `num_returns > 1`, list of ``DataID``-s will be returned.
+        * if `num_returns == 0`, ``None`` will be returned.
+
+    Notes
+    -----
+    The calls are grouped by destination rank so that a single ``EXECUTE_BATCH`` operation
+    is sent to every rank involved.
+    """
+    # Initiate reference count based cleanup
+    garbage_collector.regular_cleanup()
+
+    scheduler = get_scheduler()
+    local_store = LocalObjectStore.get_instance()
+    # {dest_rank: [{"args": list, "output": output_ids}, ...]}
+    batches = defaultdict(list)
+    output_ids_list = []
+    for args in args_list:
+        dest_rank = scheduler.schedule_rank(args, {})
+        output_ids = local_store.generate_output_data_id(
+            dest_rank, garbage_collector, num_returns
+        )
+        # A task without returns still gets an output data ID
+        # so that the garbage collector can find out when the task is complete
+        task_output_ids = (
+            output_ids
+            if output_ids is not None
+            else local_store.generate_output_data_id(dest_rank, garbage_collector)
+        )
+        push_data(dest_rank, args)
+        batches[dest_rank].append(
+            {
+                # tuple cannot be serialized iteratively and it will fail if some internal data cannot be serialized using Pickle
+                "args": list(args),
+                "output": task_output_ids,
+            }
+        )
+        output_ids_list.append(output_ids)
+        # Track the task execution
+        garbage_collector.track_task(task_output_ids, task, args)
+
+    logger.debug("REMOTE BATCH OPERATION")
+
+    async_operations = AsyncOperations.get_instance()
+    for dest_rank, requests in batches.items():
+        logger.debug(
+            "REMOTE batch of {} tasks to {} rank".format(len(requests), dest_rank)
+        )
+        push_data(dest_rank, task)
+        operation_type = common.Operation.EXECUTE_BATCH
+        operation_data = {
+            "task": task,
+            "requests": requests,
+        }
+        h_list, _ = communication.isend_complex_operation(
+            communication.MPIState.get_instance().global_comm,
+            operation_type,
+            operation_data,
+            dest_rank,
+            is_serialized=False,
+        )
+        async_operations.extend(h_list)
+
+    return output_ids_list
+
+
 # ---------------------------- #
 # unidist termination handling #
 # ---------------------------- #
@@ -4,8 +4,13 @@
 
 """Common functionality related to `controller`."""
 
+import functools
 import itertools
+import threading
+import time
+from collections import defaultdict
 
+from unidist.config import MpiSchedulingPolicy, MpiTaskSlots
 from unidist.core.backends.common.data_id import is_data_id
 import unidist.core.backends.mpi.core.common as common
 import unidist.core.backends.mpi.core.communication as communication
@@ -19,6 +24,9 @@ from unidist.core.backends.mpi.core.serialization import (
 
 logger = common.get_logger("common", "common.log")
 
+# Serializes receiving of the requested data by the threads executing tasks concurrently
+_pull_data_lock = threading.Lock()
+
 
 class RoundRobin:
     __instance = None
@@ -50,10 +58,17 @@ class RoundRobin:
             cls.__instance = RoundRobin()
         return cls.__instance
 
-    def schedule_rank(self):
+    def schedule_rank(self, args=None, kwargs=None):
         """
         Find the next non-reserved rank for task/actor-task execution.
 
+        Parameters
+        ----------
+        args : iterable, optional
+            Positional arguments of the task. Not used by ``RoundRobin``.
+        kwargs : dict, optional
+            Keyword arguments of the task. Not used by ``RoundRobin``.
+
         Returns
         -------
         int
@@ -110,6 +125,305 @@ class RoundRobin:
         )
 
 
+class LocalityAwareScheduler(RoundRobin):
+    """
+    Class that schedules a task on the rank that already holds most of the task input data.
+
+    Notes
+    -----
+    A rank that owns task inputs takes precedence over a rank that only shares a host
+    with the inputs. Ties are resolved in a round-robin fashion. If none of the ranks holds
+    the task inputs, the next non-reserved rank is chosen by ``RoundRobin``.
+    """
+
+    __instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """
+        Get instance of ``LocalityAwareScheduler``.
+
+        Returns
+        -------
+        LocalityAwareScheduler
+        """
+        if cls.__instance is None:
+            cls.__instance = LocalityAwareScheduler()
+        return cls.__instance
+
+    def _collect_data_ids(self, value, data_ids):
+        """
+        Find all data IDs in `value` recursively.
+
+        Parameters
+        ----------
+        value : iterable or dict or object
+            Task arguments to inspect.
+        data_ids : list
+            List to append the found data IDs to.
+        """
+        if isinstance(value, (list, tuple)):
+            for v in value:
+                self._collect_data_ids(v, data_ids)
+        elif isinstance(value, dict):
+            for v in value.values():
+                self._collect_data_ids(v, data_ids)
+        elif is_data_id(value):
+            data_ids.append(value)
+
+    def _get_data_size(self, data_id):
+        """
+        Get the size in bytes of the data associated with `data_id` if it is known.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+
+        Returns
+        -------
+        int
+            The data size in bytes.
+
+        Notes
+        -----
+        The size of data produced by a remote task is unknown to the current process
+        so such data weighs one byte, i.e., it is only counted by the number of IDs.
+        """
+        local_store = LocalObjectStore.get_instance()
+        shared_store = SharedObjectStore.get_instance()
+        if shared_store.contains(data_id):
+            shared_info = shared_store.get_shared_info(data_id)
+            return shared_info["s_data_len"] + sum(shared_info["raw_buffers_len"])
+        if local_store.is_already_serialized(data_id):
+            serialized_data = local_store.get_serialized_data(data_id)
+            return len(serialized_data["s_data"]) + sum(
+                len(buf) for buf in serialized_data["raw_buffers"]
+            )
+        return 1
+
+    def schedule_rank(self, args=None, kwargs=None):
+        """
+        Find the non-reserved rank holding most of the task input data.
+
+        Parameters
+        ----------
+        args : iterable, optional
+            Positional arguments of the task.
+        kwargs : dict, optional
+            Keyword arguments of the task.
+
+        Returns
+        -------
+        int
+            A rank number.
+        """
+        data_ids = []
+        self._collect_data_ids(args, data_ids)
+        self._collect_data_ids(kwargs, data_ids)
+        if not data_ids:
+            return super().schedule_rank()
+
+        mpi_state = communication.MPIState.get_instance()
+        local_store = LocalObjectStore.get_instance()
+        shared_store = SharedObjectStore.get_instance()
+        # {rank: bytes}, input bytes owned by the rank
+        rank_bytes = defaultdict(int)
+        # {host: bytes}, input bytes residing on the host
+        host_bytes = defaultdict(int)
+        for data_id in set(data_ids):
+            if shared_store.contains(data_id):
+                # The data resides in shared memory of the current host
+                host_bytes[mpi_state.host] += self._get_data_size(data_id)
+            elif local_store.contains_data_owner(data_id):
+                owner_rank = local_store.get_data_owner(data_id)
+                data_size = self._get_data_size(data_id)
+                rank_bytes[owner_rank] += data_size
+                host_bytes[mpi_state.host_by_rank[owner_rank]] += data_size
+
+        def get_score(rank):
+            return rank_bytes[rank], host_bytes[mpi_state.host_by_rank[rank]]
+
+        candidates = [
+            rank
+            for rank in mpi_state.workers
+            if rank != mpi_state.global_rank and rank not in self.reserved_ranks
+        ]
+        if not candidates:
+            raise Exception("All ranks blocked")
+        best_score = max(get_score(rank) for rank in candidates)
+        if best_score == (0, 0):
+            return super().schedule_rank()
+
+        # Go rank by rank to spread the tasks between the ranks with equal locality
+        for _ in mpi_state.workers:
+            rank = next(self.rank_to_schedule)
+            if rank not in self.reserved_ranks and get_score(rank) == best_score:
+                logger.debug(
+                    f"LocalityAwareScheduler schedules a task to rank {rank} "
+                    + f"holding {best_score[0]} bytes of input data on the rank "
+                    + f"and {best_score[1]} bytes on the host"
+                )
+                return rank
+        return super().schedule_rank()
+
+
+class LoadAwareScheduler(RoundRobin):
+    """
+    Class that schedules a task on the least loaded rank.
+
+    Notes
+    -----
+    The load of a rank is estimated by the number of tasks that are not completed yet
+    per task slot multiplied by the average task duration on the rank. Workers report their queue depth and
+    task durations along with every ``TASK_DONE`` message, which gets to the root monitor
+    either directly or through the monitor of the worker host. These statistics
+    are requested from the monitor not more often than the internal time threshold, whereas
+    tasks submitted in between are accounted locally.
+    """
+
+    __instance = None
+
+    def __init__(self):
+        super().__init__()
+        # Number of tasks submitted to a rank {rank: int}
+        self._submitted_task_counter = defaultdict(int)
+        # Number of tasks a rank can run at the same time
+        self._task_slots = MpiTaskSlots.get()
+        # Statistics reported by the monitor {rank: dict}
+        self._worker_load = {}
+        # Load statistics refresh frequency settings
+        self._time_threshold = 0.1  # seconds
+        self._timestamp = 0  # seconds
+
+    @classmethod
+    def get_instance(cls):
+        """
+        Get instance of ``LoadAwareScheduler``.
+
+        Returns
+        -------
+        LoadAwareScheduler
+        """
+        if cls.__instance is None:
+            cls.__instance = LoadAwareScheduler()
+        return cls.__instance
+
+    def _update_worker_load(self):
+        """Request load statistics of workers from the root monitor."""
+        mpi_state = communication.MPIState.get_instance()
+        root_monitor = mpi_state.get_monitor_by_worker_rank(communication.MPIRank.ROOT)
+        # We use a blocking send and recv here because we have to wait for
+        # completion of the communication, which is necessary for the pipeline to continue.
+        communication.mpi_send_operation(
+            mpi_state.global_comm,
+            common.Operation.GET_WORKER_LOAD,
+            root_monitor,
+        )
+        self._worker_load = communication.mpi_recv_object(
+            mpi_state.global_comm,
+            root_monitor,
+        )
+        self._timestamp = time.perf_counter()
+
+    def _get_load(self, rank, default_task_duration):
+        """
+        Estimate the load of a rank.
+
+        Parameters
+        ----------
+        rank : int
+            A rank number.
+        default_task_duration : float
+            Task duration to use if the rank has not completed any task yet.
+
+        Returns
+        -------
+        float
+            Estimated time to complete the tasks of the rank.
+        """
+        worker_load = self._worker_load.get(rank, None)
+        if worker_load is None:
+            return (
+                self._submitted_task_counter[rank]
+                / self._task_slots
+                * default_task_duration
+            )
+        pending_task_count = max(
+            self._submitted_task_counter[rank] - worker_load["executed_task_counter"],
+            worker_load["queue_depth"],
+        )
+        # Occupied task slots are drained in parallel
+        return pending_task_count / self._task_slots * worker_load["task_duration"]
+
+    def schedule_rank(self, args=None, kwargs=None):
+        """
+        Find the least loaded non-reserved rank for task/actor-task execution.
+
+        Parameters
+        ----------
+        args : iterable, optional
+            Positional arguments of the task. Not used by ``LoadAwareScheduler``.
+        kwargs : dict, optional
+            Keyword arguments of the task. Not used by ``LoadAwareScheduler``.
+
+        Returns
+        -------
+        int
+            A rank number.
+        """
+        if time.perf_counter() - self._timestamp > self._time_threshold:
+            self._update_worker_load()
+
+        mpi_state = communication.MPIState.get_instance()
+        task_durations = [
+            worker_load["task_duration"] for worker_load in self._worker_load.values()
+        ]
+        default_task_duration = (
+            sum(task_durations) / len(task_durations) if task_durations else 1
+        )
+
+        next_rank = None
+        min_load = None
+        # Go rank by rank to spread the tasks between the ranks with equal load
+        for _ in mpi_state.workers:
+            rank = next(self.rank_to_schedule)
+            if rank in self.reserved_ranks:
+                continue
+            load = self._get_load(rank, default_task_duration)
+            if min_load is None or load < min_load:
+                next_rank = rank
+                min_load = load
+
+        if next_rank is None:
+            raise Exception("All ranks blocked")
+
+        self._submitted_task_counter[next_rank] += 1
+        return next_rank
+
+
+def get_scheduler():
+    """
+    Get the scheduler used for task/actor-task placement.
+
+    Returns
+    -------
+    RoundRobin
+        A scheduler instance.
+
+    Notes
+    -----
+    The scheduler is chosen in depend on ``MpiSchedulingPolicy`` config value.
+    """
+    scheduling_policy = MpiSchedulingPolicy.get()
+    if scheduling_policy == "locality":
+        return LocalityAwareScheduler.get_instance()
+    elif scheduling_policy == "load":
+        return LoadAwareScheduler.get_instance()
+    else:
+        return RoundRobin.get_instance()
+
+
 def pull_data(comm, owner_rank=None):
     """
     Receive data from another MPI process.
@@ -214,23 +528,26 @@ def request_worker_data(data_ids):
         # we can receive the data from the first available worker below
         async_operations.extend(h_list)
 
-    data_count = 0
-    # If some dataids raise an exception it will be captured in exception_raised variable and raised after the while loop ends.
-    exception_raised = None
-    while data_count < len(data_ids):
-        # Remote data gets available in the local store inside `pull_data`
-        complex_data = pull_data(mpi_state.global_comm)
-        if isinstance(complex_data["data"], Exception) and exception_raised is None:
-            exception_raised = complex_data["data"]
-        data_id = complex_data["id"]
-        if data_id in data_ids:
-            data_count += 1
-        else:
-            raise RuntimeError(
-                f"DataID {data_id} isn't in the requested list {data_ids}"
-            )
-    if exception_raised:
-        raise exception_raised
+    def pull_available_data():
+        # Several threads can request data concurrently (see ``MpiTaskSlots``),
+        # so a thread can receive the data requested by another one.
+        # The data gets available to the requester in the local store in that case.
+        with _pull_data_lock:
+            if communication.mpi_iprobe(
+                mpi_state.global_comm, tag=common.MPITag.OBJECT_BLOCKING
+            ):
+                pull_data(mpi_state.global_comm)
+        return all(local_store.contains(data_id) for data_id in data_ids)
+
+    # Send the requests buffered for coalescing before waiting for the data
+    communication.MessageCoalescer.get_instance().flush(mpi_state.global_comm)
+    # Remote data gets available in the local store inside `pull_data`
+    communication.AdaptivePoller.get_instance().wait(pull_available_data)
+    # If some data IDs raise an exception, the first one is raised
+    for data_id in data_ids:
+        data = local_store.get(data_id)
+        if isinstance(data, Exception):
+            raise data
 
 
 def _push_local_data(dest_rank, data_id, is_blocking_op, is_serialized):
@@ -285,11 +602,22 @@ def _push_local_data(dest_rank, data_id, is_blocking_op, is_serialized):
                 dest_rank,
                 is_serialized=is_serialized,
             )
-            async_operations.extend(h_list)
 
         if not is_serialized or not local_store.is_already_serialized(data_id):
             local_store.cache_serialized_data(data_id, serialized_data)
 
+        # The serialized data is dropped once all the sends of it are complete
+        if is_blocking_op:
+            local_store.discard_serialized_data(data_id)
+        else:
+            local_store.add_pending_send(data_id)
+            async_operations.extend(
+                h_list,
+                on_complete=functools.partial(
+                    local_store.complete_pending_send, data_id
+                ),
+            )
+
         #  Remember pushed id
         local_store.cache_send_info(data_id, dest_rank)
 
@@ -363,6 +691,8 @@ def _push_data_owner(dest_rank, data_id):
         dest_rank,
     )
     async_operations.extend(h_list)
+    # Remember the rank knows about the data ID for targeted cleanup
+    local_store.cache_send_info(data_id, dest_rank)
 
 
 def push_data(dest_rank, value, is_blocking_op=False):
@@ -5,12 +5,15 @@
 """`GarbageCollector` functionality."""
 
 import time
+from collections import defaultdict
 
+from unidist.core.backends.common.data_id import is_data_id
 import unidist.core.backends.mpi.core.common as common
 import unidist.core.backends.mpi.core.communication as communication
 from unidist.core.backends.mpi.core.async_operations import AsyncOperations
 from unidist.core.backends.mpi.core.serialization import SimpleDataSerializer
 from unidist.core.backends.mpi.core.local_object_store import LocalObjectStore
+from unidist.core.backends.mpi.core.shared_object_store import SharedObjectStore
 
 
 logger = common.get_logger("utils", "utils.log")
@@ -28,6 +31,8 @@ class GarbageCollector:
     Notes
     -----
     Cleanup relies on internal threshold settings.
+    An out-of-scope data ID is cleaned up only once all the submitted tasks
+    referring to it either as an input or as an output are complete.
     """
 
     def __init__(self, local_store):
@@ -36,30 +41,53 @@ class GarbageCollector:
         self._cleanup_threshold = 5
         self._time_threshold = 1  # seconds
         self._timestamp = 0  # seconds
-        # Cleanup list of tuple(owner_rank, data_number)
+        # Cleanup list of tuple((owner_rank, data_number), ranks holding the data)
         self._cleanup_list = []
         self._cleanup_list_threshold = 10
         # Reference to the global object store
         self._local_store = local_store
-        # Task submitted counter
-        self._task_counter = 0
+        # Data IDs referred by uncompleted tasks {(owner_rank, data_number): task_count}
+        self._task_references = defaultdict(int)
+        # Uncompleted tasks {(owner_rank, data_number) of the first output: [(owner_rank, data_number), ...]}
+        self._uncompleted_tasks = {}
 
     def _send_cleanup_request(self, cleanup_list):
         """
-        Send a list of data IDs to be deleted for each worker to cleanup local storages.
+        Send data IDs to be deleted to the ranks holding them to cleanup local storages.
 
         Parameters
         ----------
         cleanup_list : list
-            List of data IDs.
+            List of tuples of a data ID and the ranks holding the data.
+
+        Notes
+        -----
+        The data IDs are also sent to the root monitor so that it forgets them as completed.
+        If shared object store is allocated, the data IDs are also sent
+        to the monitors of the hosts the data might be put in shared memory on.
         """
         logger.debug(f"Send cleanup list - {cleanup_list}")
         mpi_state = communication.MPIState.get_instance()
-        # Cache serialized list of data IDs
-        s_cleanup_list = SimpleDataSerializer().serialize_pickle(cleanup_list)
+        root_monitor = mpi_state.get_monitor_by_worker_rank(communication.MPIRank.ROOT)
+        is_shared_store_allocated = SharedObjectStore.get_instance().is_allocated()
+        # {rank: [(owner_rank, data_number), ...]}
+        cleanup_lists = defaultdict(list)
+        for data_id, ranks in cleanup_list:
+            dest_ranks = set(ranks)
+            dest_ranks.add(root_monitor)
+            if is_shared_store_allocated:
+                dest_ranks.update(
+                    mpi_state.get_monitor_by_worker_rank(rank) for rank in ranks
+                )
+                if data_id[0] == mpi_state.global_rank:
+                    dest_ranks.add(mpi_state.get_monitor_by_worker_rank())
+            for rank in dest_ranks:
+                cleanup_lists[rank].append(data_id)
+
         async_operations = AsyncOperations.get_instance()
-        for rank_id in mpi_state.workers + mpi_state.monitor_processes:
+        for rank_id, data_ids in cleanup_lists.items():
             if rank_id != mpi_state.global_rank:
+                s_cleanup_list = SimpleDataSerializer().serialize_pickle(data_ids)
                 h_list = communication.isend_serialized_operation(
                     mpi_state.global_comm,
                     common.Operation.CLEANUP,
@@ -68,15 +96,88 @@ class GarbageCollector:
                 )
                 async_operations.extend(h_list)
 
-    def increment_task_counter(self):
+    def _get_data_id_keys(self, value, keys):
         """
-        Track task submission number.
+        Traverse an object and collect the keys of all found data IDs.
+
+        Parameters
+        ----------
+        value : object
+            Object to traverse recursively.
+        keys : list
+            List to append tuples of the owner rank and data number to.
+        """
+        if is_data_id(value):
+            keys.append((value.owner_rank, value.data_number))
+        elif type(value) in (list, tuple):
+            for item in value:
+                self._get_data_id_keys(item, keys)
+        elif type(value) is dict:
+            for item in value.values():
+                self._get_data_id_keys(item, keys)
+
+    def track_task(self, output_ids, *task_data):
+        """
+        Track task submission.
+
+        Data IDs of the task are not cleaned up until the task is complete.
+
+        Parameters
+        ----------
+        output_ids : unidist.core.backends.mpi.core.common.MpiDataID or list
+            Output data ID(s) of the task.
+        *task_data : iterable
+            Function, arguments or any other objects of the task, which can contain data IDs.
 
         Notes
         -----
         For cleanup purpose.
         """
-        self._task_counter += 1
+        keys = []
+        self._get_data_id_keys(output_ids, keys)
+        task_key = keys[0]
+        self._get_data_id_keys(task_data, keys)
+        for key in keys:
+            self._task_references[key] += 1
+        self._uncompleted_tasks[task_key] = keys
+
+    def _update_completed_tasks(self):
+        """
+        Release the data IDs referred by the tasks completed since the previous update.
+
+        Notes
+        -----
+        Data IDs completed on workers are requested from the root monitor.
+        """
+        mpi_state = communication.MPIState.get_instance()
+        root_monitor = mpi_state.get_monitor_by_worker_rank(communication.MPIRank.ROOT)
+        # We use a blocking send here because we have to wait for
+        # completion of the communication, which is necessary for the pipeline to continue.
+        communication.mpi_send_operation(
+            mpi_state.global_comm,
+            common.Operation.GET_COMPLETED_DATA_IDS,
+            root_monitor,
+        )
+        completed_data_ids = communication.mpi_recv_object(
+            mpi_state.global_comm,
+            root_monitor,
+        )
+        for completed_data_id in completed_data_ids:
+            # Only the first output of a task is used as the task key
+            keys = self._uncompleted_tasks.pop(completed_data_id, None)
+            if keys is None:
+                continue
+            for key in keys:
+                if self._task_references[key] == 1:
+                    del self._task_references[key]
+                else:
+                    self._task_references[key] -= 1
+
+        logger.debug(
+            "Completed data IDs count {}, uncompleted tasks count {}".format(
+                len(completed_data_ids), len(self._uncompleted_tasks)
+            )
+        )
 
     def collect(self, data_id):
         """
@@ -86,16 +187,25 @@ class GarbageCollector:
 
         Parameters
         ----------
-        data_id_metadata : tuple
-            Tuple of the owner rank and data number describing a ``MpiDataID``.
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            The data ID being destroyed.
+
+        Notes
+        -----
+        The ranks holding the data are found out right away
+        since the local object store forgets about the data ID once it is destroyed.
         """
-        self._cleanup_list.append(data_id)
+        ranks = self._local_store.get_sent_ranks(data_id)
+        if self._local_store.contains_data_owner(data_id):
+            ranks.add(self._local_store.get_data_owner(data_id))
+        self._cleanup_list.append(((data_id.owner_rank, data_id.data_number), ranks))
 
     def regular_cleanup(self):
         """
         Cleanup all garbage collected IDs from local and all workers object storages.
 
         Cleanup triggers based on internal threshold settings.
+        Data IDs referred by uncompleted tasks are kept for later cleanup.
         """
         logger.debug("Cleanup list len - {}".format(len(self._cleanup_list)))
         logger.debug(
@@ -113,33 +223,26 @@ class GarbageCollector:
                 if (timestamp_snapshot - self._timestamp) > self._time_threshold:
                     logger.debug("Cleanup counter {}".format(self._cleanup_counter))
 
-                    mpi_state = communication.MPIState.get_instance()
-                    root_monitor = mpi_state.get_monitor_by_worker_rank(
-                        communication.MPIRank.ROOT
-                    )
-                    # Compare submitted and executed tasks
-                    # We use a blocking send here because we have to wait for
-                    # completion of the communication, which is necessary for the pipeline to continue.
-                    communication.mpi_send_operation(
-                        mpi_state.global_comm,
-                        common.Operation.GET_TASK_COUNT,
-                        root_monitor,
-                    )
-                    executed_task_counter = communication.mpi_recv_object(
-                        mpi_state.global_comm,
-                        root_monitor,
-                    )
+                    if self._uncompleted_tasks:
+                        self._update_completed_tasks()
+
+                    collected_list, self._cleanup_list = self._cleanup_list, []
+                    cleanup_list = []
+                    for data_id, ranks in collected_list:
+                        if data_id in self._task_references:
+                            self._cleanup_list.append((data_id, ranks))
+                        else:
+                            cleanup_list.append((data_id, ranks))
 
                     logger.debug(
-                        "Submitted task count {} vs executed task count {}".format(
-                            self._task_counter, executed_task_counter
+                        "Postponed cleanup of {} data IDs".format(
+                            len(self._cleanup_list)
                         )
                     )
-                    if executed_task_counter == self._task_counter:
-                        self._send_cleanup_request(self._cleanup_list)
-                        self._cleanup_list.clear()
-                        self._cleanup_counter += 1
-                        self._timestamp = time.perf_counter()
+                    if cleanup_list:
+                        self._send_cleanup_request(cleanup_list)
+                    self._cleanup_counter += 1
+                    self._timestamp = time.perf_counter()
             else:
                 self._cleanup_counter += 1
 
@@ -4,10 +4,73 @@
 
 """`LocalObjectStore` functionality."""
 
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+import threading
 import weakref
+from collections import OrderedDict
 
+from unidist.config.backends.mpi.envvars import (
+    MpiLocalObjectStoreMemory,
+    MpiPickleThreshold,
+    MpiSpillDirectory,
+)
 import unidist.core.backends.mpi.core.common as common
 import unidist.core.backends.mpi.core.communication as communication
+from unidist.core.backends.mpi.core.serialization import (
+    serialize_complex_data,
+    deserialize_complex_data,
+)
+from unidist.core.backends.mpi.core.shared_object_store import SharedObjectStore
+
+
+def _get_data_size(data):
+    """
+    Estimate the number of bytes `data` takes in memory.
+
+    Parameters
+    ----------
+    data : object
+        Data to estimate the size of.
+
+    Returns
+    -------
+    int
+
+    Notes
+    -----
+    NumPy arrays and pandas objects report the size of their buffers with ``sys.getsizeof``,
+    items of lists, tuples and dicts are taken into account one level deep.
+    """
+    size = sys.getsizeof(data, 0)
+    if isinstance(data, (list, tuple)):
+        size += sum(sys.getsizeof(item, 0) for item in data)
+    elif isinstance(data, dict):
+        size += sum(
+            sys.getsizeof(key, 0) + sys.getsizeof(value, 0)
+            for key, value in data.items()
+        )
+    return size
+
+
+def _remove_spill_file(path):
+    """
+    Remove the file of spilled data.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file.
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        # The file may still be mapped into memory on some platforms,
+        # it is removed along with the spill directory then.
+        pass
 
 
 class LocalObjectStore:
@@ -36,6 +99,24 @@ class LocalObjectStore:
         self._data_id_counter = 0
         # Data serialized cache
         self._serialization_cache = weakref.WeakKeyDictionary()
+        # The number of incomplete async sends of serialized data {DataID : int}
+        self._pending_send_counter = {}
+        # Memory taken by data that can be spilled to disk {weakref(DataID) : int}
+        # in the least recently used order
+        self._memory_usage_map = OrderedDict()
+        self._memory_usage = 0
+        # Weak references to collected data IDs to remove from `_memory_usage_map`
+        self._collected_data_ids = []
+        # Data spilled to disk {DataID : dict}
+        self._spilled_data_map = weakref.WeakKeyDictionary()
+        self._spill_directory = None
+        self._spill_lock = threading.Lock()
+        self._spill_stats = {
+            "spill_count": 0,
+            "spilled_bytes": 0,
+            "restore_count": 0,
+            "restored_bytes": 0,
+        }
 
     @classmethod
     def get_instance(cls):
@@ -80,9 +161,18 @@ class LocalObjectStore:
             An ID to data.
         data : object
             Data to be put.
+
+        Notes
+        -----
+        If the memory budget set with :class:`~unidist.config.backends.mpi.envvars.MpiLocalObjectStoreMemory`
+        is exceeded, least recently used data is spilled to disk.
         """
         self._data_map[data_id] = data
         self.maybe_update_data_id_map(data_id)
+        if MpiLocalObjectStoreMemory.get() is not None:
+            with self._spill_lock:
+                self._update_memory_usage(data_id, data)
+                self._spill_cold_data()
 
     def put_data_owner(self, data_id, rank):
         """
@@ -111,8 +201,23 @@ class LocalObjectStore:
         -------
         object
             Return local data associated with `data_id`.
-        """
-        return self._data_map[data_id]
+
+        Notes
+        -----
+        Data spilled to disk is restored transparently.
+        """
+        try:
+            data = self._data_map[data_id]
+        except KeyError:
+            if data_id not in self._spilled_data_map:
+                raise
+            return self._restore(data_id)
+        if MpiLocalObjectStoreMemory.get() is not None:
+            with self._spill_lock:
+                ref = weakref.ref(data_id)
+                if ref in self._memory_usage_map:
+                    self._memory_usage_map.move_to_end(ref)
+        return data
 
     def get_data_owner(self, data_id):
         """
@@ -144,7 +249,7 @@ class LocalObjectStore:
         bool
             Return the status if an object exist in local dictionary.
         """
-        return data_id in self._data_map
+        return data_id in self._data_map or data_id in self._spilled_data_map
 
     def contains_data_owner(self, data_id):
         """
@@ -266,6 +371,22 @@ class LocalObjectStore:
             rank in self._sent_data_map[data_id]
         )
 
+    def get_sent_ranks(self, data_id):
+        """
+        Get ranks the data ID has been sent to.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+
+        Returns
+        -------
+        set
+            Set of rank numbers.
+        """
+        return set(self._sent_data_map.get(data_id, ()))
+
     def cache_serialized_data(self, data_id, data):
         """
         Save serialized object for this `data_id`.
@@ -315,3 +436,233 @@ class LocalObjectStore:
             Cached serialized data associated with `data_id`.
         """
         return self._serialization_cache[data_id]
+
+    def add_pending_send(self, data_id):
+        """
+        Register an incomplete async send of the serialized data for this `data_id`.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+        """
+        self._pending_send_counter[data_id] = (
+            self._pending_send_counter.get(data_id, 0) + 1
+        )
+
+    def complete_pending_send(self, data_id):
+        """
+        Unregister a completed async send of the serialized data for this `data_id`.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+
+        Notes
+        -----
+        The serialized data is dropped once there are no more pending sends of it.
+        """
+        counter = self._pending_send_counter.pop(data_id) - 1
+        if counter > 0:
+            self._pending_send_counter[data_id] = counter
+        else:
+            self.discard_serialized_data(data_id)
+
+    def discard_serialized_data(self, data_id):
+        """
+        Drop the serialized data for this `data_id` if it is not needed anymore.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+
+        Notes
+        -----
+        The serialized data is kept while it is being sent or if
+        there is no deserialized data it can be produced from again.
+        """
+        if data_id not in self._pending_send_counter and (
+            data_id in self._data_map or data_id in self._spilled_data_map
+        ):
+            self._serialization_cache.pop(data_id, None)
+
+    def _get_spill_directory(self):
+        """
+        Get the directory to spill data to creating it on the first call.
+
+        Returns
+        -------
+        str
+        """
+        if self._spill_directory is None:
+            self._spill_directory = tempfile.mkdtemp(
+                prefix=f"unidist_spill_{communication.MPIState.get_instance().global_rank}_",
+                dir=MpiSpillDirectory.get(),
+            )
+        return self._spill_directory
+
+    def _update_memory_usage(self, data_id, data, size=None):
+        """
+        Take into account memory taken by `data` making it the most recently used one.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+        data : object
+            Data put into the store.
+        size : int, optional
+            The number of bytes `data` takes. It is estimated if not specified.
+
+        Notes
+        -----
+        Data smaller than :class:`~unidist.config.backends.mpi.envvars.MpiPickleThreshold`
+        and data located in the shared object store are not spilled so they are not taken into account.
+        """
+        while self._collected_data_ids:
+            self._memory_usage -= self._memory_usage_map.pop(
+                self._collected_data_ids.pop(), 0
+            )
+        if SharedObjectStore.get_instance().contains(data_id):
+            return
+        if size is None:
+            size = _get_data_size(data)
+        if size < MpiPickleThreshold.get():
+            return
+        ref = weakref.ref(data_id, self._collected_data_ids.append)
+        self._memory_usage += size - self._memory_usage_map.pop(ref, 0)
+        self._memory_usage_map[ref] = size
+
+    def _spill_cold_data(self):
+        """
+        Spill least recently used data to disk until the memory budget is met.
+
+        Notes
+        -----
+        The most recently used data is never spilled.
+        """
+        memory_limit = MpiLocalObjectStoreMemory.get()
+        while self._memory_usage > memory_limit and len(self._memory_usage_map) > 1:
+            ref, size = self._memory_usage_map.popitem(last=False)
+            self._memory_usage -= size
+            data_id = ref()
+            if data_id is None or data_id not in self._data_map:
+                continue
+            if data_id not in self._spilled_data_map and not self._spill(data_id):
+                continue
+            # The data can be restored from disk, so its serialized copy is not needed anymore
+            self._data_map.pop(data_id)
+            if data_id not in self._pending_send_counter:
+                self._serialization_cache.pop(data_id, None)
+
+    def _spill(self, data_id):
+        """
+        Write serialized data to a file on disk.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+
+        Returns
+        -------
+        bool
+            ``False`` if the data cannot be serialized and stays in memory, otherwise ``True``.
+
+        Notes
+        -----
+        Data that is restored and becomes cold once again is not written again
+        because the file is kept while the `data_id` is alive.
+        """
+        if data_id in self._serialization_cache:
+            serialized_data = self._serialization_cache[data_id]
+        else:
+            try:
+                serialized_data = serialize_complex_data(self._data_map[data_id])
+            except Exception:
+                # Spilling is best-effort, data that is not serializable is kept in memory
+                return False
+        s_data = serialized_data["s_data"]
+        raw_buffers = serialized_data["raw_buffers"]
+        path = os.path.join(
+            self._get_spill_directory(), f"{data_id.owner_rank}_{data_id.data_number}"
+        )
+        with open(path, "wb") as f:
+            f.write(s_data)
+            for raw_buffer in raw_buffers:
+                f.write(raw_buffer)
+        spilled_info = {
+            "path": path,
+            "s_data_len": len(s_data),
+            "raw_buffers_len": [len(raw_buffer) for raw_buffer in raw_buffers],
+            "buffer_count": serialized_data["buffer_count"],
+        }
+        self._spilled_data_map[data_id] = spilled_info
+        weakref.finalize(data_id, _remove_spill_file, path)
+        self._spill_stats["spill_count"] += 1
+        self._spill_stats["spilled_bytes"] += spilled_info["s_data_len"] + sum(
+            spilled_info["raw_buffers_len"]
+        )
+        return True
+
+    def _restore(self, data_id):
+        """
+        Read spilled data from disk.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+
+        Returns
+        -------
+        object
+            Data associated with `data_id`.
+
+        Notes
+        -----
+        The file is memory-mapped, so raw buffers of the data are not copied
+        and are read-only as the ones located in the shared object store.
+        """
+        spilled_info = self._spilled_data_map[data_id]
+        with open(spilled_info["path"], "rb") as f:
+            buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        s_data_last_index = spilled_info["s_data_len"]
+        s_data = buffer[:s_data_last_index]
+        prev_last_index = s_data_last_index
+        raw_buffers = []
+        for raw_buffer_len in spilled_info["raw_buffers_len"]:
+            raw_last_index = prev_last_index + raw_buffer_len
+            raw_buffers.append(buffer[prev_last_index:raw_last_index])
+            prev_last_index = raw_last_index
+        data = deserialize_complex_data(
+            s_data, raw_buffers, spilled_info["buffer_count"]
+        )
+        with self._spill_lock:
+            self._spill_stats["restore_count"] += 1
+            self._spill_stats["restored_bytes"] += prev_last_index
+            self._data_map[data_id] = data
+            # Restored data is a view of the file so its size is not estimated
+            self._update_memory_usage(data_id, data, size=prev_last_index)
+            self._spill_cold_data()
+        return data
+
+    def get_spill_stats(self):
+        """
+        Get statistics of spilling data to disk.
+
+        Returns
+        -------
+        dict
+            The number of spills and restores and the number of bytes spilled and restored.
+        """
+        return {**self._spill_stats, "memory_usage": self._memory_usage}
+
+    def finalize(self):
+        """
+        Remove the data spilled to disk.
+        """
+        if self._spill_directory is not None:
+            shutil.rmtree(self._spill_directory, ignore_errors=True)
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from libc.stdint cimport uint8_t, int64_t
+from libc.string cimport memcmp
 
 cimport memory
 
@@ -39,3 +40,27 @@ def fill(int64_t[:] buff, int64_t value):
     """
     with nogil:
         memory.fill(&buff[0], len(buff), value)
+
+def is_equal(const uint8_t[:] first, const uint8_t[:] second):
+    """
+    Check if two buffers have the same content.
+
+    Parameters
+    ----------
+    first : uint8_t[:]
+        The first buffer.
+    second : uint8_t[:]
+        The second buffer.
+
+    Returns
+    -------
+    bool
+    """
+    cdef int result
+    if len(first) != len(second):
+        return False
+    if len(first) == 0:
+        return True
+    with nogil:
+        result = memcmp(&first[0], &second[0], len(first))
+    return result == 0
@@ -4,6 +4,9 @@
 
 """Monitoring process."""
 
+from collections import defaultdict, deque
+import itertools
+
 try:
     import mpi4py
 except ImportError:
@@ -13,6 +16,7 @@ except ImportError:
 
 import unidist.core.backends.mpi.core.common as common
 import unidist.core.backends.mpi.core.communication as communication
+from unidist.core.backends.mpi.core.async_operations import AsyncOperations
 from unidist.core.backends.mpi.core.monitor.shared_memory_manager import (
     SharedMemoryManager,
 )
@@ -22,7 +26,6 @@ from unidist.core.backends.mpi.core.shared_object_store import SharedObjectStore
 mpi4py.rc(recv_mprobe=False, initialize=False)
 from mpi4py import MPI  # noqa: E402
 
-
 mpi_state = communication.MPIState.get_instance()
 logger_name = "monitor_{}".format(mpi_state.global_rank if mpi_state is not None else 0)
 log_file = "{}.log".format(logger_name)
@@ -34,6 +37,9 @@ class TaskCounter:
 
     def __init__(self):
         self.task_counter = 0
+        # Task count requests waiting for the host monitors to forward
+        # their aggregated ``TASK_DONE`` messages [(rank, {monitor_rank, ...}), ...]
+        self._pending_requests = deque()
 
     @classmethod
     def get_instance(cls):
@@ -48,20 +54,201 @@ class TaskCounter:
             cls.__instance = TaskCounter()
         return cls.__instance
 
-    def increment(self):
-        """Increment task counter by one."""
-        self.task_counter += 1
+    def increment(self, count=1):
+        """
+        Increment task counter.
+
+        Parameters
+        ----------
+        count : int, default: 1
+            The number of completed tasks.
+        """
+        self.task_counter += count
+
+    def _send_task_count(self, rank):
+        """
+        Send the task counter to the requester.
+
+        Parameters
+        ----------
+        rank : int
+            The rank of the requester.
+        """
+        # We use a blocking send here because the receiver is waiting for the result.
+        communication.mpi_send_object(
+            communication.MPIState.get_instance().global_comm,
+            self.task_counter,
+            rank,
+        )
+
+    def add_request(self, rank):
+        """
+        Add a task count request.
+
+        The host monitors are asked to forward their aggregated ``TASK_DONE`` messages
+        first so that the tasks they have been notified about are counted.
+
+        Parameters
+        ----------
+        rank : int
+            The rank of the requester.
+        """
+        mpi_state = communication.MPIState.get_instance()
+        host_monitors = {
+            rank_id
+            for rank_id in mpi_state.monitor_processes
+            if rank_id != mpi_state.global_rank
+        }
+        if not host_monitors:
+            self._send_task_count(rank)
+            return
+        async_operations = AsyncOperations.get_instance()
+        for monitor_rank in host_monitors:
+            h = communication.mpi_isend_operation(
+                mpi_state.global_comm,
+                common.Operation.FLUSH_TASK_DONE,
+                monitor_rank,
+            )
+            async_operations.extend([(h, common.Operation.FLUSH_TASK_DONE)])
+        self._pending_requests.append((rank, host_monitors))
+
+    def process_flush_reply(self, monitor_rank):
+        """
+        Process the reply of a host monitor to ``FLUSH_TASK_DONE`` operation.
+
+        The task counter is sent to the requesters whose requests are replied by all host monitors.
+
+        Parameters
+        ----------
+        monitor_rank : int
+            The rank of the host monitor.
+        """
+        # Requests are replied by a host monitor in the order they were sent to it
+        for _, host_monitors in self._pending_requests:
+            if monitor_rank in host_monitors:
+                host_monitors.remove(monitor_rank)
+                break
+        while self._pending_requests and not self._pending_requests[0][1]:
+            rank, _ = self._pending_requests.popleft()
+            self._send_task_count(rank)
+
+
+class DataNumberBitmap:
+    """
+    Set of data numbers of a single owner stored as a bitmap.
+
+    Notes
+    -----
+    The owner assigns data numbers sequentially, so the bitmap only covers
+    the window between the smallest and the largest data numbers in the set.
+    The window is moved forward once its leading data numbers are removed.
+    """
+
+    def __init__(self):
+        self._bitmap = bytearray()
+        # Data number the first bit of the bitmap corresponds to (always a multiple of 8)
+        self._offset = 0
+        self._count = 0
+
+    def __len__(self):
+        """
+        Get the number of data numbers in the set.
+
+        Returns
+        -------
+        int
+        """
+        return self._count
+
+    def __contains__(self, data_number):
+        """
+        Check if the data number is in the set.
+
+        Parameters
+        ----------
+        data_number : int
+            Data number to check.
+
+        Returns
+        -------
+        bool
+        """
+        index = data_number - self._offset
+        if index < 0 or (index >> 3) >= len(self._bitmap):
+            return False
+        return bool(self._bitmap[index >> 3] & (1 << (index & 7)))
+
+    def add(self, data_number):
+        """
+        Add the data number to the set.
+
+        Parameters
+        ----------
+        data_number : int
+            Data number to add.
+        """
+        if self._count == 0:
+            self._bitmap = bytearray()
+            self._offset = data_number & ~7
+        index = data_number - self._offset
+        if index < 0:
+            # A data number preceding the window, e.g., an output of a long-running task
+            shift = (-index + 7) >> 3
+            self._bitmap[0:0] = bytes(shift)
+            self._offset -= shift << 3
+            index = data_number - self._offset
+        byte_index = index >> 3
+        if byte_index >= len(self._bitmap):
+            self._bitmap.extend(bytes(byte_index - len(self._bitmap) + 1))
+        mask = 1 << (index & 7)
+        if not self._bitmap[byte_index] & mask:
+            self._bitmap[byte_index] |= mask
+            self._count += 1
+
+    def discard(self, data_number):
+        """
+        Remove the data number from the set if it is present.
+
+        Parameters
+        ----------
+        data_number : int
+            Data number to remove.
+        """
+        if data_number not in self:
+            return
+        index = data_number - self._offset
+        self._bitmap[index >> 3] &= ~(1 << (index & 7))
+        self._count -= 1
+        if self._count == 0:
+            self._bitmap = bytearray()
+            return
+        # Move the window forward. Deletion from the front of ``bytearray`` is cheap
+        # and every byte is skipped only once, so the cost is amortized.
+        empty_bytes = 0
+        while not self._bitmap[empty_bytes]:
+            empty_bytes += 1
+        if empty_bytes:
+            del self._bitmap[:empty_bytes]
+            self._offset += empty_bytes << 3
 
 
 class DataIDTracker:
     """
-    Class that keeps track of all completed (ready) data IDs.
+    Class that keeps track of completed (ready) data IDs.
+
+    Notes
+    -----
+    A data ID is forgotten once its owner cleans it up, so the memory consumed
+    depends on the number of live data IDs rather than on all data IDs ever completed.
     """
 
     __instance = None
 
     def __init__(self):
-        self.completed_data_ids = set()
+        # Completed data IDs not cleaned up yet {owner_rank: DataNumberBitmap}
+        self._completed_data_numbers = {}
+        # Completed data IDs not reported to their owners yet {owner_rank: [data_number, ...]}
+        self._unreported_data_ids = defaultdict(list)
 
     @classmethod
     def get_instance(cls):
@@ -76,6 +263,22 @@ class DataIDTracker:
             cls.__instance = DataIDTracker()
         return cls.__instance
 
+    def is_completed(self, data_id):
+        """
+        Check if the data ID is completed (ready).
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            Data ID to check.
+
+        Returns
+        -------
+        bool
+        """
+        data_numbers = self._completed_data_numbers.get(data_id.owner_rank, None)
+        return data_numbers is not None and data_id.data_number in data_numbers
+
     def add_to_completed(self, data_ids):
         """
         Add the given data IDs to the set of completed (ready) data IDs.
@@ -85,21 +288,240 @@ class DataIDTracker:
         data_ids : list
             List of data IDs to be added to the set of completed (ready) data IDs.
         """
-        self.completed_data_ids.update(data_ids)
+        for data_id in data_ids:
+            data_numbers = self._completed_data_numbers.get(data_id.owner_rank, None)
+            if data_numbers is None:
+                data_numbers = self._completed_data_numbers[
+                    data_id.owner_rank
+                ] = DataNumberBitmap()
+            data_numbers.add(data_id.data_number)
+            self._unreported_data_ids[data_id.owner_rank].append(data_id.data_number)
+
+    def remove(self, data_ids):
+        """
+        Forget the data IDs cleaned up by their owners.
+
+        Parameters
+        ----------
+        data_ids : list
+            List of data IDs that have been cleaned up.
+
+        Notes
+        -----
+        The owner cleans up a task output only after the task is reported as completed,
+        so a cleaned up data ID is never added to the completed data IDs again.
+        """
+        for data_id in data_ids:
+            data_numbers = self._completed_data_numbers.get(data_id.owner_rank, None)
+            if data_numbers is None:
+                continue
+            data_numbers.discard(data_id.data_number)
+            if not data_numbers:
+                del self._completed_data_numbers[data_id.owner_rank]
+
+    def pop_unreported(self, owner_rank):
+        """
+        Get the data IDs of the owner completed since the previous call.
+
+        Parameters
+        ----------
+        owner_rank : int
+            The rank of the process that owns the data IDs.
+
+        Returns
+        -------
+        list
+            List of tuples of the owner rank and data number describing ``MpiDataID``-s.
+
+        Notes
+        -----
+        The owner uses the completed data IDs to find out which tasks are finished
+        so that the data the tasks refer to can be cleaned up.
+        """
+        return [
+            (owner_rank, data_number)
+            for data_number in self._unreported_data_ids.pop(owner_rank, [])
+        ]
+
+
+class WorkerLoadTracker:
+    """
+    Class that keeps track of load statistics reported by workers.
+    """
+
+    __instance = None
+
+    def __init__(self):
+        # {rank: {"executed_task_counter": int, "queue_depth": int, "task_duration": float}}
+        self.worker_load = {}
+
+    @classmethod
+    def get_instance(cls):
+        """
+        Get instance of ``WorkerLoadTracker``.
+
+        Returns
+        -------
+        WorkerLoadTracker
+        """
+        if cls.__instance is None:
+            cls.__instance = WorkerLoadTracker()
+        return cls.__instance
+
+    def update(self, rank, queue_depth, task_duration, task_count=1):
+        """
+        Update load statistics of the worker once it has completed tasks.
+
+        Parameters
+        ----------
+        rank : int
+            The rank of the worker.
+        queue_depth : int
+            The number of tasks the worker has not completed yet.
+        task_duration : float
+            The average duration of recent tasks executed by the worker.
+        task_count : int, default: 1
+            The number of tasks completed since the previous update.
+        """
+        worker_load = self.worker_load.get(rank, None)
+        executed_task_counter = (
+            task_count
+            if worker_load is None
+            else worker_load["executed_task_counter"] + task_count
+        )
+        self.worker_load[rank] = {
+            "executed_task_counter": executed_task_counter,
+            "queue_depth": queue_depth,
+            "task_duration": task_duration,
+        }
+
+
+class TaskDoneForwarder:
+    """
+    Class that aggregates ``TASK_DONE`` messages of the host workers for the root monitor.
+
+    Notes
+    -----
+    Workers notify the monitor of their own host about completed tasks. A monitor of a host
+    other than the root one forwards the aggregated notifications to the root monitor
+    with a single ``TASK_DONE_BATCH`` message once it has no incoming operations to process
+    or the batch gets large. So the root monitor gets much fewer messages under load
+    while the notifications are not delayed when the monitor is idle.
+    """
+
+    __instance = None
+
+    # The number of tasks to forward a batch right away
+    max_task_count = 256
+
+    def __init__(self):
+        self._task_count = 0
+        self._output_ids = []
+        # Latest load statistics of the host workers
+        # {rank: {"task_count": int, "queue_depth": int, "task_duration": float}}
+        self._worker_load = {}
+
+    @classmethod
+    def get_instance(cls):
+        """
+        Get instance of ``TaskDoneForwarder``.
+
+        Returns
+        -------
+        TaskDoneForwarder
+        """
+        if cls.__instance is None:
+            cls.__instance = TaskDoneForwarder()
+        return cls.__instance
+
+    def add(self, rank, operation_data):
+        """
+        Add a ``TASK_DONE`` message of a worker to the batch.
+
+        Parameters
+        ----------
+        rank : int
+            The rank of the worker.
+        operation_data : dict
+            Data of the ``TASK_DONE`` message.
+        """
+        self._task_count += 1
+        self._output_ids.extend(operation_data["output_ids"])
+        worker_load = self._worker_load.get(rank, None)
+        self._worker_load[rank] = {
+            "task_count": 1 if worker_load is None else worker_load["task_count"] + 1,
+            "queue_depth": operation_data["queue_depth"],
+            "task_duration": operation_data["task_duration"],
+        }
+
+    def has_pending(self):
+        """
+        Check if there are messages not forwarded to the root monitor yet.
+
+        Returns
+        -------
+        bool
+        """
+        return self._task_count > 0
+
+    def is_full(self):
+        """
+        Check if the batch should be forwarded right away.
+
+        Returns
+        -------
+        bool
+        """
+        return self._task_count >= self.max_task_count
+
+    def forward(self, is_flush_reply=False):
+        """
+        Forward the batch to the root monitor.
+
+        Parameters
+        ----------
+        is_flush_reply : bool, default: False
+            Whether the batch is forwarded in reply to ``FLUSH_TASK_DONE`` operation.
+        """
+        mpi_state = communication.MPIState.get_instance()
+        operation_data = {
+            "task_count": self._task_count,
+            "output_ids": self._output_ids,
+            "worker_load": self._worker_load,
+            "is_flush_reply": is_flush_reply,
+        }
+        self._task_count = 0
+        self._output_ids = []
+        self._worker_load = {}
+        h_list = communication.isend_simple_operation(
+            mpi_state.global_comm,
+            common.Operation.TASK_DONE_BATCH,
+            operation_data,
+            mpi_state.get_monitor_by_worker_rank(communication.MPIRank.ROOT),
+        )
+        AsyncOperations.get_instance().extend(h_list)
 
 
 class WaitHandler:
     """
     Class that handles wait requests.
+
+    Notes
+    -----
+    Wait requests can be received from any rank and several requests can be pending at the same time.
+    The requests are indexed by the data IDs they are waiting for so that a completed data ID
+    is only checked against the requests waiting for it.
     """
 
     __instance = None
 
     def __init__(self):
-        self.completed_data_ids = set()
-        self.awaited_data_ids = []
-        self.ready = []
-        self.num_returns = 0
+        # Pending wait requests
+        # {request_id: {"rank": int, "data_ids": list, "ready": list, "num_returns": int}}
+        self._wait_requests = {}
+        # Requests waiting for a data ID {data_id: [request_id, ...]}
+        self._requests_by_data_id = defaultdict(list)
+        self._request_id_counter = itertools.count()
 
     @classmethod
     def get_instance(cls):
@@ -114,49 +536,133 @@ class WaitHandler:
             cls.__instance = WaitHandler()
         return cls.__instance
 
-    def add_wait_request(self, awaited_data_ids, num_returns):
+    def _send_reply(self, request_id):
+        """
+        Send the ready and not ready data IDs of the wait request to the requester.
+
+        Parameters
+        ----------
+        request_id : int
+            ID of the wait request.
+        """
+        request = self._wait_requests.pop(request_id)
+        not_ready = []
+        ready = set(request["ready"])
+        for data_id in request["data_ids"]:
+            if data_id in ready:
+                continue
+            not_ready.append(data_id)
+            request_ids = self._requests_by_data_id.get(data_id, None)
+            if request_ids is not None:
+                request_ids.remove(request_id)
+                if not request_ids:
+                    del self._requests_by_data_id[data_id]
+        operation_data = {
+            "ready": request["ready"],
+            "not_ready": not_ready,
+        }
+        communication.mpi_send_object(
+            communication.MPIState.get_instance().global_comm,
+            operation_data,
+            request["rank"],
+        )
+
+    def add_wait_request(self, rank, awaited_data_ids, num_returns):
         """
         Add a wait request for a list of data IDs and the number of data IDs to be awaited.
 
+        The request is answered right away if enough data IDs are already completed.
+
         Parameters
         ----------
+        rank : int
+            The rank of the requester.
         awaited_data_ids : list
             List of data IDs to be awaited.
         num_returns : int
             The number of ``DataID``-s that should be returned as ready.
         """
-        self.awaited_data_ids = awaited_data_ids
-        self.num_returns = num_returns
-
-    def process_wait_requests(self):
+        data_id_tracker = DataIDTracker.get_instance()
+        request_id = next(self._request_id_counter)
+        request = {
+            "rank": rank,
+            "data_ids": awaited_data_ids,
+            "ready": [],
+            "num_returns": num_returns,
+        }
+        self._wait_requests[request_id] = request
+        for data_id in awaited_data_ids:
+            if len(request["ready"]) == num_returns:
+                break
+            if data_id_tracker.is_completed(data_id):
+                request["ready"].append(data_id)
+        if len(request["ready"]) == num_returns:
+            self._send_reply(request_id)
+            return
+        ready = set(request["ready"])
+        for data_id in awaited_data_ids:
+            if data_id not in ready:
+                self._requests_by_data_id[data_id].append(request_id)
+
+    def process_wait_requests(self, completed_data_ids):
         """
-        Check if wait requests are pending to be processed.
+        Process pending wait requests for the newly completed data IDs.
 
-        Process pending wait requests and send the data_ids to the requester
-        if number of data IDs that are ready are equal to the num_returns.
+        Send the data IDs to the requester once the number of ready data IDs
+        is equal to the `num_returns` of the request.
+
+        Parameters
+        ----------
+        completed_data_ids : list
+            List of data IDs that have become completed (ready).
         """
-        data_id_tracker = DataIDTracker.get_instance()
-        i = 0
-        if self.awaited_data_ids:
-            while i < len(self.awaited_data_ids):
-                data_id = self.awaited_data_ids[i]
-                if data_id in data_id_tracker.completed_data_ids:
-                    self.ready.append(data_id)
-                    self.awaited_data_ids.remove(data_id)
-                    if len(self.ready) == self.num_returns:
-                        operation_data = {
-                            "ready": self.ready,
-                            "not_ready": self.awaited_data_ids,
-                        }
-                        communication.mpi_send_object(
-                            communication.MPIState.get_instance().global_comm,
-                            operation_data,
-                            communication.MPIRank.ROOT,
-                        )
-                        self.ready = []
-                        self.awaited_data_ids = []
-                else:
-                    i += 1
+        for data_id in completed_data_ids:
+            for request_id in self._requests_by_data_id.pop(data_id, []):
+                request = self._wait_requests[request_id]
+                request["ready"].append(data_id)
+                if len(request["ready"]) == request["num_returns"]:
+                    self._send_reply(request_id)
+
+
+def send_shared_data(shm_manager, request, dest_rank, replicas):
+    """
+    Send a chunk of the data located in shared memory or spilled to disk to another host.
+
+    Parameters
+    ----------
+    shm_manager : unidist.core.backends.mpi.core.monitor.shared_memory_manager.SharedMemoryManager
+        Manager of shared memory of the host.
+    request : dict
+        The data ID, the offset and the length of the chunk and whether to send
+        the monitors of the hosts holding copies of the data before the chunk.
+    dest_rank : int
+        Rank of the process requested the data.
+    replicas : dict
+        Monitors of the hosts holding copies of the data owned by the current host {data_id: [rank, ...]}.
+    """
+    data_id = request["id"]
+    if request["with_sources"]:
+        communication.mpi_send_object(
+            communication.MPIState.get_instance().global_comm,
+            data=replicas.get(data_id, []),
+            dest_rank=dest_rank,
+        )
+    reservation_info = shm_manager.get(data_id)
+    if reservation_info is not None:
+        first_index = reservation_info["first_index"] + request["offset"]
+        sh_buf = shm_manager.shared_store.get_shared_buffer(
+            first_index, first_index + request["length"]
+        )
+    elif shm_manager.is_spilled(data_id):
+        sh_buf = shm_manager.read_spilled(data_id, request["offset"], request["length"])
+    else:
+        raise RuntimeError(f"The monitor does not know the data id {data_id}")
+    communication.mpi_send_buffer(
+        communication.MPIState.get_instance().global_comm,
+        sh_buf,
+        dest_rank=dest_rank,
+        data_type=MPI.BYTE,
+    )
 
 
 def monitor_loop():
@@ -167,6 +673,8 @@ def monitor_loop():
 
     Notes
     -----
+    Only the root monitor keeps track of the tasks. The monitors of other hosts
+    aggregate ``TASK_DONE`` messages of the host workers and forward them to the root monitor.
     The loop exits on special cancelation operation.
     ``unidist.core.backends.mpi.core.common.Operations`` defines a set of supported operations.
     """
@@ -174,8 +682,13 @@ def monitor_loop():
     mpi_state = communication.MPIState.get_instance()
     wait_handler = WaitHandler.get_instance()
     data_id_tracker = DataIDTracker.get_instance()
-    shared_store = SharedObjectStore.get_instance()
+    worker_load_tracker = WorkerLoadTracker.get_instance()
+    task_done_forwarder = TaskDoneForwarder.get_instance()
+    async_operations = AsyncOperations.get_instance()
     shm_manager = SharedMemoryManager()
+    is_root_monitor = mpi_state.global_rank == mpi_state.get_monitor_by_worker_rank(
+        communication.MPIRank.ROOT
+    )
 
     # Barrier to check if monitor process is ready to start the communication loop
     mpi_state.global_comm.Barrier()
@@ -185,6 +698,11 @@ def monitor_loop():
     # it can exit the program.
     workers_ready_to_shutdown = []
     shutdown_workers = False
+    # Requests of shared data placed into leased slabs that has not been registered yet
+    # {data_id: [(rank, request), ...]}
+    pending_shared_data_requests = defaultdict(list)
+    # Monitors of the hosts holding copies of the data owned by the current host {data_id: [rank, ...]}
+    shared_data_replicas = defaultdict(list)
     while True:
         # Listen receive operation from any source
         operation_type, source_rank = communication.mpi_recv_operation(
@@ -195,41 +713,93 @@ def monitor_loop():
         )
         # Proceed the request
         if operation_type == common.Operation.TASK_DONE:
-            task_counter.increment()
-            output_data_ids = communication.mpi_recv_object(
+            operation_data = communication.mpi_recv_object(
                 mpi_state.global_comm, source_rank
             )
-            data_id_tracker.add_to_completed(output_data_ids)
-            wait_handler.process_wait_requests()
+            if is_root_monitor:
+                task_counter.increment()
+                data_id_tracker.add_to_completed(operation_data["output_ids"])
+                worker_load_tracker.update(
+                    source_rank,
+                    operation_data["queue_depth"],
+                    operation_data["task_duration"],
+                )
+                wait_handler.process_wait_requests(operation_data["output_ids"])
+            else:
+                task_done_forwarder.add(source_rank, operation_data)
+        elif operation_type == common.Operation.TASK_DONE_BATCH:
+            operation_data = communication.mpi_recv_object(
+                mpi_state.global_comm, source_rank
+            )
+            task_counter.increment(operation_data["task_count"])
+            data_id_tracker.add_to_completed(operation_data["output_ids"])
+            for rank, worker_load in operation_data["worker_load"].items():
+                worker_load_tracker.update(
+                    rank,
+                    worker_load["queue_depth"],
+                    worker_load["task_duration"],
+                    worker_load["task_count"],
+                )
+            wait_handler.process_wait_requests(operation_data["output_ids"])
+            if operation_data["is_flush_reply"]:
+                task_counter.process_flush_reply(source_rank)
+        elif operation_type == common.Operation.FLUSH_TASK_DONE:
+            task_done_forwarder.forward(is_flush_reply=True)
         elif operation_type == common.Operation.WAIT:
-            # TODO: WAIT request can be received from several workers,
-            # but not only from master. Handle this case when requested.
             operation_data = communication.mpi_recv_object(
                 mpi_state.global_comm, source_rank
             )
             awaited_data_ids = operation_data["data_ids"]
             num_returns = operation_data["num_returns"]
-            wait_handler.add_wait_request(awaited_data_ids, num_returns)
-            wait_handler.process_wait_requests()
+            wait_handler.add_wait_request(source_rank, awaited_data_ids, num_returns)
         elif operation_type == common.Operation.GET_TASK_COUNT:
+            task_counter.add_request(source_rank)
+        elif operation_type == common.Operation.GET_WORKER_LOAD:
             # We use a blocking send here because the receiver is waiting for the result.
             communication.mpi_send_object(
                 mpi_state.global_comm,
-                task_counter.task_counter,
+                worker_load_tracker.worker_load,
+                source_rank,
+            )
+        elif operation_type == common.Operation.GET_COMPLETED_DATA_IDS:
+            # We use a blocking send here because the receiver is waiting for the result.
+            communication.mpi_send_object(
+                mpi_state.global_comm,
+                data_id_tracker.pop_unreported(source_rank),
                 source_rank,
             )
         elif operation_type == common.Operation.RESERVE_SHARED_MEMORY:
             request = communication.mpi_recv_object(mpi_state.global_comm, source_rank)
+            if request["is_alias_rejected"]:
+                # The data differs from the identical data found by its content key
+                shm_manager.unalias(request["id"])
             reservation_info = shm_manager.get(request["id"])
-            if reservation_info is None:
-                reservation_info = shm_manager.put(request["id"], request["size"])
-                is_first_request = True
-            else:
+            is_alias = False
+            if reservation_info is not None:
                 is_first_request = False
+            elif shm_manager.is_spilled(request["id"]):
+                # The data is written back to shared memory by the monitor itself
+                reservation_info = shm_manager.restore(request["id"])
+                is_first_request = False
+            else:
+                if request["content_key"] is not None:
+                    reservation_info = shm_manager.alias(
+                        request["id"], request["size"], request["content_key"]
+                    )
+                    is_alias = reservation_info is not None
+                if reservation_info is None:
+                    reservation_info = shm_manager.put(
+                        request["id"], request["size"], request["content_key"]
+                    )
+                is_first_request = True
 
             communication.mpi_send_object(
                 mpi_state.global_comm,
-                data={**reservation_info, "is_first_request": is_first_request},
+                data={
+                    **reservation_info,
+                    "is_first_request": is_first_request,
+                    "is_alias": is_alias,
+                },
                 dest_rank=source_rank,
             )
         elif operation_type == common.Operation.REQUEST_SHARED_DATA:
@@ -239,28 +809,62 @@ def monitor_loop():
             data_id = info_package["id"]
             if data_id is None:
                 raise ValueError("Requested DataID is None")
-            reservation_info = shm_manager.get(data_id)
-            if reservation_info is None:
-                raise RuntimeError(f"The monitor does not know the data id {data_id}")
-            sh_buf = shared_store.get_shared_buffer(
-                reservation_info["first_index"], reservation_info["last_index"]
+            if shm_manager.get(data_id) is None and not shm_manager.is_spilled(
+                data_id
+            ):
+                # The owner has placed the data into its leased slab,
+                # but the registration of the data has not been received yet.
+                pending_shared_data_requests[data_id].append(
+                    (source_rank, info_package)
+                )
+            else:
+                send_shared_data(
+                    shm_manager, info_package, source_rank, shared_data_replicas
+                )
+        elif operation_type == common.Operation.LEASE_SHARED_MEMORY:
+            request = communication.mpi_recv_object(mpi_state.global_comm, source_rank)
+            if request["released_lease"] is not None:
+                shm_manager.release_lease(request["released_lease"])
+            lease_info = shm_manager.lease(
+                request["size"], request["lease_size"], request["service_count"]
             )
-            communication.mpi_send_buffer(
+            communication.mpi_send_object(
                 mpi_state.global_comm,
-                sh_buf,
+                data=lease_info,
                 dest_rank=source_rank,
-                data_type=MPI.BYTE,
             )
+        elif operation_type == common.Operation.PLACE_SHARED_DATA:
+            request = communication.mpi_recv_object(mpi_state.global_comm, source_rank)
+            shm_manager.place(
+                request["id"],
+                request["first_index"],
+                request["last_index"],
+                request["service_index"],
+            )
+            for rank, info_package in pending_shared_data_requests.pop(
+                request["id"], ()
+            ):
+                send_shared_data(shm_manager, info_package, rank, shared_data_replicas)
+        elif operation_type == common.Operation.REGISTER_SHARED_DATA_REPLICA:
+            request = communication.mpi_recv_object(mpi_state.global_comm, source_rank)
+            replicas = shared_data_replicas[request["id"]]
+            if request["monitor"] not in replicas:
+                replicas.append(request["monitor"])
         elif operation_type == common.Operation.CLEANUP:
             cleanup_list = communication.recv_serialized_data(
                 mpi_state.global_comm, source_rank
             )
             cleanup_list = [common.MpiDataID(*tpl) for tpl in cleanup_list]
+            data_id_tracker.remove(cleanup_list)
             shm_manager.clear(cleanup_list)
+            for data_id in cleanup_list:
+                shared_data_replicas.pop(data_id, None)
         elif operation_type == common.Operation.READY_TO_SHUTDOWN:
             workers_ready_to_shutdown.append(source_rank)
             shutdown_workers = len(workers_ready_to_shutdown) == len(mpi_state.workers)
         elif operation_type == common.Operation.SHUTDOWN:
+            communication.MessageCoalescer.get_instance().close(mpi_state.global_comm)
+            shm_manager.finalize()
             SharedObjectStore.get_instance().finalize()
             if not MPI.Is_finalized():
                 MPI.Finalize()
@@ -268,6 +872,14 @@ def monitor_loop():
         else:
             raise ValueError(f"Unsupported operation: {operation_type}")
 
+        # Forward the aggregated notifications once there is nothing else to process
+        if task_done_forwarder.has_pending() and (
+            task_done_forwarder.is_full()
+            or not communication.mpi_iprobe_operation(mpi_state.global_comm)
+        ):
+            task_done_forwarder.forward()
+        async_operations.check()
+
         if shutdown_workers:
             for rank_id in mpi_state.workers + mpi_state.monitor_processes:
                 if rank_id != mpi_state.global_rank:
@@ -281,7 +893,12 @@ def monitor_loop():
                 common.Operation.SHUTDOWN,
                 communication.MPIRank.ROOT,
             )
+            communication.MessageCoalescer.get_instance().close(mpi_state.global_comm)
+            shm_manager.finalize()
             SharedObjectStore.get_instance().finalize()
             if not MPI.Is_finalized():
                 MPI.Finalize()
             break  # leave event loop and shutdown monitoring
+
+    if shm_manager.shared_store is not None:
+        monitor_logger.debug(f"Shared memory stats: {shm_manager.get_stats()}")
@@ -4,7 +4,11 @@
 
 """`SharedMemoryManager` functionality."""
 
+import os
+import shutil
+import tempfile
 from array import array
+from collections import OrderedDict
 
 try:
     import mpi4py
@@ -13,7 +17,13 @@ except ImportError:
         "Missing dependency 'mpi4py'. Use pip or conda to install it."
     ) from None
 
+from unidist.config.backends.mpi.envvars import (
+    MpiCompactionThreshold,
+    MpiSpillDirectory,
+    MpiSpillLimit,
+)
 from unidist.core.backends.mpi.core import communication, common
+from unidist.core.backends.mpi.core._memory import parallel_memcopy
 from unidist.core.backends.mpi.core.shared_object_store import SharedObjectStore
 from unidist.core.backends.mpi.utils import ImmutableDict
 
@@ -102,6 +112,247 @@ class FreeMemoryRange:
                     )
                     break
 
+    def get_stats(self):
+        """
+        Get statistics of free memory.
+
+        Returns
+        -------
+        dict
+            Total free memory, the number of free blocks, the largest free block
+            and the fragmentation, i.e., the part of free memory outside the largest free block.
+        """
+        free_size = sum(end - start for start, end in self.range)
+        largest_free_block = max((end - start for start, end in self.range), default=0)
+        return {
+            "free_size": free_size,
+            "free_blocks": len(self.range),
+            "largest_free_block": largest_free_block,
+            "fragmentation": 1 - largest_free_block / free_size if free_size else 0.0,
+        }
+
+
+class SegregatedFitAllocator:
+    """
+    Class that keeps track of free space in shared memory with segregated free lists.
+
+    Parameters
+    ----------
+    range_len : int
+        Memory length.
+
+    Notes
+    -----
+    Free blocks are kept in bins of size classes. Every power of two is split
+    into ``2 ** SUBCLASS_BITS`` size classes, and a bitmap of non-empty bins allows
+    to find a bin with a block fitting a request in constant time.
+    Free neighbours of a released block are found by the block boundaries
+    and coalesced with the block in constant time as well.
+    """
+
+    SUBCLASS_BITS = 3
+
+    def __init__(self, range_len):
+        # Free blocks {start: end} and {end: start}
+        self._free_by_start = {}
+        self._free_by_end = {}
+        # Starts of free blocks by bins of size classes {bin_index: {start: None}}
+        self._bins = {}
+        # Bit `i` is set if the bin `i` is not empty
+        self._bin_bitmap = 0
+        self._free_size = 0
+        if range_len > 0:
+            self._insert(0, range_len)
+
+    @classmethod
+    def _get_bin_index(cls, size):
+        """
+        Get the index of the bin of the size class the size belongs to.
+
+        Parameters
+        ----------
+        size : int
+            Block size.
+
+        Returns
+        -------
+        int
+        """
+        if size < (1 << cls.SUBCLASS_BITS):
+            return size
+        power = size.bit_length() - 1
+        subclass = (size >> (power - cls.SUBCLASS_BITS)) & (
+            (1 << cls.SUBCLASS_BITS) - 1
+        )
+        return ((power - cls.SUBCLASS_BITS + 1) << cls.SUBCLASS_BITS) + subclass
+
+    def _insert(self, start, end):
+        """
+        Add a free block.
+
+        Parameters
+        ----------
+        start : int
+            First index of the block.
+        end : int
+            Last index of the block (not inclusive).
+        """
+        self._free_by_start[start] = end
+        self._free_by_end[end] = start
+        bin_index = self._get_bin_index(end - start)
+        self._bins.setdefault(bin_index, {})[start] = None
+        self._bin_bitmap |= 1 << bin_index
+        self._free_size += end - start
+
+    def _remove(self, start, end):
+        """
+        Remove a free block.
+
+        Parameters
+        ----------
+        start : int
+            First index of the block.
+        end : int
+            Last index of the block (not inclusive).
+        """
+        del self._free_by_start[start]
+        del self._free_by_end[end]
+        bin_index = self._get_bin_index(end - start)
+        free_bin = self._bins[bin_index]
+        del free_bin[start]
+        if not free_bin:
+            del self._bins[bin_index]
+            self._bin_bitmap &= ~(1 << bin_index)
+        self._free_size -= end - start
+
+    def occupy(self, count=1):
+        """
+        Take the place of a certain length in memory.
+
+        Parameters
+        ----------
+        count : int
+            Required number of elements in memory.
+
+        Returns
+        -------
+        int
+            First index in memory.
+        int
+            Last index in memory.
+        """
+        # Every block of the bins starting from the size class of the rounded up count fits the request
+        if count < (1 << self.SUBCLASS_BITS):
+            bin_index = count
+        else:
+            bin_index = self._get_bin_index(
+                count + (1 << (count.bit_length() - 1 - self.SUBCLASS_BITS)) - 1
+            )
+        bins_left = self._bin_bitmap >> bin_index
+        if bins_left:
+            bin_index += (bins_left & -bins_left).bit_length() - 1
+            # The last block is taken since it is cheap to find in ``dict``
+            free_bin = self._bins[bin_index]
+            start, _ = free_bin.popitem()
+            free_bin[start] = None
+        else:
+            # Only some blocks of the size class of the count can fit the request
+            start = next(
+                (
+                    start
+                    for start in self._bins.get(self._get_bin_index(count), ())
+                    if self._free_by_start[start] - start >= count
+                ),
+                None,
+            )
+            if start is None:
+                return None, None
+        end = self._free_by_start[start]
+        self._remove(start, end)
+        if end - start > count:
+            self._insert(start + count, end)
+        return start, start + count
+
+    def release(self, first_index, last_index):
+        """
+        Free up memory space.
+
+        Parameters
+        ----------
+        first_index : int
+            First index in memory.
+        last_index : int
+            Last index in memory (not inclusive).
+        """
+        previous_start = self._free_by_end.get(first_index, None)
+        if previous_start is not None:
+            self._remove(previous_start, first_index)
+            first_index = previous_start
+        next_end = self._free_by_start.get(last_index, None)
+        if next_end is not None:
+            self._remove(last_index, next_end)
+            last_index = next_end
+        self._insert(first_index, last_index)
+
+    def occupy_range(self, first_index, last_index):
+        """
+        Take the place of the range at the start of a free block.
+
+        Parameters
+        ----------
+        first_index : int
+            First index in memory, which must be the first index of a free block.
+        last_index : int
+            Last index in memory (not inclusive).
+        """
+        end = self._free_by_start[first_index]
+        if end < last_index:
+            raise ValueError("The range does not fit into the free block")
+        self._remove(first_index, end)
+        if end > last_index:
+            self._insert(last_index, end)
+
+    def get_free_block_start(self, last_index):
+        """
+        Get the first index of the free block ending at `last_index`.
+
+        Parameters
+        ----------
+        last_index : int
+            Last index of the block (not inclusive).
+
+        Returns
+        -------
+        int or None
+            The first index of the block or ``None`` if there is no such a free block.
+        """
+        return self._free_by_end.get(last_index, None)
+
+    def get_stats(self):
+        """
+        Get statistics of free memory.
+
+        Returns
+        -------
+        dict
+            Total free memory, the number of free blocks, the largest free block
+            and the fragmentation, i.e., the part of free memory outside the largest free block.
+        """
+        largest_free_block = 0
+        if self._bin_bitmap:
+            largest_free_block = max(
+                self._free_by_start[start] - start
+                for start in self._bins[self._bin_bitmap.bit_length() - 1]
+            )
+        return {
+            "free_size": self._free_size,
+            "free_blocks": len(self._free_by_start),
+            "largest_free_block": largest_free_block,
+            "fragmentation": 1 - largest_free_block / self._free_size
+            if self._free_size
+            else 0.0,
+        }
+
 
 class SharedMemoryManager:
     """
@@ -112,12 +363,30 @@ class SharedMemoryManager:
         self.shared_store = None
         if common.is_shared_memory_supported():
             self.shared_store = SharedObjectStore.get_instance()
-            self._reservation_info = {}
-            self.free_memory = FreeMemoryRange(self.shared_store.shared_memory_size)
-            self.free_service_indexes = FreeMemoryRange(
-                self.shared_store.service_info_max_count
+            # Reservations in the least recently used order
+            self._reservation_info = OrderedDict()
+            # Data spilled to disk {data_id: (file path, data length)}
+            self._spilled_info = {}
+            self._spilled_size = 0
+            self._spill_directory = None
+            # Shared memory grows in segments on demand
+            self.free_memory = SegregatedFitAllocator(0)
+            # The header of the service buffer is not used for data
+            self.free_service_indexes = SegregatedFitAllocator(0)
+            self.free_service_indexes.release(
+                SharedObjectStore.INFO_SIZE, self.shared_store.service_info_max_count
             )
             self.pending_cleanup = []
+            # The number of compactions and the number of bytes moved by them
+            self._compaction_stats = {"compactions": 0, "moved_bytes": 0}
+            # Regions of deduplicated data {content_key: first_index},
+            # their content keys {first_index: content_key}
+            # and the number of data IDs sharing them {first_index: count}
+            self._content_regions = {}
+            self._region_content_keys = {}
+            self._region_users = {}
+            # The number of deduplicated puts and the number of bytes they have not written
+            self._dedup_stats = {"aliases": 0, "saved_bytes": 0}
 
             self.monitor_comm = None
             mpi_state = communication.MPIState.get_instance()
@@ -144,6 +413,7 @@ class SharedMemoryManager:
         Notes
         -----
         The `dict` is returned if a reservation has been specified, otherwise `False` is returned.
+        The `data_id` becomes the most recently used one so that it is spilled to disk last.
         """
         if self.shared_store is None:
             raise RuntimeError(
@@ -151,9 +421,10 @@ class SharedMemoryManager:
             )
         if data_id not in self._reservation_info:
             return None
+        self._reservation_info.move_to_end(data_id)
         return self._reservation_info[data_id]
 
-    def put(self, data_id, memory_len):
+    def put(self, data_id, memory_len, content_key=None):
         """
         Reserve memory for the `data_id`.
 
@@ -163,6 +434,8 @@ class SharedMemoryManager:
             An ID to data.
         memory_len : int
             Required memory length.
+        content_key : bytes, optional
+            Key of the content of data so that identical data can share the reserved memory.
 
         Returns
         -------
@@ -173,13 +446,177 @@ class SharedMemoryManager:
             raise RuntimeError(
                 "`SharedMemoryManager` cannot be used if the shared object storage is not enabled."
             )
-        first_index, last_index = self.free_memory.occupy(memory_len)
-        service_index, _ = self.free_service_indexes.occupy(SharedObjectStore.INFO_SIZE)
+        first_index, last_index = self._occupy(self.free_memory, memory_len)
         if first_index is None:
             raise MemoryError("Overflow memory")
+        service_index, _ = self._occupy(
+            self.free_service_indexes, SharedObjectStore.INFO_SIZE
+        )
+        if service_index is None:
+            raise MemoryError("Overflow service memory")
+
+        if content_key is not None and content_key not in self._content_regions:
+            self._content_regions[content_key] = first_index
+            self._region_content_keys[first_index] = content_key
+            self._region_users[first_index] = 1
+        return self.place(data_id, first_index, last_index, service_index)
+
+    def alias(self, data_id, memory_len, content_key):
+        """
+        Reserve the memory of data with the same content key for the `data_id`.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+        memory_len : int
+            Required memory length.
+        content_key : bytes
+            Key of the content of data.
+
+        Returns
+        -------
+        dict or None
+            Reservation information or ``None`` if there is no data with the same content key.
+
+        Notes
+        -----
+        The `data_id` gets a service slot of its own, so it is referenced and cleaned up
+        independently of the other data IDs, while the memory is released after all of them are cleaned up.
+        The process putting the data must compare the content and call :py:meth:`unalias`
+        if the data differs.
+        """
+        if self.shared_store is None:
+            raise RuntimeError(
+                "`SharedMemoryManager` cannot be used if the shared object storage is not enabled."
+            )
+        service_index, _ = self._occupy(
+            self.free_service_indexes, SharedObjectStore.INFO_SIZE
+        )
         if service_index is None:
             raise MemoryError("Overflow service memory")
+        # The data may have been spilled to disk to occupy the service slot
+        first_index = self._content_regions.get(content_key, None)
+        if first_index is None:
+            self.free_service_indexes.release(
+                service_index, service_index + SharedObjectStore.INFO_SIZE
+            )
+            return None
+        self._region_users[first_index] += 1
+        self._dedup_stats["aliases"] += 1
+        self._dedup_stats["saved_bytes"] += memory_len
+        return self.place(data_id, first_index, first_index + memory_len, service_index)
+
+    def unalias(self, data_id):
+        """
+        Release the memory of data with the same content key reserved for the `data_id`.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+        """
+        reservation_info = self._reservation_info[data_id]
+        self._dedup_stats["aliases"] -= 1
+        self._dedup_stats["saved_bytes"] -= (
+            reservation_info["last_index"] - reservation_info["first_index"]
+        )
+        self._release(data_id)
+
+    def lease(self, memory_len, lease_len, service_count):
+        """
+        Lease a slab of shared memory and a range of service buffer slots to a process.
+
+        Parameters
+        ----------
+        memory_len : int
+            Memory length that the slab must have at least.
+        lease_len : int
+            Preferred memory length of the slab.
+        service_count : int
+            Preferred number of service buffer slots.
+
+        Returns
+        -------
+        dict
+            Lease information.
+
+        Notes
+        -----
+        The preferred lengths are leased only if there is enough free memory,
+        otherwise just the required lengths are leased spilling data to disk if necessary.
+        The process places data into the slab itself and registers it with :py:meth:`place`.
+        """
+        if self.shared_store is None:
+            raise RuntimeError(
+                "`SharedMemoryManager` cannot be used if the shared object storage is not enabled."
+            )
+        first_index, last_index = self._occupy(
+            self.free_memory, max(memory_len, lease_len), spill=False
+        )
+        if first_index is None:
+            first_index, last_index = self._occupy(self.free_memory, memory_len)
+            if first_index is None:
+                raise MemoryError("Overflow memory")
+        service_first_index, service_last_index = self._occupy(
+            self.free_service_indexes,
+            service_count * SharedObjectStore.INFO_SIZE,
+            spill=False,
+        )
+        if service_first_index is None:
+            service_first_index, service_last_index = self._occupy(
+                self.free_service_indexes, SharedObjectStore.INFO_SIZE
+            )
+            if service_first_index is None:
+                self.free_memory.release(first_index, last_index)
+                raise MemoryError("Overflow service memory")
+        return {
+            "first_index": first_index,
+            "last_index": last_index,
+            "service_first_index": service_first_index,
+            "service_last_index": service_last_index,
+        }
+
+    def release_lease(self, lease_info):
+        """
+        Release the unused part of a lease.
+
+        Parameters
+        ----------
+        lease_info : dict
+            Lease information with the unused ranges.
+        """
+        if lease_info["first_index"] < lease_info["last_index"]:
+            self.free_memory.release(lease_info["first_index"], lease_info["last_index"])
+        if lease_info["service_first_index"] < lease_info["service_last_index"]:
+            self.free_service_indexes.release(
+                lease_info["service_first_index"], lease_info["service_last_index"]
+            )
+
+    def place(self, data_id, first_index, last_index, service_index):
+        """
+        Register the memory occupied by the `data_id`.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+        first_index : int
+            The first index of data in the shared buffer.
+        last_index : int
+            The last index of data in the shared buffer (excluding).
+        service_index : int
+            The service buffer index.
 
+        Returns
+        -------
+        dict
+            Reservation information.
+        """
+        if self.shared_store is None:
+            raise RuntimeError(
+                "`SharedMemoryManager` cannot be used if the shared object storage is not enabled."
+            )
         reservation_info = ImmutableDict(
             {
                 "first_index": first_index,
@@ -191,6 +628,369 @@ class SharedMemoryManager:
         self._reservation_info[data_id] = reservation_info
         return reservation_info
 
+    def is_spilled(self, data_id):
+        """
+        Check if the `data_id` has been spilled to disk.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+
+        Returns
+        -------
+        bool
+        """
+        return self.shared_store is not None and data_id in self._spilled_info
+
+    def restore(self, data_id):
+        """
+        Restore the spilled `data_id` from disk to shared memory.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+
+        Returns
+        -------
+        dict
+            Reservation information.
+
+        Notes
+        -----
+        Service information is set after the data is written to shared memory
+        so the data can be read by the workers in the same way as before spilling.
+        """
+        path, data_len = self._spilled_info.pop(data_id)
+        self._spilled_size -= data_len
+        reservation_info = self.put(data_id, data_len)
+        with open(path, "rb") as f:
+            f.readinto(
+                self.shared_store.get_shared_buffer(
+                    reservation_info["first_index"], reservation_info["last_index"]
+                )
+            )
+        os.remove(path)
+        self.shared_store.restore_service_info(
+            data_id, reservation_info["service_index"], reservation_info["first_index"]
+        )
+        return reservation_info
+
+    def read_spilled(self, data_id, offset=0, length=None):
+        """
+        Read the spilled `data_id` from disk.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+        offset : int, default: 0
+            Offset of the part of data to read.
+        length : int, optional
+            Length of the part of data to read. The data is read up to the end if not specified.
+
+        Returns
+        -------
+        bytearray
+            Data in the same layout as in shared memory.
+
+        Notes
+        -----
+        This function is used to send the spilled data to another host without restoring it.
+        """
+        path, data_len = self._spilled_info[data_id]
+        if length is None:
+            length = data_len - offset
+        buffer = bytearray(length)
+        with open(path, "rb") as f:
+            f.seek(offset)
+            f.readinto(buffer)
+        return buffer
+
+    def _get_spill_directory(self):
+        """
+        Get the directory to spill data to creating it on the first call.
+
+        Returns
+        -------
+        str
+        """
+        if self._spill_directory is None:
+            self._spill_directory = tempfile.mkdtemp(
+                prefix=f"unidist_spill_{communication.MPIState.get_instance().global_rank}_",
+                dir=MpiSpillDirectory.get(),
+            )
+        return self._spill_directory
+
+    def _release(self, data_id):
+        """
+        Release shared memory reserved for the `data_id`.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+        """
+        reservation_info = self._reservation_info.pop(data_id)
+        self.free_service_indexes.release(
+            reservation_info["service_index"],
+            reservation_info["service_index"] + SharedObjectStore.INFO_SIZE,
+        )
+        first_index = reservation_info["first_index"]
+        if first_index in self._region_users:
+            # The memory is shared by deduplicated data
+            self._region_users[first_index] -= 1
+            if self._region_users[first_index] > 0:
+                return
+            del self._region_users[first_index]
+            del self._content_regions[self._region_content_keys.pop(first_index)]
+        self.free_memory.release(first_index, reservation_info["last_index"])
+
+    def _is_shared_region(self, reservation_info):
+        """
+        Check if the memory of data is shared by several data IDs.
+
+        Parameters
+        ----------
+        reservation_info : dict
+            Reservation information.
+
+        Returns
+        -------
+        bool
+        """
+        return self._region_users.get(reservation_info["first_index"], 1) > 1
+
+    def _occupy(self, allocator, count, spill=True):
+        """
+        Occupy a range with the allocator growing shared memory or spilling data to disk until the range fits.
+
+        Parameters
+        ----------
+        allocator : SegregatedFitAllocator
+            Allocator of shared memory or of service buffer slots.
+        count : int
+            Length of the range.
+        spill : bool, default: True
+            Whether to spill data to disk if the range does not fit.
+
+        Returns
+        -------
+        tuple
+            The first and the last indexes of the range or ``(None, None)`` if it does not fit.
+
+        Notes
+        -----
+        Fragmented shared memory is compacted first. Shared memory is grown before spilling data
+        since data is spilled only when shared memory has reached its maximum size.
+        """
+        first_index, last_index = allocator.occupy(count)
+        is_compacted = False
+        while first_index is None:
+            if (
+                allocator is self.free_memory
+                and not is_compacted
+                and self._is_fragmented(count)
+            ):
+                is_compacted = True
+                self.compact()
+            elif allocator is self.free_memory and self._grow(count):
+                pass
+            elif not spill or not self._spill_lru_data():
+                break
+            first_index, last_index = allocator.occupy(count)
+        if allocator is self.free_service_indexes and first_index is not None:
+            self.shared_store.init_service_info(last_index)
+        return first_index, last_index
+
+    def _is_fragmented(self, memory_len):
+        """
+        Check if shared memory is so fragmented that data should be compacted to fit `memory_len`.
+
+        Parameters
+        ----------
+        memory_len : int
+            Required memory length.
+
+        Returns
+        -------
+        bool
+        """
+        stats = self.free_memory.get_stats()
+        return (
+            stats["free_size"] >= memory_len
+            and stats["fragmentation"] >= MpiCompactionThreshold.get()
+        )
+
+    def _move(self, first_index, new_first_index, memory_len):
+        """
+        Move data to a lower location in the same segment of shared memory.
+
+        Parameters
+        ----------
+        first_index : int
+            The first index of data.
+        new_first_index : int
+            The new first index of data.
+        memory_len : int
+            Length of data.
+        """
+        if first_index - new_first_index >= memory_len:
+            parallel_memcopy(
+                self.shared_store.get_shared_buffer(
+                    first_index, first_index + memory_len
+                ),
+                self.shared_store.get_shared_buffer(
+                    new_first_index, new_first_index + memory_len
+                ),
+                6,
+            )
+        else:
+            # Slice assignment of `memoryview` handles the overlapping ranges
+            shared_buffer = self.shared_store.get_shared_buffer(
+                new_first_index, first_index + memory_len
+            )
+            shared_buffer[:memory_len] = shared_buffer[first_index - new_first_index :]
+
+    def compact(self):
+        """
+        Compact data in shared memory sliding it to the free space before it.
+
+        Returns
+        -------
+        int
+            The number of bytes moved.
+
+        Notes
+        -----
+        Only data that has no references on the host is moved, since it is not used by any process.
+        The data is retired in the service buffer while it is moved, so a process that is about
+        to reference the data requests it from the monitor and waits until the data is in the new location.
+        Data that is referenced, being written, placed in a leased slab or shared by deduplicated data
+        is not moved and the free space before it stays in place. Data is moved only within its segment.
+        """
+        moved_size = 0
+        for data_id, reservation_info in sorted(
+            self._reservation_info.items(), key=lambda item: item[1]["first_index"]
+        ):
+            first_index = reservation_info["first_index"]
+            new_first_index = self.free_memory.get_free_block_start(first_index)
+            if new_first_index is None or self._is_shared_region(reservation_info):
+                continue
+            service_index = reservation_info["service_index"]
+            if not self.shared_store.delete_unreferenced_service_info(
+                data_id, service_index
+            ):
+                continue
+            last_index = reservation_info["last_index"]
+            memory_len = last_index - first_index
+            self.free_memory.release(first_index, last_index)
+            self.free_memory.occupy_range(new_first_index, new_first_index + memory_len)
+            self._move(first_index, new_first_index, memory_len)
+            # The location of the data in the least recently used order does not change
+            self._reservation_info[data_id] = ImmutableDict(
+                {
+                    "first_index": new_first_index,
+                    "last_index": new_first_index + memory_len,
+                    "service_index": service_index,
+                }
+            )
+            if first_index in self._region_users:
+                content_key = self._region_content_keys.pop(first_index)
+                self._region_content_keys[new_first_index] = content_key
+                self._content_regions[content_key] = new_first_index
+                self._region_users[new_first_index] = self._region_users.pop(
+                    first_index
+                )
+            self.shared_store.restore_service_info(
+                data_id, service_index, new_first_index
+            )
+            moved_size += memory_len
+        self._compaction_stats["compactions"] += 1
+        self._compaction_stats["moved_bytes"] += moved_size
+        return moved_size
+
+    def _grow(self, memory_len):
+        """
+        Grow shared memory by a new segment.
+
+        Parameters
+        ----------
+        memory_len : int
+            The length of data the segment must fit.
+
+        Returns
+        -------
+        bool
+            ``True`` if shared memory has grown, otherwise ``False``.
+        """
+        first_index, last_index = self.shared_store.grow(memory_len)
+        if first_index is None:
+            return False
+        self.free_memory.release(first_index, last_index)
+        return True
+
+    def _spill_lru_data(self):
+        """
+        Spill the least recently used data that has no references to disk.
+
+        Returns
+        -------
+        bool
+            ``True`` if some data has been spilled, otherwise ``False``.
+
+        Notes
+        -----
+        Data that is being written to shared memory, data that shares its memory with deduplicated data
+        and data that does not fit into :class:`~unidist.config.backends.mpi.envvars.MpiSpillLimit` are skipped.
+        """
+        spill_limit = MpiSpillLimit.get()
+        for data_id, reservation_info in self._reservation_info.items():
+            first_index = reservation_info["first_index"]
+            last_index = reservation_info["last_index"]
+            data_len = last_index - first_index
+            if spill_limit is not None and self._spilled_size + data_len > spill_limit:
+                continue
+            if self._is_shared_region(reservation_info):
+                continue
+            if self.shared_store.delete_unreferenced_service_info(
+                data_id, reservation_info["service_index"]
+            ):
+                break
+        else:
+            return False
+
+        path = os.path.join(
+            self._get_spill_directory(), f"{data_id.owner_rank}_{data_id.data_number}"
+        )
+        with open(path, "wb") as f:
+            f.write(self.shared_store.get_shared_buffer(first_index, last_index))
+        self._spilled_info[data_id] = (path, data_len)
+        self._spilled_size += data_len
+        self._release(data_id)
+        return True
+
+    def get_stats(self):
+        """
+        Get fragmentation statistics of shared memory.
+
+        Returns
+        -------
+        dict
+            Statistics of free memory for data and for service information.
+        """
+        if self.shared_store is None:
+            raise RuntimeError(
+                "`SharedMemoryManager` cannot be used if the shared object storage is not enabled."
+            )
+        return {
+            "memory": self.free_memory.get_stats(),
+            "service_memory": self.free_service_indexes.get_stats(),
+            "compaction": dict(self._compaction_stats),
+            "dedup": dict(self._dedup_stats),
+        }
+
     def clear(self, data_id_list):
         """
         Clear shared memory for the list of `DataID` if possible.
@@ -205,6 +1005,7 @@ class SharedMemoryManager:
         cleanup_list = self.pending_cleanup + data_id_list
         self.pending_cleanup = []
 
+        # Spilled data has no references on the current host
         has_refs = array(
             "B",
             [
@@ -228,17 +1029,20 @@ class SharedMemoryManager:
         for data_id, referers in zip(cleanup_list, all_refs):
             if referers == 0:
                 if data_id in self._reservation_info:
-                    reservation_info = self._reservation_info[data_id]
                     self.shared_store.delete_service_info(
-                        data_id, reservation_info["service_index"]
+                        data_id, self._reservation_info[data_id]["service_index"]
                     )
-                    self.free_service_indexes.release(
-                        reservation_info["service_index"],
-                        reservation_info["service_index"] + SharedObjectStore.INFO_SIZE,
-                    )
-                    self.free_memory.release(
-                        reservation_info["first_index"], reservation_info["last_index"]
-                    )
-                    del self._reservation_info[data_id]
+                    self._release(data_id)
+                elif data_id in self._spilled_info:
+                    path, data_len = self._spilled_info.pop(data_id)
+                    self._spilled_size -= data_len
+                    os.remove(path)
             else:
                 self.pending_cleanup.append(data_id)
+
+    def finalize(self):
+        """
+        Remove the data spilled to disk.
+        """
+        if self.shared_store is not None and self._spill_directory is not None:
+            shutil.rmtree(self._spill_directory, ignore_errors=True)
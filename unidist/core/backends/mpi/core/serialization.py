@@ -6,6 +6,7 @@
 
 import importlib
 import inspect
+import struct
 import sys
 from collections.abc import KeysView
 
@@ -31,6 +32,7 @@ import msgpack
 import gc  # msgpack optimization
 
 from unidist.config import MpiPickleThreshold
+from unidist.core.backends.mpi.core.common import MpiDataID
 
 # TODO: Find a way to move this after all imports
 mpi4py.rc(recv_mprobe=False, initialize=False)
@@ -119,6 +121,10 @@ class ComplexDataSerializer:
 
     # Minimum buffer size for serialization with pickle 5 protocol
     PICKLE_THRESHOLD = MpiPickleThreshold.get()
+    # Msgpack extension type code for ``MpiDataID``
+    DATA_ID_EXT_TYPE = 1
+    # Owner rank and data number of ``MpiDataID`` packed as two signed 64-bit integers
+    _data_id_struct = struct.Struct("<qq")
 
     def __init__(self, buffers=None, buffer_count=None):
         self.buffers = buffers if buffers else []
@@ -192,6 +198,25 @@ class ComplexDataSerializer:
         """
         return {"__pickle_custom__": True, "as_bytes": pkl.dumps(obj)}
 
+    def _data_id_encode(self, data_id):
+        """
+        Encode ``MpiDataID`` with msgpack extension type.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+
+        Returns
+        -------
+        msgpack.ExtType
+            Extension type with the packed owner rank and data number.
+        """
+        return msgpack.ExtType(
+            self.DATA_ID_EXT_TYPE,
+            self._data_id_struct.pack(data_id.owner_rank, data_id.data_number),
+        )
+
     def _encode_custom(self, obj):
         """
         Serialization hook for msgpack library.
@@ -203,7 +228,9 @@ class ComplexDataSerializer:
         obj : object
             Python object.
         """
-        if is_pickle5_serializable(obj):
+        if isinstance(obj, MpiDataID):
+            return self._data_id_encode(obj)
+        elif is_pickle5_serializable(obj):
             return self._dataframe_encode(obj)
         elif is_cpkl_serializable(obj):
             return self._cpkl_encode(obj)
@@ -256,6 +283,27 @@ class ComplexDataSerializer:
         else:
             return obj
 
+    def _decode_ext(self, code, data):
+        """
+        De-serialization hook for msgpack extension types.
+
+        Parameters
+        ----------
+        code : int
+            Extension type code.
+        data : bytes
+            Packed data of the extension type.
+
+        Returns
+        -------
+        object
+            ``MpiDataID`` for the corresponding type code, otherwise, ``msgpack.ExtType``.
+        """
+        if code == self.DATA_ID_EXT_TYPE:
+            # Go through the interning in `MpiDataID.__new__` to get the existing instance if any
+            return MpiDataID(*self._data_id_struct.unpack(data))
+        return msgpack.ExtType(code, data)
+
     def deserialize(self, s_data):
         """
         De-serialize data from a bytearray.
@@ -276,7 +324,10 @@ class ComplexDataSerializer:
         """
         gc.disable()  # Performance optimization for msgpack
         unpacked_data = msgpack.unpackb(
-            s_data, object_hook=self._decode_custom, strict_map_key=False
+            s_data,
+            object_hook=self._decode_custom,
+            ext_hook=self._decode_ext,
+            strict_map_key=False,
         )
         gc.enable()
         return unpacked_data
@@ -4,14 +4,20 @@
 
 """`SharedObjectStore` functionality."""
 
+import hashlib
+import mmap
 import os
+import shutil
 import sys
-import time
+import tempfile
+from array import array
+from collections import deque
 import warnings
 import psutil
+import threading
 import weakref
 
-from unidist.core.backends.mpi.core._memory import parallel_memcopy, fill
+from unidist.core.backends.mpi.core._memory import parallel_memcopy, fill, is_equal
 from unidist.core.backends.mpi.utils import ImmutableDict
 
 try:
@@ -25,9 +31,13 @@ from unidist.config.backends.mpi.envvars import (
     MpiSharedObjectStoreMemory,
     MpiSharedServiceMemory,
     MpiSharedObjectStoreThreshold,
-    MpiBackoff,
+    MpiSharedObjectStoreDedup,
+    MpiSharedMemorySegmentSize,
+    MpiSharedMemoryLeaseSize,
+    MpiSharedDataChunkSize,
 )
 from unidist.core.backends.mpi.core import common, communication
+from unidist.core.backends.mpi.core.async_operations import AsyncOperations
 from unidist.core.backends.mpi.core.serialization import (
     deserialize_complex_data,
 )
@@ -37,32 +47,6 @@ mpi4py.rc(recv_mprobe=False, initialize=False)
 from mpi4py import MPI  # noqa: E402
 
 
-class WinLock:
-    """
-    Class that helps to synchronize the write to shared memory.
-
-    Parameters
-    ----------
-    win : MPI.win
-        The MPI window that was used to allocate the shared memory.
-
-    Notes
-    -----
-    This class should be used as a context manager.
-    """
-
-    def __init__(self, win):
-        self.win = win
-
-    def __enter__(self):
-        """Lock the current MPI.Window for other processes."""
-        self.win.Lock(communication.MPIRank.MONITOR)
-
-    def __exit__(self, *args):
-        """Unlock the current MPI.Window for other processes."""
-        self.win.Unlock(communication.MPIRank.MONITOR)
-
-
 class SharedObjectStore:
     """
     Class that provides access to data in shared memory.
@@ -86,14 +70,28 @@ class SharedObjectStore:
     # Index of service information to count the number of data references,
     # which shows how many processes are using this data.
     REFERENCES_NUMBER = 3
+    # Index of the number of initialized items of the service buffer.
+    # The first `INFO_SIZE` items of the service buffer are the header that is not used for data.
+    INITIALIZED_COUNT_INDEX = 0
+    # Maximum number of service information slots leased along with a slab of shared memory.
+    MAX_LEASE_SERVICE_COUNT = 1024
+    # Number of blocks of every raw buffer hashed to get the content key of data.
+    CONTENT_KEY_SAMPLES = 16
+    # Length of a block of a raw buffer hashed to get the content key of data.
+    CONTENT_KEY_BLOCK_SIZE = 4096
+    # Maximum number of chunks of data requested from other hosts at once.
+    MAX_CHUNKS_IN_FLIGHT = 4
 
     def __init__(self):
-        # The `MPI.Win` object to manage shared memory for data
-        self.win = None
+        # Mapped segments of shared memory for data {segment_number: (mmap.mmap, memoryview)}.
+        # Segment `i` starts at the index `i * shared_memory_size` of shared memory
+        # so that data never crosses the boundary of a segment.
+        self._segments = {}
+        self._segments_lock = threading.Lock()
+        # The prefix of the names of segment files which is common for all processes on the host
+        self._segment_prefix = None
         # The `MPI.Win` object to manage shared memory for service purposes
         self.service_win = None
-        # `MPI.memory` object for reading/writing data from/to shared memory
-        self.shared_buffer = None
         # `memoryview` object for reading/writing data from/to service shared memory.
         # Service shared buffer includes service information about written shared data.
         # The service info is set by the worker who sends the data to shared memory
@@ -101,8 +99,10 @@ class SharedObjectStore:
         # The service info indicates that the current data is written to shared memory
         # and shows the actual location and number of references.
         self.service_shared_buffer = None
-        # Length of shared memory buffer in bytes
+        # Maximum length of shared memory buffer in bytes
         self.shared_memory_size = None
+        # Length of the first segment of shared memory buffer in bytes
+        self.segment_size = None
         # Length of service shared memory buffer in items
         self.service_info_max_count = None
 
@@ -118,6 +118,9 @@ class SharedObjectStore:
         self._shared_info = weakref.WeakKeyDictionary()
         # The list of `weakref.finalize` which should be canceled before closing the shared memory.
         self.finalizers = []
+        # The unused part of the slab of shared memory leased by the monitor
+        self._lease = None
+        self._lease_lock = threading.Lock()
 
     def _get_allowed_memory_size(self):
         """
@@ -226,19 +229,24 @@ class SharedObjectStore:
                 + "than the available amount of memory."
             )
 
-        # Shared memory is allocated only once by the monitor process.
-        info = MPI.Info.Create()
-        info.Set("alloc_shared_noncontig", "true")
-        self.win = MPI.Win.Allocate_shared(
-            self.shared_memory_size * MPI.BYTE.size
+        # Segments of shared memory for data are created by the monitor process on demand
+        # and mapped by other processes when they access the segment for the first time.
+        # The size of shared memory defines the location of segments so it must be the same
+        # in all processes on the host, while available memory may change.
+        self._segment_prefix, self.shared_memory_size = mpi_state.host_comm.bcast(
+            (f"unidist_{os.getpid()}_{mpi_state.global_rank}", self.shared_memory_size)
             if mpi_state.is_monitor_process()
-            else 0,
-            MPI.BYTE.size,
-            comm=mpi_state.host_comm,
-            info=info,
+            else None,
+            root=communication.MPIRank.MONITOR,
+        )
+        self.segment_size = min(
+            MpiSharedMemorySegmentSize.get() or self.shared_memory_size,
+            self.shared_memory_size,
         )
-        self.shared_buffer, _ = self.win.Shared_query(communication.MPIRank.MONITOR)
 
+        # Shared service memory is allocated only once by the monitor process.
+        info = MPI.Info.Create()
+        info.Set("alloc_shared_noncontig", "true")
         self.service_info_max_count = (
             self.service_memory_size
             // (self.INFO_SIZE * MPI.LONG.size)
@@ -254,9 +262,57 @@ class SharedObjectStore:
         )
         service_buffer, _ = self.service_win.Shared_query(communication.MPIRank.MONITOR)
         self.service_shared_buffer = memoryview(service_buffer).cast("l")
-        # Set -1 to the service buffer because 0 is a valid value and may be recognized by mistake.
+        # Service slots are initialized by the monitor when they are reserved for the first time.
         if mpi_state.is_monitor_process():
-            fill(self.service_shared_buffer, -1)
+            self.service_shared_buffer[self.INITIALIZED_COUNT_INDEX] = self.INFO_SIZE
+        mpi_state.host_comm.Barrier()
+        # The shared access epoch lasts until finalization so that the number of references
+        # is updated with atomic operations on a single service slot without locking the whole window.
+        self.service_win.Lock_all(MPI.MODE_NOCHECK)
+
+    def _get_segment_path(self, segment_number):
+        """
+        Get the path to the file of the segment of shared memory.
+
+        Parameters
+        ----------
+        segment_number : int
+            The number of the segment.
+
+        Returns
+        -------
+        str
+        """
+        # tmpfs keeps files in memory
+        directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+        return os.path.join(directory, f"{self._segment_prefix}_{segment_number}")
+
+    def _map_segment(self, segment_number, segment_size=None):
+        """
+        Map the segment of shared memory to the memory of the current process.
+
+        Parameters
+        ----------
+        segment_number : int
+            The number of the segment.
+        segment_size : int, optional
+            The length of the segment to create. The existing segment is mapped if ``None``.
+        """
+        path = self._get_segment_path(segment_number)
+        if segment_size is None:
+            fd = os.open(path, os.O_RDWR)
+        else:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            if segment_size is None:
+                segment_size = os.fstat(fd).st_size
+            else:
+                # The file is sparse so that memory is taken only by the pages which are written
+                os.ftruncate(fd, segment_size)
+            segment = mmap.mmap(fd, segment_size)
+        finally:
+            os.close(fd)
+        self._segments[segment_number] = (segment, memoryview(segment))
 
     def _parse_data_id(self, data_id):
         """
@@ -275,6 +331,97 @@ class SharedObjectStore:
         splited_id = str(data_id).replace(")", "").split("_")
         return int(splited_id[1]), int(splited_id[3])
 
+    def _fetch_and_op_ref_number(self, service_index, value, op):
+        """
+        Apply an atomic operation to the number of references in the service slot.
+
+        Parameters
+        ----------
+        service_index : int
+            The service buffer index.
+        value : int
+            The operand of the operation.
+        op : MPI.Op
+            The operation (``MPI.SUM``, ``MPI.REPLACE`` or ``MPI.NO_OP``).
+
+        Returns
+        -------
+        int
+            The number of references before the operation.
+        """
+        result = array("l", [0])
+        self.service_win.Fetch_and_op(
+            array("l", [value]),
+            result,
+            communication.MPIRank.MONITOR,
+            service_index + self.REFERENCES_NUMBER,
+            op,
+        )
+        self.service_win.Flush(communication.MPIRank.MONITOR)
+        return result[0]
+
+    def _compare_and_swap_ref_number(self, service_index, compare, value):
+        """
+        Atomically replace the number of references in the service slot if it equals to `compare`.
+
+        Parameters
+        ----------
+        service_index : int
+            The service buffer index.
+        compare : int
+            The expected number of references.
+        value : int
+            The new number of references.
+
+        Returns
+        -------
+        int
+            The number of references before the operation.
+            The replacement has been done if it is equal to `compare`.
+        """
+        result = array("l", [0])
+        self.service_win.Compare_and_swap(
+            array("l", [value]),
+            array("l", [compare]),
+            result,
+            communication.MPIRank.MONITOR,
+            service_index + self.REFERENCES_NUMBER,
+        )
+        self.service_win.Flush(communication.MPIRank.MONITOR)
+        return result[0]
+
+    def _retire_service_info(self, service_index, force=False):
+        """
+        Atomically mark the service slot as free and clear its service information.
+
+        Parameters
+        ----------
+        service_index : int
+            The service buffer index.
+        force : bool, default: False
+            Whether to clear the service information even if the data is referenced.
+
+        Returns
+        -------
+        bool
+            ``True`` if the service information has been cleared, otherwise ``False``.
+
+        Notes
+        -----
+        The number of references is set to -1 first, so no process can reference the data
+        after that. Processes check the data ID before and after referencing the data
+        so clearing the rest of the service information is not atomic.
+        """
+        if force:
+            self._fetch_and_op_ref_number(service_index, -1, MPI.REPLACE)
+        elif self._compare_and_swap_ref_number(service_index, 0, -1) != 0:
+            return False
+        self.service_shared_buffer[service_index + self.WORKER_ID_INDEX] = -1
+        self.service_shared_buffer[service_index + self.DATA_NUMBER_INDEX] = -1
+        self.service_shared_buffer[service_index + self.FIRST_DATA_INDEX] = -1
+        self.service_win.Sync()
+        return True
+
     def _increment_ref_number(self, data_id, service_index):
         """
         Increment the number of references to indicate to the monitor that this data is being used.
@@ -285,31 +432,54 @@ class SharedObjectStore:
         service_index : int
             The service buffer index.
 
+        Returns
+        -------
+        bool
+            ``False`` if the data is no longer in shared memory because it has been spilled to disk
+            by the monitor, otherwise ``True``.
+
         Notes
         -----
         This function create `weakref.finalizer' with decrement function which will be called after data_id collecting.
         """
         if MPI.Is_finalized():
-            return
+            return True
         if service_index is None:
             raise KeyError(
                 "it is not possible to increment the reference number for this data_id because it is not part of the shared data"
             )
-        with WinLock(self.service_win):
-            prev_ref_number = self.service_shared_buffer[
-                service_index + self.REFERENCES_NUMBER
-            ]
-            self.service_shared_buffer[service_index + self.REFERENCES_NUMBER] = (
-                prev_ref_number + 1
-            )
-            self.logger.debug(
-                f"Rank {communication.MPIState.get_instance().global_rank}: Increment references number for {data_id} from {prev_ref_number} to {prev_ref_number + 1}"
+        # The number of references is -1 if the monitor has spilled or cleared the data
+        if not self._check_service_info(data_id, service_index):
+            return False
+        # The expected number of references is read directly from shared memory,
+        # the compare-and-swap fails and returns the actual one if it is outdated.
+        prev_ref_number = self.service_shared_buffer[
+            service_index + self.REFERENCES_NUMBER
+        ]
+        while True:
+            if prev_ref_number < 0:
+                return False
+            ref_number = self._compare_and_swap_ref_number(
+                service_index, prev_ref_number, prev_ref_number + 1
             )
+            if ref_number == prev_ref_number:
+                break
+            prev_ref_number = ref_number
+        # The service slot may have been reused for another data
+        # between the check and the increment so the reference is rolled back.
+        self.service_win.Sync()
+        if not self._check_service_info(data_id, service_index):
+            self._fetch_and_op_ref_number(service_index, -1, MPI.SUM)
+            return False
+        self.logger.debug(
+            f"Rank {communication.MPIState.get_instance().global_rank}: Increment references number for {data_id} from {prev_ref_number} to {prev_ref_number + 1}"
+        )
         self.finalizers.append(
             weakref.finalize(
                 data_id, self._decrement_ref_number, str(data_id), service_index
             )
         )
+        return True
 
     def _decrement_ref_number(self, data_id, service_index):
         """
@@ -331,17 +501,14 @@ class SharedObjectStore:
         # we must set service_index in args because the shared_info will be deleted before than this function is called
         if MPI.Is_finalized():
             return
+        if self.service_win is None:
+            return
         if self._check_service_info(data_id, service_index):
-            with WinLock(self.service_win):
-                prev_ref_number = self.service_shared_buffer[
-                    service_index + self.REFERENCES_NUMBER
-                ]
-                self.service_shared_buffer[service_index + self.REFERENCES_NUMBER] = (
-                    prev_ref_number - 1
-                )
-                self.logger.debug(
-                    f"Rank {communication.MPIState.get_instance().global_rank}: Decrement references number for {data_id} from {prev_ref_number} to {prev_ref_number - 1}"
-                )
+            # The data is referenced by the current process so it cannot be retired concurrently
+            prev_ref_number = self._fetch_and_op_ref_number(service_index, -1, MPI.SUM)
+            self.logger.debug(
+                f"Rank {communication.MPIState.get_instance().global_rank}: Decrement references number for {data_id} from {prev_ref_number} to {prev_ref_number - 1}"
+            )
 
     def _put_service_info(self, service_index, data_id, first_index):
         """
@@ -360,24 +527,39 @@ class SharedObjectStore:
         -----
         This information must be set after writing data to shared memory.
         """
-        worker_id, data_number = self._parse_data_id(data_id)
-
-        with WinLock(self.service_win):
-            self.service_shared_buffer[
-                service_index + self.FIRST_DATA_INDEX
-            ] = first_index
-            self.service_shared_buffer[service_index + self.REFERENCES_NUMBER] = 1
-            self.service_shared_buffer[
-                service_index + self.DATA_NUMBER_INDEX
-            ] = data_number
-            self.service_shared_buffer[service_index + self.WORKER_ID_INDEX] = worker_id
-
+        self._write_service_info(service_index, data_id, first_index, 1)
         self.finalizers.append(
             weakref.finalize(
                 data_id, self._decrement_ref_number, str(data_id), service_index
             )
         )
 
+    def _write_service_info(self, service_index, data_id, first_index, ref_number):
+        """
+        Write service information about shared data to the service buffer.
+
+        Parameters
+        ----------
+        service_index : int
+            The service buffer index.
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+        first_index : int
+            The first index of data in the shared buffer.
+        ref_number : int
+            The initial number of references to data.
+        """
+        worker_id, data_number = self._parse_data_id(data_id)
+
+        # The data ID is written last so that the data is recognized only
+        # when the rest of the service information is visible to other processes.
+        self.service_shared_buffer[service_index + self.FIRST_DATA_INDEX] = first_index
+        self.service_win.Sync()
+        self._fetch_and_op_ref_number(service_index, ref_number, MPI.REPLACE)
+        self.service_shared_buffer[service_index + self.DATA_NUMBER_INDEX] = data_number
+        self.service_shared_buffer[service_index + self.WORKER_ID_INDEX] = worker_id
+        self.service_win.Sync()
+
     def _check_service_info(self, data_id, service_index):
         """
         Check if the `data_id` is in the shared memory on the current host.
@@ -398,6 +580,10 @@ class SharedObjectStore:
         -----
         This check ensures that the data is physically located in shared memory.
         """
+        # The service index may be received from another host and point
+        # to the part of the service buffer that has not been initialized yet.
+        if service_index >= self.service_shared_buffer[self.INITIALIZED_COUNT_INDEX]:
+            return False
         worker_id, data_number = self._parse_data_id(data_id)
         w_id = self.service_shared_buffer[service_index + self.WORKER_ID_INDEX]
         d_id = self.service_shared_buffer[service_index + self.DATA_NUMBER_INDEX]
@@ -440,16 +626,17 @@ class SharedObjectStore:
 
         first_index = self.service_shared_buffer[service_index + self.FIRST_DATA_INDEX]
 
-        s_data_last_index = first_index + s_data_len
-        s_data = self.shared_buffer[first_index:s_data_last_index].toreadonly()
-        prev_last_index = s_data_last_index
+        shared_buffer = self.get_shared_buffer(
+            first_index, first_index + s_data_len + sum(buffer_lens)
+        ).toreadonly()
+        s_data = shared_buffer[:s_data_len]
+        prev_last_index = s_data_len
         raw_buffers = []
         for raw_buffer_len in buffer_lens:
             raw_last_index = prev_last_index + raw_buffer_len
-            raw_buffers.append(
-                self.shared_buffer[prev_last_index:raw_last_index].toreadonly()
-            )
+            raw_buffers.append(shared_buffer[prev_last_index:raw_last_index])
             prev_last_index = raw_last_index
+        prev_last_index += first_index
 
         data = deserialize_complex_data(s_data, raw_buffers, buffer_count)
         self.logger.debug(
@@ -489,7 +676,8 @@ class SharedObjectStore:
 
         if s_data_last_index > last_index:
             raise ValueError("Not enough shared space for data")
-        self.shared_buffer[s_data_first_index:s_data_last_index] = s_data
+        shared_buffer = self.get_shared_buffer(first_index, last_index)
+        shared_buffer[: s_data_last_index - first_index] = s_data
 
         last_prev_index = s_data_last_index
         for i, raw_buffer in enumerate(raw_buffers):
@@ -501,7 +689,9 @@ class SharedObjectStore:
 
             parallel_memcopy(
                 raw_buffer,
-                self.shared_buffer[raw_buffer_first_index:last_prev_index],
+                shared_buffer[
+                    raw_buffer_first_index - first_index : last_prev_index - first_index
+                ],
                 6,
             )
 
@@ -515,6 +705,119 @@ class SharedObjectStore:
             data_id, s_data_len, buffer_lens, buffer_count, service_index
         )
 
+    def _get_content_key(self, serialized_data):
+        """
+        Get a key of the content of serialized data to find identical data in shared memory.
+
+        Parameters
+        ----------
+        serialized_data : dict
+            Serialized data.
+
+        Returns
+        -------
+        bytes
+
+        Notes
+        -----
+        Only evenly spaced blocks of large raw buffers are hashed, so data with different content
+        may have the same key. The content of such data is compared before it is deduplicated.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(serialized_data["s_data"])
+        samples_len = self.CONTENT_KEY_SAMPLES * self.CONTENT_KEY_BLOCK_SIZE
+        for raw_buffer in serialized_data["raw_buffers"]:
+            raw_buffer_len = len(raw_buffer)
+            hasher.update(raw_buffer_len.to_bytes(8, "little"))
+            if raw_buffer_len <= samples_len:
+                hasher.update(raw_buffer)
+                continue
+            step = (raw_buffer_len - self.CONTENT_KEY_BLOCK_SIZE) // (
+                self.CONTENT_KEY_SAMPLES - 1
+            )
+            for i in range(self.CONTENT_KEY_SAMPLES):
+                hasher.update(
+                    raw_buffer[i * step : i * step + self.CONTENT_KEY_BLOCK_SIZE]
+                )
+        return hasher.digest()
+
+    def _is_same_content(self, reservation_data, serialized_data):
+        """
+        Check if shared memory holds the same serialized data.
+
+        Parameters
+        ----------
+        reservation_data : dict
+            Information about the range of shared memory.
+        serialized_data : dict
+            Serialized data.
+
+        Returns
+        -------
+        bool
+        """
+        shared_buffer = self.get_shared_buffer(
+            reservation_data["first_index"], reservation_data["last_index"]
+        )
+        prev_last_index = 0
+        for buffer in [serialized_data["s_data"], *serialized_data["raw_buffers"]]:
+            last_index = prev_last_index + len(buffer)
+            if not is_equal(buffer, shared_buffer[prev_last_index:last_index]):
+                return False
+            prev_last_index = last_index
+        return True
+
+    def _reserve_from_lease(self, data_size):
+        """
+        Reserve memory for data in the slab of shared memory leased by the monitor.
+
+        Parameters
+        ----------
+        data_size : int
+            Length of data.
+
+        Returns
+        -------
+        dict
+            Reservation info about the allocated range in shared memory.
+
+        Notes
+        -----
+        The monitor is asked for a new slab only if the data does not fit into the current one.
+        The unused part of the current slab is handed back to the monitor along with the request.
+        """
+        with self._lease_lock:
+            lease = self._lease
+            if (
+                lease is None
+                or lease["last_index"] - lease["first_index"] < data_size
+                or lease["service_first_index"] == lease["service_last_index"]
+            ):
+                lease_size = MpiSharedMemoryLeaseSize.get()
+                service_count = max(
+                    1,
+                    min(
+                        self.MAX_LEASE_SERVICE_COUNT,
+                        lease_size // max(MpiSharedObjectStoreThreshold.get(), 1),
+                    ),
+                )
+                self._lease = lease = communication.send_lease_operation(
+                    communication.MPIState.get_instance().global_comm,
+                    data_size,
+                    lease_size,
+                    service_count,
+                    lease,
+                )
+            first_index = lease["first_index"]
+            service_index = lease["service_first_index"]
+            lease["first_index"] += data_size
+            lease["service_first_index"] += self.INFO_SIZE
+        return {
+            "first_index": first_index,
+            "last_index": first_index + data_size,
+            "service_index": service_index,
+        }
+
     def _sync_shared_memory_from_another_host(
         self, comm, data_id, owner_rank, first_index, last_index, service_index
     ):
@@ -539,22 +842,71 @@ class SharedObjectStore:
         Notes
         -----
         After writting data, service information should be set.
+        The data is received in chunks of :class:`~unidist.config.backends.mpi.envvars.MpiSharedDataChunkSize`
+        bytes directly into shared memory keeping up to ``MAX_CHUNKS_IN_FLIGHT`` chunks requested at once.
+        The chunks are requested from the monitor of the owner's host and from the monitors
+        of the hosts that already hold copies of the data in turn.
         """
+        mpi_state = communication.MPIState.get_instance()
         sh_buf = self.get_shared_buffer(first_index, last_index)
-        # recv serialized data to shared memory
-        owner_monitor = (
-            communication.MPIState.get_instance().get_monitor_by_worker_rank(owner_rank)
+        data_len = last_index - first_index
+        chunk_size = MpiSharedDataChunkSize.get() or data_len
+        chunks = deque(
+            (offset, min(offset + chunk_size, data_len))
+            for offset in range(0, data_len, chunk_size)
         )
-        communication.send_simple_operation(
-            comm,
-            operation_type=common.Operation.REQUEST_SHARED_DATA,
-            operation_data={"id": data_id},
-            dest_rank=owner_monitor,
-        )
-        communication.mpi_recv_buffer(comm, owner_monitor, sh_buf)
+        owner_monitor = mpi_state.get_monitor_by_worker_rank(owner_rank)
+        own_monitor = mpi_state.get_monitor_by_worker_rank()
+        sources = [owner_monitor]
+        # Requested chunks in order of the requests [(source, first, last, handlers), ...]
+        pending_chunks = deque()
+
+        def request_chunk(source, with_sources=False):
+            first, last = chunks.popleft()
+            # recv serialized data to shared memory
+            h_list = communication.mpi_irecv_buffer(comm, source, sh_buf[first:last])
+            communication.send_simple_operation(
+                comm,
+                operation_type=common.Operation.REQUEST_SHARED_DATA,
+                operation_data={
+                    "id": data_id,
+                    "offset": first,
+                    "length": last - first,
+                    "with_sources": with_sources,
+                },
+                dest_rank=source,
+            )
+            pending_chunks.append((source, first, last, h_list))
+
+        if chunks:
+            # The monitors of the hosts holding copies of the data are sent along with the first chunk
+            request_chunk(owner_monitor, with_sources=True)
+            sources += [
+                monitor
+                for monitor in communication.mpi_recv_object(comm, owner_monitor)
+                if monitor != own_monitor
+            ]
+        received_len = 0
+        while pending_chunks:
+            while chunks and len(pending_chunks) < self.MAX_CHUNKS_IN_FLIGHT:
+                request_chunk(sources[len(chunks) % len(sources)])
+            source, first, last, h_list = pending_chunks.popleft()
+            MPI.Request.Waitall(h_list)
+            received_len += last - first
+            self.logger.debug(
+                f"Rank {mpi_state.global_rank}: Sync_copy {data_id} from {source} rank: {received_len} of {data_len} bytes"
+            )
         self.logger.debug(
-            f"Rank {communication.MPIState.get_instance().global_rank}: Sync_copy {data_id} from {owner_rank} rank. Put data from {first_index} to {last_index}. Service index: {service_index}"
+            f"Rank {mpi_state.global_rank}: Sync_copy {data_id} from {owner_rank} rank. Put data from {first_index} to {last_index}. Service index: {service_index}"
+        )
+        # The current host can serve the data to other hosts from now on
+        h_list = communication.isend_simple_operation(
+            comm,
+            common.Operation.REGISTER_SHARED_DATA_REPLICA,
+            {"id": data_id, "monitor": own_monitor},
+            owner_monitor,
         )
+        AsyncOperations.get_instance().extend(h_list)
 
     @classmethod
     def get_instance(cls):
@@ -581,7 +933,7 @@ class SharedObjectStore:
         bool
             True ot False.
         """
-        return self.shared_buffer is not None
+        return self.service_win is not None
 
     def should_be_shared(self, data):
         """
@@ -648,7 +1000,7 @@ class SharedObjectStore:
         # we must to set service_index in args because this function is called from monitor which can not known the shared_info
         if not self._check_service_info(data_id, service_index):
             return 0
-        return self.service_shared_buffer[service_index + self.REFERENCES_NUMBER]
+        return max(self._fetch_and_op_ref_number(service_index, 0, MPI.NO_OP), 0)
 
     def get_shared_buffer(self, first_index, last_index):
         """
@@ -661,11 +1013,91 @@ class SharedObjectStore:
         last_index : int
             End of the requested range. (excluding)
 
+        Returns
+        -------
+        memoryview
+
         Notes
         -----
-        This function is used to synchronize shared memory between different hosts.
+        The segment containing the range is mapped on the first access.
+        """
+        segment_number, offset = divmod(first_index, self.shared_memory_size)
+        segment = self._segments.get(segment_number, None)
+        if segment is None:
+            with self._segments_lock:
+                if segment_number not in self._segments:
+                    self._map_segment(segment_number)
+                segment = self._segments[segment_number]
+        return segment[1][offset : offset + last_index - first_index]
+
+    def grow(self, memory_len):
         """
-        return self.shared_buffer[first_index:last_index]
+        Create a new segment of shared memory.
+
+        Parameters
+        ----------
+        memory_len : int
+            The length of data the segment must fit.
+
+        Returns
+        -------
+        tuple
+            The first and the last indexes of the segment in shared memory
+            or ``(None, None)`` if the shared memory cannot grow.
+
+        Notes
+        -----
+        This function should be called by the monitor. A new segment is as large as all of the previous ones
+        so that the shared memory grows twice up to `MpiSharedObjectStoreMemory`. The segment is shrunk
+        to the length of data if there is not enough free memory on the host.
+        """
+        mapped_size = sum(len(view) for _, view in self._segments.values())
+        segment_size = min(
+            max(memory_len, mapped_size or self.segment_size),
+            self.shared_memory_size - mapped_size,
+        )
+        if segment_size < memory_len:
+            return None, None
+        segment_number = len(self._segments)
+        path = self._get_segment_path(segment_number)
+        free_size = shutil.disk_usage(os.path.dirname(path)).free
+        if free_size < segment_size:
+            if free_size < memory_len:
+                return None, None
+            segment_size = memory_len
+        self._map_segment(segment_number, segment_size)
+        first_index = segment_number * self.shared_memory_size
+        self.logger.debug(
+            f"Rank {communication.MPIState.get_instance().global_rank}: Create segment {segment_number} of {segment_size} bytes"
+        )
+        return first_index, first_index + segment_size
+
+    def init_service_info(self, last_index):
+        """
+        Initialize the service buffer up to `last_index` if it has not been initialized yet.
+
+        Parameters
+        ----------
+        last_index : int
+            The last index of the service buffer to initialize (excluding).
+
+        Notes
+        -----
+        This function should be called by the monitor before the service slots are reserved.
+        The initialized part of the service buffer grows at least twice not to be initialized
+        on every reservation.
+        """
+        initialized_count = self.service_shared_buffer[self.INITIALIZED_COUNT_INDEX]
+        if last_index <= initialized_count:
+            return
+        new_initialized_count = min(
+            max(last_index, 2 * initialized_count), self.service_info_max_count
+        )
+        # Set -1 to the service buffer because 0 is a valid value and may be recognized by mistake.
+        fill(self.service_shared_buffer[initialized_count:new_initialized_count], -1)
+        self.service_win.Sync()
+        self.service_shared_buffer[self.INITIALIZED_COUNT_INDEX] = new_initialized_count
+        self.service_win.Sync()
 
     def delete_service_info(self, data_id, service_index):
         """
@@ -681,38 +1113,81 @@ class SharedObjectStore:
         -----
         This function should be called by the monitor during the cleanup of shared data.
         """
-        with WinLock(self.service_win):
-            # Read actual value
-            old_worker_id = self.service_shared_buffer[
-                service_index + self.WORKER_ID_INDEX
-            ]
-            old_data_id = self.service_shared_buffer[
-                service_index + self.DATA_NUMBER_INDEX
-            ]
-            old_first_index = self.service_shared_buffer[
-                service_index + self.FIRST_DATA_INDEX
-            ]
-            old_references_number = self.service_shared_buffer[
-                service_index + self.REFERENCES_NUMBER
-            ]
+        self.service_win.Sync()
+        # Read actual value
+        old_worker_id = self.service_shared_buffer[service_index + self.WORKER_ID_INDEX]
+        old_data_id = self.service_shared_buffer[service_index + self.DATA_NUMBER_INDEX]
+        old_first_index = self.service_shared_buffer[
+            service_index + self.FIRST_DATA_INDEX
+        ]
+        old_references_number = self._fetch_and_op_ref_number(
+            service_index, 0, MPI.NO_OP
+        )
 
-            # check if data_id is correct
-            if self._parse_data_id(data_id) == (old_worker_id, old_data_id):
-                self.service_shared_buffer[service_index + self.WORKER_ID_INDEX] = -1
-                self.service_shared_buffer[service_index + self.DATA_NUMBER_INDEX] = -1
-                self.service_shared_buffer[service_index + self.FIRST_DATA_INDEX] = -1
-                self.service_shared_buffer[service_index + self.REFERENCES_NUMBER] = -1
-                self.logger.debug(
-                    f"Rank {communication.MPIState.get_instance().global_rank}: Clear {data_id}. Service index: {service_index} First index: {old_first_index} References number: {old_references_number}"
-                )
-            else:
-                self.logger.debug(
-                    f"Rank {communication.MPIState.get_instance().global_rank}: Did not clear {data_id}, because there are was written another data_id: Data_ID(rank_{old_worker_id}_id_{old_data_id})"
-                )
-                self.logger.debug(
-                    f"Service index: {service_index} First index: {old_first_index} References number: {old_references_number}"
-                )
-                raise RuntimeError("Unexpected data_id for cleanup shared memory")
+        # check if data_id is correct
+        if self._parse_data_id(data_id) == (old_worker_id, old_data_id):
+            self._retire_service_info(service_index, force=True)
+            self.logger.debug(
+                f"Rank {communication.MPIState.get_instance().global_rank}: Clear {data_id}. Service index: {service_index} First index: {old_first_index} References number: {old_references_number}"
+            )
+        else:
+            self.logger.debug(
+                f"Rank {communication.MPIState.get_instance().global_rank}: Did not clear {data_id}, because there are was written another data_id: Data_ID(rank_{old_worker_id}_id_{old_data_id})"
+            )
+            self.logger.debug(
+                f"Service index: {service_index} First index: {old_first_index} References number: {old_references_number}"
+            )
+            raise RuntimeError("Unexpected data_id for cleanup shared memory")
+
+    def delete_unreferenced_service_info(self, data_id, service_index):
+        """
+        Delete service information for the current data Id if no process references the data.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+        service_index : int
+            The service buffer index.
+
+        Returns
+        -------
+        bool
+            ``True`` if the service information has been deleted, otherwise ``False``.
+
+        Notes
+        -----
+        This function should be called by the monitor before spilling the data to disk.
+        Data that is still being written to shared memory is not deleted.
+        """
+        self.service_win.Sync()
+        if not self._check_service_info(data_id, service_index):
+            return False
+        # The data is retired only if it has no references
+        if not self._retire_service_info(service_index):
+            return False
+        self.logger.debug(
+            f"Rank {communication.MPIState.get_instance().global_rank}: Clear unreferenced {data_id}. Service index: {service_index}"
+        )
+        return True
+
+    def restore_service_info(self, data_id, service_index, first_index):
+        """
+        Set service information about data restored from disk.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+        service_index : int
+            The service buffer index.
+        first_index : int
+            The first index of data in the shared buffer.
+
+        Notes
+        -----
+        This function should be called by the monitor after the data is written back to shared memory.
+        The number of references is set to 0 because the monitor does not use the data.
+        """
+        self._write_service_info(service_index, data_id, first_index, 0)
 
     def put(self, data_id, serialized_data):
         """
@@ -730,16 +1205,44 @@ class SharedObjectStore:
             [len(buf) for buf in serialized_data["raw_buffers"]]
         )
         # reserve shared memory
-        reservation_data = communication.send_reserve_operation(
-            mpi_state.global_comm, data_id, data_size
-        )
+        is_dedup = MpiSharedObjectStoreDedup.get()
+        # Identical data can be found only by the monitor
+        is_leased = not is_dedup and MpiSharedMemoryLeaseSize.get() > 0
+        if is_leased:
+            reservation_data = self._reserve_from_lease(data_size)
+        else:
+            reservation_data = communication.send_reserve_operation(
+                mpi_state.global_comm,
+                data_id,
+                data_size,
+                content_key=self._get_content_key(serialized_data)
+                if is_dedup
+                else None,
+            )
+            if reservation_data["is_alias"] and not self._is_same_content(
+                reservation_data, serialized_data
+            ):
+                # Data with the same content key differs, so the data gets memory of its own
+                reservation_data = communication.send_reserve_operation(
+                    mpi_state.global_comm, data_id, data_size, is_alias_rejected=True
+                )
         service_index = reservation_data["service_index"]
         first_index = reservation_data["first_index"]
 
-        # write into shared buffer
-        shared_info = self._write_to_shared_buffer(
-            data_id, reservation_data, serialized_data
-        )
+        if not is_leased and reservation_data["is_alias"]:
+            # The same data is already in shared memory
+            shared_info = common.MetadataPackage.get_shared_info(
+                data_id,
+                len(serialized_data["s_data"]),
+                [len(buf) for buf in serialized_data["raw_buffers"]],
+                serialized_data["buffer_count"],
+                service_index,
+            )
+        else:
+            # write into shared buffer
+            shared_info = self._write_to_shared_buffer(
+                data_id, reservation_data, serialized_data
+            )
 
         # put service info
         self._put_service_info(service_index, data_id, first_index)
@@ -747,6 +1250,18 @@ class SharedObjectStore:
         # put shared info
         self._put_shared_info(data_id, shared_info)
 
+        if is_leased:
+            # The monitor must know the data placed into the slab to clean it up
+            # and to send it to other hosts. The registration is sent to the monitor
+            # before the data ID is sent anywhere, so the messages arrive in order.
+            h_list = communication.isend_simple_operation(
+                mpi_state.global_comm,
+                common.Operation.PLACE_SHARED_DATA,
+                {"id": data_id, **reservation_data},
+                mpi_state.get_monitor_by_worker_rank(),
+            )
+            AsyncOperations.get_instance().extend(h_list)
+
     def get(self, data_id, owner_rank=None, shared_info=None):
         """
         Get data from another worker using shared memory.
@@ -772,40 +1287,47 @@ class SharedObjectStore:
             service_index = shared_info["service_index"]
             buffer_count = shared_info["buffer_count"]
 
-            # check data in shared memory
-            if not self._check_service_info(data_id, service_index):
-                # reserve shared memory
-                shared_data_len = s_data_len + sum([buf for buf in raw_buffers_len])
-                reservation_info = communication.send_reserve_operation(
-                    mpi_state.global_comm, data_id, shared_data_len
-                )
+            while True:
+                # check data in shared memory
+                if not self._check_service_info(data_id, service_index):
+                    # reserve shared memory
+                    shared_data_len = s_data_len + sum([buf for buf in raw_buffers_len])
+                    reservation_info = communication.send_reserve_operation(
+                        mpi_state.global_comm, data_id, shared_data_len
+                    )
 
-                service_index = reservation_info["service_index"]
-                # check if worker should sync shared buffer or it is doing by another worker
-                if reservation_info["is_first_request"]:
-                    # syncronize shared buffer
-                    if owner_rank is None:
-                        raise ValueError(
-                            "The data is not in the host's shared memory and the data must be synchronized, "
-                            + "but the owner rank is not defined."
+                    service_index = reservation_info["service_index"]
+                    # check if worker should sync shared buffer or it is doing by another worker
+                    if reservation_info["is_first_request"]:
+                        # syncronize shared buffer
+                        if owner_rank is None:
+                            raise ValueError(
+                                "The data is not in the host's shared memory and the data must be synchronized, "
+                                + "but the owner rank is not defined."
+                            )
+
+                        self._sync_shared_memory_from_another_host(
+                            mpi_state.global_comm,
+                            data_id,
+                            owner_rank,
+                            reservation_info["first_index"],
+                            reservation_info["last_index"],
+                            service_index,
+                        )
+                        # put service info
+                        self._put_service_info(
+                            service_index, data_id, reservation_info["first_index"]
+                        )
+                    else:
+                        # wait while another worker syncronize shared buffer
+                        communication.AdaptivePoller.get_instance().wait(
+                            lambda: self._check_service_info(data_id, service_index)
                         )
 
-                    self._sync_shared_memory_from_another_host(
-                        mpi_state.global_comm,
-                        data_id,
-                        owner_rank,
-                        reservation_info["first_index"],
-                        reservation_info["last_index"],
-                        service_index,
-                    )
-                    # put service info
-                    self._put_service_info(
-                        service_index, data_id, reservation_info["first_index"]
-                    )
-                else:
-                    # wait while another worker syncronize shared buffer
-                    while not self._check_service_info(data_id, service_index):
-                        time.sleep(MpiBackoff.get())
+                # increment ref. The monitor may have spilled the data to disk
+                # if it had no references so the data is requested once again.
+                if self._increment_ref_number(data_id, service_index):
+                    break
 
             # put shared info with updated data_id and service_index
             shared_info = common.MetadataPackage.get_shared_info(
@@ -813,9 +1335,6 @@ class SharedObjectStore:
             )
             self._put_shared_info(data_id, shared_info)
 
-            # increment ref
-            self._increment_ref_number(data_id, shared_info["service_index"])
-
         # read from shared buffer and deserialized
         return self._read_from_shared_buffer(data_id, shared_info)
 
@@ -827,10 +1346,22 @@ class SharedObjectStore:
         -----
         Shared store should be finalized before MPI.Finalize().
         """
-        if self.win is not None:
-            self.win.Free()
-            self.win = None
+        mpi_state = communication.MPIState.get_instance()
+        for segment_number, (segment, view) in self._segments.items():
+            # Data deserialized from shared memory may still refer to the segment
+            try:
+                view.release()
+                segment.close()
+            except BufferError:
+                pass
+            if mpi_state.is_monitor_process():
+                try:
+                    os.remove(self._get_segment_path(segment_number))
+                except FileNotFoundError:
+                    pass
+        self._segments = {}
         if self.service_win is not None:
+            self.service_win.Unlock_all()
             self.service_win.Free()
             self.service_win = None
         for f in self.finalizers:
@@ -101,6 +101,26 @@ async def worker_loop():
     # ``Monitor` sends the shutdown signal to every worker so they can exit the loop.
     ready_to_shutdown_posted = False
     while True:
+        # When work stealing is enabled, runnable tasks are queued and executed
+        # only if there are no incoming operations so that idle workers can steal them.
+        if (
+            task_store.is_work_stealing_enabled
+            and not ready_to_shutdown_posted
+            and not communication.mpi_iprobe_operation(mpi_state.global_comm)
+        ):
+            task_store.process_steal_requests()
+            if task_store.has_ready_tasks():
+                # In threaded execution mode the next task is started
+                # once there is a free task slot
+                if task_store.is_executor_available():
+                    task_store.execute_ready_task()
+                    async_operations.check()
+                    # Let the started coroutines proceed
+                    await asyncio.sleep(0)
+                    continue
+            elif task_store.is_executor_available():
+                task_store.steal_tasks()
+
         # Listen receive operation from any source
         operation_type, source_rank = await async_wrap(
             communication.mpi_recv_operation
@@ -114,12 +134,16 @@ async def worker_loop():
             request = pull_data(mpi_state.global_comm, source_rank)
             if not ready_to_shutdown_posted:
                 # Execute the task if possible
-                pending_request = task_store.process_task_request(request)
+                pending_request = task_store.process_task_request(
+                    request, is_stealable=True
+                )
                 if pending_request:
                     task_store.put(pending_request)
-                else:
-                    # Check pending requests. Maybe some data became available.
-                    task_store.check_pending_tasks()
+
+        elif operation_type == common.Operation.EXECUTE_BATCH:
+            request = pull_data(mpi_state.global_comm, source_rank)
+            if not ready_to_shutdown_posted:
+                task_store.process_task_batch_request(request)
 
         elif operation_type == common.Operation.GET:
             request = communication.mpi_recv_object(mpi_state.global_comm, source_rank)
@@ -139,15 +163,19 @@ async def worker_loop():
 
                 # Discard data request to another worker, if data has become available
                 request_store.discard_data_request(request["id"])
+                # Check pending get requests. The data might be requested by another process.
+                request_store.check_pending_get_requests(request["id"])
 
-                # Check pending requests. Maybe some data became available.
-                task_store.check_pending_tasks()
-                # Check pending actor requests also.
-                task_store.check_pending_actor_tasks()
+                # Check pending requests waiting for the data.
+                task_store.check_pending_tasks(request["id"])
 
         elif operation_type == common.Operation.PUT_OWNER:
             request = communication.mpi_recv_object(mpi_state.global_comm, source_rank)
-            if not ready_to_shutdown_posted:
+            # The owner can be already known if the task producing the data was stolen.
+            # The local information is more accurate then, so we do not overwrite it.
+            if not ready_to_shutdown_posted and not local_store.contains_data_owner(
+                request["id"]
+            ):
                 local_store.put_data_owner(request["id"], request["owner"])
 
                 w_logger.debug(
@@ -161,11 +189,11 @@ async def worker_loop():
 
             # Clear cached request to another worker, if data_id became available
             request_store.discard_data_request(result["id"])
+            # Check pending get requests. The data might be requested by another process.
+            request_store.check_pending_get_requests(result["id"])
 
-            # Check pending requests. Maybe some data became available.
-            task_store.check_pending_tasks()
-            # Check pending actor requests also.
-            task_store.check_pending_actor_tasks()
+            # Check pending requests waiting for the data.
+            task_store.check_pending_tasks(result["id"])
 
         elif operation_type == common.Operation.WAIT:
             request = communication.mpi_recv_object(mpi_state.global_comm, source_rank)
@@ -196,14 +224,23 @@ async def worker_loop():
                 pending_actor_request = task_store.process_task_request(request)
                 if pending_actor_request:
                     task_store.put_actor(pending_actor_request)
-                else:
-                    # Check pending requests. Maybe some data became available.
-                    task_store.check_pending_actor_tasks()
+
+        elif operation_type == common.Operation.STEAL_TASKS:
+            if not ready_to_shutdown_posted:
+                # The request is processed once there are no incoming operations
+                # so that the idle worker gets as many tasks as possible.
+                task_store.put_steal_request(source_rank)
+
+        elif operation_type == common.Operation.PUT_STOLEN_TASKS:
+            request = pull_data(mpi_state.global_comm, source_rank)
+            if not ready_to_shutdown_posted:
+                task_store.put_stolen_tasks(request["tasks"])
 
         elif operation_type == common.Operation.CLEANUP:
             cleanup_list = communication.recv_serialized_data(
                 mpi_state.global_comm, source_rank
             )
+            task_store.forward_cleanup_request(cleanup_list)
             cleanup_list = [common.MpiDataID(*tpl) for tpl in cleanup_list]
             local_store.clear(cleanup_list)
 
@@ -221,6 +258,14 @@ async def worker_loop():
             ready_to_shutdown_posted = True
         elif operation_type == common.Operation.SHUTDOWN and ready_to_shutdown_posted:
             w_logger.debug("Exit worker event loop")
+            w_logger.debug(
+                "Polling stats: {}".format(
+                    communication.AdaptivePoller.get_instance().get_stats()
+                )
+            )
+            w_logger.debug("Spill stats: {}".format(local_store.get_spill_stats()))
+            local_store.finalize()
+            communication.MessageCoalescer.get_instance().close(mpi_state.global_comm)
             SharedObjectStore.get_instance().finalize()
             if not MPI.Is_finalized():
                 MPI.Finalize()
@@ -7,7 +7,9 @@ from collections import defaultdict
 import unidist.core.backends.mpi.core.common as common
 import unidist.core.backends.mpi.core.communication as communication
 from unidist.core.backends.mpi.core.controller.common import push_data
+from unidist.core.backends.mpi.core.async_operations import AsyncOperations
 from unidist.core.backends.mpi.core.object_store import ObjectStore
+from unidist.core.backends.mpi.core.local_object_store import LocalObjectStore
 
 
 mpi_state = communication.MPIState.get_instance()
@@ -111,6 +113,59 @@ class RequestStore:
         """
         return data_id in self._data_requests
 
+    def request_data(self, dest_rank, data_id):
+        """
+        Send GET operation with data request to destination worker.
+
+        Parameters
+        ----------
+        dest_rank : int
+            Rank number to request data from.
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            `data_id` associated data to request.
+
+        Notes
+        -----
+        Request is asynchronous, no wait for the data.
+        """
+        logger.debug("Request {} id from {} worker rank".format(data_id._id, dest_rank))
+
+        operation_type = common.Operation.GET
+        operation_data = {
+            "source": communication.MPIState.get_instance().global_rank,
+            "id": data_id,
+            "is_blocking_op": False,
+        }
+        async_operations = AsyncOperations.get_instance()
+        h_list = communication.isend_simple_operation(
+            communication.MPIState.get_instance().global_comm,
+            operation_type,
+            operation_data,
+            dest_rank,
+        )
+        async_operations.extend(h_list)
+
+        # Save request in order to prevent massive communication during pending task checks
+        self.put(data_id, dest_rank, self.DATA)
+
+    def has_get_requests(self, data_id):
+        """
+        Check if there are pending `GET` requests for particular `data_id`.
+
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+
+        Returns
+        -------
+        bool
+        """
+        return (
+            data_id in self._nonblocking_get_requests
+            or data_id in self._blocking_get_requests
+        )
+
     def discard_data_request(self, data_id):
         """
         Discard data request by `data_id` because the data has become available.
@@ -141,9 +196,17 @@ class RequestStore:
         ----------
         data_id : iterable or unidist.core.backends.mpi.core.common.MpiDataID
             An ID or list of IDs to data.
+
+        Notes
+        -----
+        The requests for data IDs which are not available yet are kept pending
+        (e.g., the task producing the data is still running).
         """
+        object_store = ObjectStore.get_instance()
 
         def check_request(data_id):
+            if not object_store.contains(data_id):
+                return
             # Check non-blocking data requests for one of the workers
             if data_id in self._nonblocking_get_requests:
                 ranks_with_get_request = self._nonblocking_get_requests[data_id]
@@ -176,10 +239,18 @@ class RequestStore:
         ----------
         data_id : iterable or unidist.core.backends.mpi.core.common.MpiDataID
             An ID or list of IDs to data.
+
+        Notes
+        -----
+        The requests for data IDs which are not available yet are kept pending
+        (e.g., the task producing the data is still running).
         """
+        object_store = ObjectStore.get_instance()
         if isinstance(data_ids, (list, tuple)):
             for data_id in data_ids:
-                if data_id in self._blocking_wait_requests:
+                if data_id in self._blocking_wait_requests and object_store.contains(
+                    data_id
+                ):
                     # Data is already in DataMap, so not problem here.
                     # We use a blocking send here because the receiver is waiting for the result.
                     communication.mpi_send_object(
@@ -189,7 +260,9 @@ class RequestStore:
                     )
                     del self._blocking_wait_requests[data_id]
         else:
-            if data_ids in self._blocking_wait_requests:
+            if data_ids in self._blocking_wait_requests and object_store.contains(
+                data_ids
+            ):
                 # We use a blocking send here because the receiver is waiting for the result.
                 communication.mpi_send_object(
                     communication.MPIState.get_instance().global_comm,
@@ -265,4 +338,13 @@ class RequestStore:
             logger.debug(
                 "Pending request {} id to {} rank".format(data_id._id, source_rank)
             )
+            # The data can be re-homed to another worker (e.g., the task producing it
+            # was stolen), so we request the data from the new owner to satisfy the request.
+            local_store = LocalObjectStore.get_instance()
+            if local_store.contains_data_owner(
+                data_id
+            ) and not self.is_data_already_requested(data_id):
+                owner_rank = local_store.get_data_owner(data_id)
+                if owner_rank != communication.MPIState.get_instance().global_rank:
+                    self.request_data(owner_rank, data_id)
             self.put(data_id, source_rank, self.GET, is_blocking_op=is_blocking_op)
@@ -3,10 +3,13 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 import functools
 import inspect
 import time
 
+from unidist.config import MpiWorkStealing, MpiThreadedExecution, MpiTaskSlots
 from unidist.core.backends.common.data_id import is_data_id
 import unidist.core.backends.mpi.core.common as common
 import unidist.core.backends.mpi.core.communication as communication
@@ -14,7 +17,7 @@ from unidist.core.backends.mpi.core.async_operations import AsyncOperations
 from unidist.core.backends.mpi.core.object_store import ObjectStore
 from unidist.core.backends.mpi.core.local_object_store import LocalObjectStore
 from unidist.core.backends.mpi.core.shared_object_store import SharedObjectStore
-from unidist.core.backends.mpi.core.serialization import serialize_complex_data
+from unidist.core.backends.mpi.core.serialization import SimpleDataSerializer
 from unidist.core.backends.mpi.core.worker.request_store import RequestStore
 
 mpi_state = communication.MPIState.get_instance()
@@ -32,14 +35,62 @@ class TaskStore:
     __instance = None
 
     def __init__(self):
-        # Incomplete tasks list - arguments not ready yet
-        self._pending_tasks_list = []
-        # Incomplete actor tasks list - arguments not ready yet
-        self._pending_actor_tasks_list = []
+        # Incomplete tasks waiting for data - arguments not ready yet
+        # {DataID : [pending request, ...]}
+        self._pending_tasks_by_data_id = defaultdict(list)
+        # Incomplete actor tasks waiting for data - arguments not ready yet
+        # {DataID : [pending request, ...]}
+        self._pending_actor_tasks_by_data_id = defaultdict(list)
+        # The number of incomplete tasks
+        self._pending_tasks_count = 0
+        # Data IDs which pending tasks should be checked for
+        self._available_data_ids = deque()
+        # Whether the pending tasks are being checked at the moment
+        self._is_checking_pending_tasks = False
         # Event loop for executing coroutines
         self.event_loop = asyncio.get_event_loop()
         # Started async tasks
         self.background_tasks = set()
+        # Exponential moving average of task durations reported to the monitor
+        self._task_duration = None
+        # Smoothing factor of the moving average
+        self._task_duration_alpha = 0.3
+        # Work stealing settings
+        self.is_work_stealing_enabled = MpiWorkStealing.get()
+        # Runnable tasks queue - arguments are ready, the tasks can be stolen by idle workers
+        self._ready_tasks_queue = deque()
+        # Ranks of idle workers requesting tasks to steal
+        self._steal_requests = []
+        # Workers to steal tasks from, host-local workers go first
+        self._steal_victims = None
+        # Number of unsuccessful steal attempts since the worker ran out of tasks
+        self._steal_attempts = 0
+        # Whether a steal request is waiting for the response
+        self._is_steal_request_posted = False
+        # Workers the outputs of stolen tasks were given to {(owner_rank, data_number): rank}
+        self._stolen_output_ranks = {}
+        # Threaded execution settings
+        # The number of tasks that can run at the same time
+        self.task_slots = MpiTaskSlots.get()
+        self.is_threaded_execution_enabled = (
+            MpiThreadedExecution.get() or self.task_slots > 1
+        )
+        # Executor running synchronous tasks so that the event loop keeps processing operations
+        self._executor = (
+            ThreadPoolExecutor(
+                max_workers=self.task_slots, thread_name_prefix="unidist_task"
+            )
+            if self.is_threaded_execution_enabled
+            else None
+        )
+        # Executor running actor methods one at a time as they share the actor state
+        self._actor_executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="unidist_actor_task")
+            if self.is_threaded_execution_enabled
+            else None
+        )
+        # The number of tasks submitted to the executor and not complete yet
+        self._executor_tasks_count = 0
 
     @classmethod
     def get_instance(cls):
@@ -54,6 +105,22 @@ class TaskStore:
             cls.__instance = TaskStore()
         return cls.__instance
 
+    def _put_pending_request(self, pending_requests, request):
+        """
+        Index a pending request by the data IDs it is waiting for.
+
+        Parameters
+        ----------
+        pending_requests : defaultdict
+            Index of pending requests {DataID : [pending request, ...]}.
+        request : dict
+            Task execution request returned by ``process_task_request``.
+        """
+        missing_data_ids = request.pop("missing_data_ids")
+        pending_request = {"request": request, "missing_count": len(missing_data_ids)}
+        for data_id in missing_data_ids:
+            pending_requests[data_id].append(pending_request)
+
     def put(self, request):
         """
         Save task execution request for later processing.
@@ -65,7 +132,8 @@ class TaskStore:
         request : dict
             Task execution request with arguments.
         """
-        self._pending_tasks_list.append(request)
+        self._put_pending_request(self._pending_tasks_by_data_id, request)
+        self._pending_tasks_count += 1
 
     def put_actor(self, request):
         """
@@ -78,55 +146,331 @@ class TaskStore:
         request : dict
             Actor task execution request with arguments.
         """
-        self._pending_actor_tasks_list.append(request)
+        self._put_pending_request(self._pending_actor_tasks_by_data_id, request)
 
-    def check_pending_tasks(self):
+    def check_pending_tasks(self, data_ids):
         """
-        Check a list of pending task execution requests and process all ready tasks.
+        Process pending task and actor task execution requests waiting for `data_ids`.
 
         Task is ready if all data dependencies are resolved.
+
+        Parameters
+        ----------
+        data_ids : iterable or unidist.core.backends.mpi.core.common.MpiDataID
+            An ID or list of IDs to data that has become available.
+
+        Notes
+        -----
+        Only the requests depending on `data_ids` are checked. Data IDs that become available
+        while the ready tasks are executed are queued so that a long chain of dependent tasks
+        is processed iteratively.
+        """
+        if data_ids is None:
+            return
+        if isinstance(data_ids, (list, tuple)):
+            self._available_data_ids.extend(data_ids)
+        else:
+            self._available_data_ids.append(data_ids)
+        if self._is_checking_pending_tasks:
+            return
+
+        self._is_checking_pending_tasks = True
+        try:
+            while self._available_data_ids:
+                data_id = self._available_data_ids.popleft()
+                if data_id in self._pending_tasks_by_data_id:
+                    w_logger.debug("Check pending tasks for {} id".format(data_id._id))
+                    for pending_request in self._pending_tasks_by_data_id.pop(data_id):
+                        pending_request["missing_count"] -= 1
+                        if pending_request["missing_count"] == 0:
+                            self._pending_tasks_count -= 1
+                            request = self.process_task_request(
+                                pending_request["request"], is_stealable=True
+                            )
+                            if request:
+                                self.put(request)
+                if data_id in self._pending_actor_tasks_by_data_id:
+                    w_logger.debug(
+                        "Check pending actor tasks for {} id".format(data_id._id)
+                    )
+                    for pending_request in self._pending_actor_tasks_by_data_id.pop(
+                        data_id
+                    ):
+                        pending_request["missing_count"] -= 1
+                        if pending_request["missing_count"] == 0:
+                            request = self.process_task_request(
+                                pending_request["request"]
+                            )
+                            if request:
+                                self.put_actor(request)
+        finally:
+            self._is_checking_pending_tasks = False
+
+    def is_data_awaited(self, data_id):
         """
-        w_logger.debug("Check pending tasks")
+        Check if there are pending task or actor task requests waiting for `data_id`.
 
-        if self._pending_tasks_list:
-            updated_list = []
-            for request in self._pending_tasks_list:
-                pending_request = self.process_task_request(request)
-                if pending_request:
-                    updated_list.append(pending_request)
-            self._pending_tasks_list = updated_list
+        Parameters
+        ----------
+        data_id : unidist.core.backends.mpi.core.common.MpiDataID
+            An ID to data.
+
+        Returns
+        -------
+        bool
+        """
+        return (
+            data_id in self._pending_tasks_by_data_id
+            or data_id in self._pending_actor_tasks_by_data_id
+        )
 
     def clear_pending_tasks(self):
         """
-        Clear a list of pending task execution requests.
+        Clear pending task execution requests.
         """
         w_logger.debug("Clear pending tasks")
 
-        self._pending_tasks_list.clear()
+        self._pending_tasks_by_data_id.clear()
+        self._pending_tasks_count = 0
+        self._available_data_ids.clear()
+        self._ready_tasks_queue.clear()
+        self._steal_requests.clear()
 
-    def check_pending_actor_tasks(self):
+    def clear_pending_actor_tasks(self):
         """
-        Check a list of pending actor task execution requests and process all ready tasks.
+        Clear pending actor task execution requests.
+        """
+        w_logger.debug("Clear pending actor tasks")
 
-        Task is ready if all data dependencies are resolved.
+        self._pending_actor_tasks_by_data_id.clear()
+
+    def has_ready_tasks(self):
         """
-        w_logger.debug("Check pending actor tasks")
+        Check if there are runnable tasks waiting for execution.
 
-        if self._pending_actor_tasks_list:
-            updated_list = []
-            for request in self._pending_actor_tasks_list:
-                pending_request = self.process_task_request(request)
-                if pending_request:
-                    updated_list.append(pending_request)
-            self._pending_actor_tasks_list = updated_list
+        Returns
+        -------
+        bool
+        """
+        return len(self._ready_tasks_queue) > 0
 
-    def clear_pending_actor_tasks(self):
+    def is_executor_available(self):
         """
-        Clear a list of pending actor task execution requests.
+        Check if a runnable task can be started right now.
+
+        Returns
+        -------
+        bool
+
+        Notes
+        -----
+        In threaded execution mode a task is started once there is a free task slot,
+        otherwise, the tasks are executed inline.
         """
-        w_logger.debug("Clear pending actor tasks")
+        return self._executor_tasks_count < self.task_slots
+
+    def execute_ready_task(self):
+        """
+        Execute the oldest runnable task from the queue.
+        """
+        request = self._ready_tasks_queue.popleft()
+        self._execute_task_request(
+            request["output"], request["task"], request["args"], request["kwargs"]
+        )
+
+    def _get_steal_victims(self):
+        """
+        Get the workers to steal tasks from.
+
+        Returns
+        -------
+        list
+            Worker ranks, host-local workers go first.
 
-        self._pending_actor_tasks_list.clear()
+        Notes
+        -----
+        Every worker starts from its neighbour so that idle workers do not
+        send their steal requests to the same victim.
+        """
+        if self._steal_victims is None:
+            global_rank = mpi_state.global_rank
+            host = mpi_state.host_by_rank[global_rank]
+            local_workers = [
+                rank
+                for rank in mpi_state.workers
+                if mpi_state.host_by_rank[rank] == host
+            ]
+            remote_workers = [
+                rank
+                for rank in mpi_state.workers
+                if mpi_state.host_by_rank[rank] != host
+            ]
+            idx = local_workers.index(global_rank)
+            local_workers = local_workers[idx + 1 :] + local_workers[:idx]
+            shift = global_rank % len(remote_workers) if remote_workers else 0
+            remote_workers = remote_workers[shift:] + remote_workers[:shift]
+            self._steal_victims = local_workers + remote_workers
+        return self._steal_victims
+
+    def steal_tasks(self):
+        """
+        Request runnable tasks from another worker.
+
+        The request is sent only if there is no posted steal request yet
+        and not all of the workers have refused to share their tasks
+        since the current worker ran out of tasks.
+
+        Notes
+        -----
+        Request is asynchronous, no wait for the tasks.
+        """
+        steal_victims = self._get_steal_victims()
+        if self._is_steal_request_posted or self._steal_attempts >= len(steal_victims):
+            return
+        victim_rank = steal_victims[self._steal_attempts]
+        w_logger.debug("Steal tasks from {} worker rank".format(victim_rank))
+        async_operations = AsyncOperations.get_instance()
+        h = communication.mpi_isend_operation(
+            mpi_state.global_comm,
+            common.Operation.STEAL_TASKS,
+            victim_rank,
+        )
+        async_operations.extend([(h, common.Operation.STEAL_TASKS)])
+        self._steal_attempts += 1
+        self._is_steal_request_posted = True
+
+    def _put_output_owner(self, output_ids, rank):
+        """
+        Save the owner of task outputs to the local object store.
+
+        Parameters
+        ----------
+        output_ids : list or unidist.core.backends.mpi.core.common.MpiDataID or None
+            Output data IDs of a task.
+        rank : int
+            Rank of the worker executing the task.
+        """
+        if output_ids is None:
+            return
+        if not isinstance(output_ids, (list, tuple)):
+            output_ids = [output_ids]
+        local_store = LocalObjectStore.get_instance()
+        request_store = RequestStore.get_instance()
+        for output_id in output_ids:
+            local_store.put_data_owner(output_id, rank)
+            # Requests and tasks for the outputs that are already waiting on the current worker
+            # will be satisfied once the data is received from the new owner
+            if rank != mpi_state.global_rank and (
+                request_store.has_get_requests(output_id)
+                or self.is_data_awaited(output_id)
+            ):
+                request_store.request_data(rank, output_id)
+
+    def put_steal_request(self, rank):
+        """
+        Save steal request from an idle worker for later processing.
+
+        Parameters
+        ----------
+        rank : int
+            Rank of the idle worker.
+        """
+        self._steal_requests.append(rank)
+
+    def process_steal_requests(self):
+        """
+        Send a half of the runnable tasks to every idle worker requested them.
+
+        Notes
+        -----
+        The most recently received tasks are given away, and the ownership of their outputs
+        is re-homed to the idle worker so that data requests to the current worker
+        can be forwarded to the new owner.
+        """
+        async_operations = AsyncOperations.get_instance()
+        for rank in self._steal_requests:
+            stolen_tasks = [
+                self._ready_tasks_queue.pop()
+                for _ in range(len(self._ready_tasks_queue) // 2)
+            ]
+            stolen_tasks.reverse()
+            for request in stolen_tasks:
+                self._put_output_owner(request["output"], rank)
+                output_ids = request["output"]
+                if not isinstance(output_ids, (list, tuple)):
+                    output_ids = [output_ids]
+                for output_id in output_ids:
+                    self._stolen_output_ranks[
+                        (output_id.owner_rank, output_id.data_number)
+                    ] = rank
+            w_logger.debug(
+                "Give {} tasks to {} worker rank".format(len(stolen_tasks), rank)
+            )
+            h_list, _ = communication.isend_complex_operation(
+                mpi_state.global_comm,
+                common.Operation.PUT_STOLEN_TASKS,
+                {"tasks": stolen_tasks},
+                rank,
+                is_serialized=False,
+            )
+            async_operations.extend(h_list)
+        self._steal_requests.clear()
+
+    def put_stolen_tasks(self, tasks):
+        """
+        Save runnable tasks stolen from another worker for execution.
+
+        Parameters
+        ----------
+        tasks : list
+            Task execution requests with materialized arguments.
+        """
+        self._is_steal_request_posted = False
+        if tasks:
+            for request in tasks:
+                self._put_output_owner(request["output"], mpi_state.global_rank)
+            self._ready_tasks_queue.extend(tasks)
+            self._steal_attempts = 0
+
+    def forward_cleanup_request(self, cleanup_list):
+        """
+        Send data IDs to be deleted to the workers the tasks producing them were stolen by.
+
+        Parameters
+        ----------
+        cleanup_list : list
+            List of tuples of the owner rank and data number describing ``MpiDataID``-s.
+
+        Notes
+        -----
+        The owner of the data IDs only knows the rank the task was originally submitted to.
+        """
+        if not self._stolen_output_ranks:
+            return
+        is_shared_store_allocated = SharedObjectStore.get_instance().is_allocated()
+        # {rank: [(owner_rank, data_number), ...]}
+        cleanup_lists = defaultdict(list)
+        for data_id in cleanup_list:
+            rank = self._stolen_output_ranks.pop(data_id, None)
+            if rank is None:
+                continue
+            cleanup_lists[rank].append(data_id)
+            monitor_rank = mpi_state.get_monitor_by_worker_rank(rank)
+            if (
+                is_shared_store_allocated
+                and monitor_rank != mpi_state.get_monitor_by_worker_rank()
+            ):
+                cleanup_lists[monitor_rank].append(data_id)
+
+        async_operations = AsyncOperations.get_instance()
+        for rank, data_ids in cleanup_lists.items():
+            h_list = communication.isend_serialized_operation(
+                mpi_state.global_comm,
+                common.Operation.CLEANUP,
+                SimpleDataSerializer().serialize_pickle(data_ids),
+                rank,
+            )
+            async_operations.extend(h_list)
 
     def request_worker_data(self, dest_rank, data_id):
         """
@@ -143,27 +487,7 @@ class TaskStore:
         -----
         Request is asynchronous, no wait for the data.
         """
-        w_logger.debug(
-            "Request {} id from {} worker rank".format(data_id._id, dest_rank)
-        )
-
-        operation_type = common.Operation.GET
-        operation_data = {
-            "source": communication.MPIState.get_instance().global_rank,
-            "id": data_id,
-            "is_blocking_op": False,
-        }
-        async_operations = AsyncOperations.get_instance()
-        h_list = communication.isend_simple_operation(
-            communication.MPIState.get_instance().global_comm,
-            operation_type,
-            operation_data,
-            dest_rank,
-        )
-        async_operations.extend(h_list)
-
-        # Save request in order to prevent massive communication during pending task checks
-        RequestStore.get_instance().put(data_id, dest_rank, RequestStore.DATA)
+        RequestStore.get_instance().request_data(dest_rank, data_id)
 
     def unwrap_local_data_id(self, arg):
         """
@@ -205,7 +529,48 @@ class TaskStore:
         else:
             return arg, False
 
-    def execute_received_task(self, output_data_ids, task, args, kwargs):
+    def notify_task_done(self, completed_data_ids, task_duration, running_tasks=0):
+        """
+        Notify the monitor of the host that a task is complete.
+
+        Along with the completed data IDs the worker reports its current load
+        so that the scheduler can take it into account.
+
+        Parameters
+        ----------
+        completed_data_ids : list
+            Data IDs of the task outputs.
+        task_duration : float
+            Duration of the task in seconds.
+        running_tasks : int, default: 0
+            The number of tasks (coroutines) that are still running on the worker.
+        """
+        if self._task_duration is None:
+            self._task_duration = task_duration
+        else:
+            self._task_duration += self._task_duration_alpha * (
+                task_duration - self._task_duration
+            )
+        operation_data = {
+            "output_ids": completed_data_ids,
+            "queue_depth": self._pending_tasks_count + running_tasks,
+            "task_duration": self._task_duration,
+        }
+        # Monitor the task execution.
+        # The notification is sent in a non-blocking way so that it can be coalesced
+        # with other small messages to the monitor. The monitor of a host other
+        # than the root one forwards the notifications to the root monitor in batches.
+        h_list = communication.isend_simple_operation(
+            communication.MPIState.get_instance().global_comm,
+            common.Operation.TASK_DONE,
+            operation_data,
+            mpi_state.get_monitor_by_worker_rank(),
+        )
+        AsyncOperations.get_instance().extend(h_list)
+
+    def execute_received_task(
+        self, output_data_ids, task, args, kwargs, is_actor_task=False
+    ):
         """
         Execute a task/actor-task and handle results.
 
@@ -219,20 +584,25 @@ class TaskStore:
             Positional arguments to be passed in the `task`.
         kwargs : dict
             Keyword arguments to be passed in the `task`.
+        is_actor_task : bool, default: False
+            Whether the `task` is an actor method or not.
+            Actor methods do not occupy task slots and are run one at a time.
 
         Notes
         -----
         Exceptions are stored in output data IDs as value.
         """
         local_store = LocalObjectStore.get_instance()
-        shared_store = SharedObjectStore.get_instance()
         completed_data_ids = []
-        # Note that if a task is coroutine,
-        # the local store or the shared store will contain output data
+        is_coroutine = inspect.iscoroutinefunction(task)
+        # Note that if a task is coroutine or runs on the executor thread,
+        # the local store will contain output data
         # only once the task is complete.
-        if inspect.iscoroutinefunction(task):
+        if is_coroutine or self.is_threaded_execution_enabled:
 
             async def execute():
+                task_start = time.perf_counter()
+                completed_data_ids = []
                 try:
                     w_logger.debug("- Start task execution -")
 
@@ -247,7 +617,18 @@ class TaskStore:
 
                     # Execute user task
                     f_to_execute = functools.partial(task, *args, **kwargs)
-                    output_values = await f_to_execute()
+                    if is_coroutine:
+                        output_values = await f_to_execute()
+                    else:
+                        # The event loop keeps processing operations while the task is running
+                        output_values = (
+                            await asyncio.get_running_loop().run_in_executor(
+                                self._actor_executor
+                                if is_actor_task
+                                else self._executor,
+                                f_to_execute,
+                            )
+                        )
 
                     w_logger.info(
                         "Task evaluation time: {}".format(time.perf_counter() - start)
@@ -263,57 +644,42 @@ class TaskStore:
                     ):
                         for output_id in output_data_ids:
                             local_store.put(output_id, e)
-                    else:
+                        completed_data_ids = list(output_data_ids)
+                    elif output_data_ids is not None:
                         local_store.put(output_data_ids, e)
+                        completed_data_ids = [output_data_ids]
                 else:
                     if output_data_ids is not None:
+                        # The outputs are serialized only once they are requested by another process
                         if (
                             isinstance(output_data_ids, (list, tuple))
                             and len(output_data_ids) > 1
                         ):
-                            completed_data_ids = [None] * len(output_data_ids)
-                            for idx, (output_id, value) in enumerate(
-                                zip(output_data_ids, output_values)
-                            ):
-                                serialized_data = serialize_complex_data(value)
+                            for output_id, value in zip(output_data_ids, output_values):
                                 local_store.put(output_id, value)
-                                if (
-                                    shared_store.is_allocated()
-                                    and shared_store.should_be_shared(serialized_data)
-                                ):
-                                    shared_store.put(output_id, serialized_data)
-                                else:
-                                    local_store.cache_serialized_data(
-                                        output_id, serialized_data
-                                    )
-                                completed_data_ids[idx] = output_id
+                            completed_data_ids = list(output_data_ids)
                         else:
-                            serialized_data = serialize_complex_data(output_values)
                             local_store.put(output_data_ids, output_values)
-                            if (
-                                shared_store.is_allocated()
-                                and shared_store.should_be_shared(serialized_data)
-                            ):
-                                shared_store.put(output_data_ids, serialized_data)
-                            else:
-                                local_store.cache_serialized_data(
-                                    output_data_ids, serialized_data
-                                )
                             completed_data_ids = [output_data_ids]
 
-                RequestStore.get_instance().check_pending_get_requests(output_data_ids)
-                # Monitor the task execution
-                # We use a blocking send here because we have to wait for
-                # completion of the communication, which is necessary for the pipeline to continue.
-                root_monitor = mpi_state.get_monitor_by_worker_rank(
-                    communication.MPIRank.ROOT
-                )
-                communication.send_simple_operation(
-                    communication.MPIState.get_instance().global_comm,
-                    common.Operation.TASK_DONE,
+                request_store = RequestStore.get_instance()
+                request_store.check_pending_get_requests(output_data_ids)
+                request_store.check_pending_wait_requests(output_data_ids)
+                self.check_pending_tasks(output_data_ids)
+                # The current task is still in the set of background tasks
+                self.notify_task_done(
                     completed_data_ids,
-                    root_monitor,
+                    time.perf_counter() - task_start,
+                    running_tasks=len(self.background_tasks) - 1,
                 )
+                if not is_coroutine and not is_actor_task:
+                    self._executor_tasks_count -= 1
+                    # Start the next runnable task as the loop might be waiting for an operation
+                    if self.has_ready_tasks() and self.is_executor_available():
+                        self.execute_ready_task()
+
+            if not is_coroutine and not is_actor_task:
+                self._executor_tasks_count += 1
 
             async_task = asyncio.create_task(execute())
             # Add task to the set. This creates a strong reference.
@@ -323,6 +689,7 @@ class TaskStore:
             # completion.
             async_task.add_done_callback(self.background_tasks.discard)
         else:
+            task_start = time.perf_counter()
             try:
                 w_logger.debug("- Start task execution -")
 
@@ -352,58 +719,32 @@ class TaskStore:
                 ):
                     for output_id in output_data_ids:
                         local_store.put(output_id, e)
-                else:
+                    completed_data_ids = list(output_data_ids)
+                elif output_data_ids is not None:
                     local_store.put(output_data_ids, e)
+                    completed_data_ids = [output_data_ids]
             else:
                 if output_data_ids is not None:
+                    # The outputs are serialized only once they are requested by another process
                     if (
                         isinstance(output_data_ids, (list, tuple))
                         and len(output_data_ids) > 1
                     ):
-                        completed_data_ids = [None] * len(output_data_ids)
-                        for idx, (output_id, value) in enumerate(
-                            zip(output_data_ids, output_values)
-                        ):
-                            serialized_data = serialize_complex_data(value)
+                        for output_id, value in zip(output_data_ids, output_values):
                             local_store.put(output_id, value)
-                            if (
-                                shared_store.is_allocated()
-                                and shared_store.should_be_shared(serialized_data)
-                            ):
-                                shared_store.put(output_id, serialized_data)
-                            else:
-                                local_store.cache_serialized_data(
-                                    output_id, serialized_data
-                                )
-                            completed_data_ids[idx] = output_id
+                        completed_data_ids = list(output_data_ids)
                     else:
-                        serialized_data = serialize_complex_data(output_values)
                         local_store.put(output_data_ids, output_values)
-                        if (
-                            shared_store.is_allocated()
-                            and shared_store.should_be_shared(serialized_data)
-                        ):
-                            shared_store.put(output_data_ids, serialized_data)
-                        else:
-                            local_store.cache_serialized_data(
-                                output_data_ids, serialized_data
-                            )
                         completed_data_ids = [output_data_ids]
             RequestStore.get_instance().check_pending_get_requests(output_data_ids)
-            # Monitor the task execution.
-            # We use a blocking send here because we have to wait for
-            # completion of the communication, which is necessary for the pipeline to continue.
-            root_monitor = mpi_state.get_monitor_by_worker_rank(
-                communication.MPIRank.ROOT
-            )
-            communication.send_simple_operation(
-                communication.MPIState.get_instance().global_comm,
-                common.Operation.TASK_DONE,
+            self.check_pending_tasks(output_data_ids)
+            self.notify_task_done(
                 completed_data_ids,
-                root_monitor,
+                time.perf_counter() - task_start,
+                running_tasks=len(self.background_tasks),
             )
 
-    def process_task_request(self, request):
+    def process_task_request(self, request, is_stealable=False):
         """
         Parse request data and execute the task if possible.
 
@@ -413,11 +754,16 @@ class TaskStore:
         ----------
         request : dict
             Task related data (args, function, output).
+        is_stealable : bool, default: False
+            Whether the task can be executed by another worker or not.
+            If ``True`` and work stealing is enabled, the runnable task is put
+            into the queue of ready tasks instead of immediate execution.
 
         Returns
         -------
         dict or None
-            Same request if the task couldn`t be executed, otherwise ``None``.
+            Same request along with the data IDs it is waiting for
+            if the task couldn`t be executed, otherwise ``None``.
         """
         object_store = ObjectStore.get_instance()
         # Parse request
@@ -439,10 +785,19 @@ class TaskStore:
             "REMOTE outputs: {}".format(common.unwrapped_data_ids_list(output_ids))
         )
 
+        # Data IDs the task is waiting for
+        missing_data_ids = set()
+
+        def unwrap_local_data_id(arg):
+            value, is_pending = self.unwrap_local_data_id(arg)
+            if is_pending:
+                missing_data_ids.add(value)
+            return value, is_pending
+
         # DataID -> real data
-        args, is_pending = common.materialize_data_ids(args, self.unwrap_local_data_id)
+        args, is_pending = common.materialize_data_ids(args, unwrap_local_data_id)
         kwargs, is_kw_pending = common.materialize_data_ids(
-            kwargs, self.unwrap_local_data_id
+            kwargs, unwrap_local_data_id
         )
 
         w_logger.debug("Is pending - {}".format(is_pending))
@@ -450,13 +805,74 @@ class TaskStore:
         if is_pending or is_kw_pending:
             request["args"] = args
             request["kwargs"] = kwargs
+            request["missing_data_ids"] = missing_data_ids
             return request
+        elif is_stealable and self.is_work_stealing_enabled:
+            self._ready_tasks_queue.append(
+                {"task": task, "args": args, "kwargs": kwargs, "output": output_ids}
+            )
+            # New work has arrived so the worker can steal again once it runs out of tasks
+            self._steal_attempts = 0
+            return None
         else:
-            self.execute_received_task(output_ids, task, args, kwargs)
-            if output_ids is not None:
-                RequestStore.get_instance().check_pending_get_requests(output_ids)
-                RequestStore.get_instance().check_pending_wait_requests(output_ids)
+            self._execute_task_request(
+                output_ids, task, args, kwargs, is_actor_task="handler" in request
+            )
             return None
 
+    def process_task_batch_request(self, request):
+        """
+        Parse a batch of task requests and execute the tasks if possible.
+
+        Tasks which data dependencies are not resolved yet are saved for later processing.
+
+        Parameters
+        ----------
+        request : dict
+            Function and a list of task related data (args, output).
+        """
+        task = request["task"]
+        for task_request in request["requests"]:
+            pending_request = self.process_task_request(
+                {
+                    "task": task,
+                    "args": task_request["args"],
+                    "kwargs": {},
+                    "output": task_request["output"],
+                },
+                is_stealable=True,
+            )
+            if pending_request:
+                self.put(pending_request)
+
+    def _execute_task_request(
+        self, output_ids, task, args, kwargs, is_actor_task=False
+    ):
+        """
+        Execute the task and process the requests waiting for its outputs.
+
+        Parameters
+        ----------
+        output_ids : list or unidist.core.backends.mpi.core.common.MpiDataID or None
+            A list of output data IDs or a single output data ID to store the result.
+        task : callable
+            Function to be executed.
+        args : iterable
+            Positional arguments to be passed in the `task`.
+        kwargs : dict
+            Keyword arguments to be passed in the `task`.
+        is_actor_task : bool, default: False
+            Whether the `task` is an actor method or not.
+        """
+        self.execute_received_task(
+            output_ids, task, args, kwargs, is_actor_task=is_actor_task
+        )
+        if output_ids is not None:
+            RequestStore.get_instance().check_pending_get_requests(output_ids)
+            RequestStore.get_instance().check_pending_wait_requests(output_ids)
+
     def __del__(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._actor_executor.shutdown(wait=False)
         self.event_loop.close()
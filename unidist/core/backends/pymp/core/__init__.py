@@ -5,6 +5,15 @@
 """Python Multiprocessing backend core functionality."""
 
 from .actor import Actor
-from .api import put, wait, get, submit, init, is_initialized
+from .api import put, wait, get, submit, submit_many, init, is_initialized
 
-__all__ = ["Actor", "put", "wait", "get", "submit", "init", "is_initialized"]
+__all__ = [
+    "Actor",
+    "put",
+    "wait",
+    "get",
+    "submit",
+    "submit_many",
+    "init",
+    "is_initialized",
+]
@@ -147,3 +147,52 @@ def submit(func, *args, num_returns=1, **kwargs):
     ProcessManager.get_instance().submit(pkl.dumps(task))
 
     return data_ids
+
+
+def submit_many(func, args_list, num_returns=1):
+    """
+    Execute function in worker processes for every set of positional arguments.
+
+    Parameters
+    ----------
+    func : callable
+        Function to be executed in the workers.
+    args_list : list
+        A list of lists with positional arguments to be passed in the `func`.
+    num_returns : int, default: 1
+        Number of results to be returned from every `func` call.
+
+    Returns
+    -------
+    list
+        A list of returns, one per call. Type of returns depends on `num_returns` value:
+
+        * if `num_returns == 1`, ``DataID`` will be returned.
+        * if `num_returns > 1`, list of ``DataID``-s will be returned.
+        * if `num_returns == 0`, ``None`` will be returned.
+
+    Notes
+    -----
+    The tasks are split into one batch per worker and every batch is
+    serialized and sent to a worker in a single message.
+    """
+    obj_store = ObjectStore.get_instance()
+    process_manager = ProcessManager.get_instance()
+
+    data_ids_list = []
+    tasks = []
+    for args in args_list:
+        if num_returns == 0:
+            data_ids = None
+        elif num_returns > 1:
+            data_ids = [obj_store.put(Delayed()) for _ in range(num_returns)]
+        else:
+            data_ids = obj_store.put(Delayed())
+        data_ids_list.append(data_ids)
+        tasks.append(Task(func, data_ids, obj_store, *args))
+
+    num_batches = min(len(process_manager.workers), len(tasks))
+    for idx in range(num_batches):
+        process_manager.submit(pkl.dumps(tasks[idx::num_batches]))
+
+    return data_ids_list
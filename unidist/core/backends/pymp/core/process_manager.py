@@ -38,26 +38,43 @@ class Worker(Process):
             task = self.task_queue.get()
             task = pkl.loads(task)
 
-            data_ids = task.data_ids
             try:
-                value = task()
-            except Exception as e:
-                if isinstance(data_ids, list) and len(data_ids) > 1:
-                    for i, data_id in enumerate(data_ids):
-                        self._obj_store.store_delayed[data_id] = e
+                # A batch of tasks is sent as a list in a single message
+                if isinstance(task, list):
+                    for t in task:
+                        self._execute(t)
                 else:
-                    self._obj_store.store_delayed[data_ids] = e
-            else:
-                if data_ids is not None:
-                    if isinstance(data_ids, list) and len(data_ids) > 1:
-                        for data_id, val in zip(data_ids, value):
-                            self._obj_store.store_delayed[data_id] = val
-                    else:
-                        self._obj_store.store_delayed[data_ids] = value
+                    self._execute(task)
             finally:
                 self.task_queue.task_done()
         return
 
+    def _execute(self, task):
+        """
+        Execute `task` and save its results into the object storage.
+
+        Parameters
+        ----------
+        task : unidist.core.backends.pymp.core.process_manager.Task
+            Task to be executed.
+        """
+        data_ids = task.data_ids
+        try:
+            value = task()
+        except Exception as e:
+            if isinstance(data_ids, list) and len(data_ids) > 1:
+                for i, data_id in enumerate(data_ids):
+                    self._obj_store.store_delayed[data_id] = e
+            else:
+                self._obj_store.store_delayed[data_ids] = e
+        else:
+            if data_ids is not None:
+                if isinstance(data_ids, list) and len(data_ids) > 1:
+                    for data_id, val in zip(data_ids, value):
+                        self._obj_store.store_delayed[data_id] = val
+                else:
+                    self._obj_store.store_delayed[data_ids] = value
+
     def add_task(self, task):
         """
         Add `task` to `self.task_queue`.
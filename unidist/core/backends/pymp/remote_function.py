@@ -79,3 +79,49 @@ class PyMpRemoteFunction(RemoteFunction):
             return [ObjectRef(data_id) for data_id in data_ids]
         elif num_returns == 0:
             return None
+
+    def _remote_batch(self, args_list, num_cpus=None, num_returns=None, resources=None):
+        """
+        Execute `self._remote_function` in worker processes for every set of positional arguments.
+
+        Parameters
+        ----------
+        args_list : list
+            A list of lists with positional arguments to be passed in the `self._remote_function`.
+        num_cpus : int, optional
+            The number of CPUs to reserve for the remote function.
+        num_returns : int, optional
+            The number of ``ObjectRef``-s returned by the remote function invocation.
+        resources : dict, optional
+            Custom resources to reserve for the remote function.
+
+        Returns
+        -------
+        list
+            A list of ``ObjectRef``-s, lists or ``None``-s, one per call.
+        """
+        if num_cpus is not None or self._num_cpus is not None:
+            raise NotImplementedError(
+                "'num_cpus' is not supported yet by Python Multiprocessing backend."
+            )
+        if resources is not None or self._resources is not None:
+            raise NotImplementedError(
+                "'resources' is not supported yet by Python Multiprocessing backend."
+            )
+
+        if num_returns is None:
+            num_returns = self._num_returns
+
+        data_ids_list = mp.submit_many(
+            self._remote_function, args_list, num_returns=num_returns
+        )
+
+        if num_returns == 1:
+            return [ObjectRef(data_ids) for data_ids in data_ids_list]
+        elif num_returns > 1:
+            return [
+                [ObjectRef(data_id) for data_id in data_ids]
+                for data_ids in data_ids_list
+            ]
+        elif num_returns == 0:
+            return [None] * len(data_ids_list)
@@ -61,6 +61,59 @@ class RemoteFunction:
         """
         return self._remote_function_cls._remote(*args, **kwargs)
 
+    def map(self, args_list):
+        """
+        Call a remote function in worker processes for every set of positional arguments.
+
+        Parameters
+        ----------
+        args_list : iterable
+            An iterable of tuples with positional arguments to be passed in the remote function.
+
+        Returns
+        -------
+        list
+            A list of ``ObjectRef``-s, lists or ``None``-s, one per call.
+
+        Notes
+        -----
+        Submitting the calls at once lets a backend reduce the per-call overhead.
+        """
+        args_list = [filter_arguments(*args)[0] for args in args_list]
+        return self._remote_function_cls._remote_batch(args_list)
+
+    def _remote_batch(self, args_list, num_cpus=None, num_returns=None, resources=None):
+        """
+        Execute the remote function for every set of positional arguments.
+
+        Parameters
+        ----------
+        args_list : list
+            A list of lists with positional arguments to be passed in the remote function.
+        num_cpus : int, optional
+            The number of CPUs to reserve for the remote function.
+        num_returns : int, optional
+            The number of ``ObjectRef``-s returned by the remote function invocation.
+        resources : dict, optional
+            Custom resources to reserve for the remote function.
+
+        Returns
+        -------
+        list
+            A list of ``ObjectRef``-s, lists or ``None``-s, one per call.
+
+        Notes
+        -----
+        The method submits the calls one by one.
+        Backends capable of batch submission override the method.
+        """
+        return [
+            self._remote(
+                *args, num_cpus=num_cpus, num_returns=num_returns, resources=resources
+            )
+            for args in args_list
+        ]
+
     def options(self, *args, num_cpus=None, num_returns=None, resources=None, **kwargs):
         """
         Override the remote function invocation parameters.
@@ -81,7 +134,7 @@ class RemoteFunction:
         Returns
         -------
         FuncWrapper
-            An instance of wrapped function that a non-underscore .remote() can be called on.
+            An instance of wrapped function that a non-underscore .remote() or .map() can be called on.
         """
         remote_function_cls = self._remote_function_cls
 
@@ -97,4 +150,14 @@ class RemoteFunction:
                     **kwargs,
                 )
 
+            def map(self, args_list):
+                args_list = [filter_arguments(*args)[0] for args in args_list]
+
+                return remote_function_cls._remote_batch(
+                    args_list,
+                    num_cpus=num_cpus,
+                    num_returns=num_returns,
+                    resources=resources,
+                )
+
         return FuncWrapper()
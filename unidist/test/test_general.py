@@ -64,6 +64,25 @@ def test_wait():
     assert_equal(len(not_ready), 0)
 
 
+@pytest.mark.skipif(
+    Backend.get() == BackendName.PYMP,
+    reason="Run of a remote task inside of another one is not implemented yet for pymp",
+)
+def test_wait_inside_remote():
+    @unidist.remote
+    def foo():
+        object_refs = [task.remote(i) for i in range(3)]
+        ready, not_ready = unidist.wait(object_refs, num_returns=3)
+        return len(ready)
+
+    # The task waits for its subtasks while the driver waits for the task
+    object_ref = foo.remote()
+    ready, not_ready = unidist.wait([object_ref], num_returns=1)
+    assert_equal(len(ready), 1)
+    assert_equal(len(not_ready), 0)
+    assert_equal(object_ref, 3)
+
+
 def test_get_ip():
     import socket
 
@@ -85,3 +104,83 @@ def test_cluster_resources():
     assert_equal(
         unidist.cluster_resources(), {unidist.get_ip(): {"CPU": unidist.num_cpus()}}
     )
+
+
+@pytest.mark.skipif(
+    Backend.get() != BackendName.MPI,
+    reason="The test checks the object storage of MPI workers",
+)
+def test_cleanup_under_sustained_load():
+    @unidist.remote
+    def foo(x):
+        time.sleep(0.01)
+        return [1] * 1000
+
+    @unidist.remote
+    def stored_data_count():
+        from unidist.core.backends.mpi.core.local_object_store import (
+            LocalObjectStore,
+        )
+
+        return len(LocalObjectStore.get_instance()._data_id_map)
+
+    # Keep tasks in flight all the time so that the cluster never gets idle
+    object_refs = [foo.remote(i) for i in range(2 * CpuCount.get())]
+    submitted_count = len(object_refs)
+    start = time.time()
+    while time.time() - start < 5:
+        ready, object_refs = unidist.wait(object_refs, num_returns=1)
+        object_refs.append(foo.remote(ready[0]))
+        submitted_count += 1
+
+    stored_count = sum(
+        unidist.get([stored_data_count.remote() for _ in range(CpuCount.get())])
+    )
+    # Without cleanup every worker would keep all of the outputs it has produced or received
+    assert stored_count < submitted_count
+
+
+@pytest.mark.skipif(
+    Backend.get() != BackendName.MPI,
+    reason="The test checks the object storage of MPI workers",
+)
+def test_local_object_store_spilling():
+    @unidist.remote
+    def spill_and_restore():
+        from unittest import mock
+        import numpy as np
+
+        from unidist.config import MpiLocalObjectStoreMemory
+        from unidist.core.backends.mpi.core.common import MpiDataID
+        from unidist.core.backends.mpi.core.local_object_store import (
+            LocalObjectStore,
+        )
+
+        local_store = LocalObjectStore()
+        arrays = [np.full(2**20, i, dtype=np.uint8) for i in range(3)]
+        data_ids = [MpiDataID(-1, i) for i in range(len(arrays))]
+        with mock.patch.object(
+            MpiLocalObjectStoreMemory, "get", return_value=3 * 2**20 - 1
+        ):
+            for data_id, array in zip(data_ids, arrays):
+                local_store.put(data_id, array)
+            # The least recently used array does not fit into the budget
+            spilled = [data_id not in local_store._data_map for data_id in data_ids]
+            restored = local_store.get(data_ids[0])
+            respilled = [data_id not in local_store._data_map for data_id in data_ids]
+        stats = local_store.get_spill_stats()
+        local_store.finalize()
+        return (
+            spilled,
+            respilled,
+            bool(np.array_equal(restored, arrays[0])),
+            stats["spilled_bytes"] >= 2 * 2**20,
+            stats["restored_bytes"] >= 2**20,
+        )
+
+    spilled, respilled, is_equal, is_spilled, is_restored = unidist.get(
+        spill_and_restore.remote()
+    )
+    assert_equal(spilled, [True, False, False])
+    assert_equal(respilled, [False, True, False])
+    assert is_equal and is_spilled and is_restored
@@ -64,6 +64,17 @@ def test_delayed_object_ref():
     assert_equal(object_ref1, 49)
 
 
+def test_map():
+    object_ref = unidist.put(6)
+    object_refs = task.map([(i,) for i in range(8)] + [(object_ref,)])
+    assert_equal(object_refs, [i * i for i in range(8)] + [36])
+
+
+def test_map_num_returns_options():
+    object_refs = task_multiple_returns.options(num_returns=2).map([(2,), (3,)])
+    assert_equal([ref for refs in object_refs for ref in refs], [2, 4, 3, 9])
+
+
 def test_num_returns_zero():
     @unidist.remote
     def foo():